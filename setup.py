@@ -9,6 +9,8 @@ setup(
         "selenium>=4.0.0",
         "webdriver-manager>=4.0.0",
         "pyyaml>=6.0.0",
+        "cryptography>=41.0.0",
+        "urllib3>=1.26.0",
     ],
     python_requires=">=3.8",
     author="SEU_NOME",
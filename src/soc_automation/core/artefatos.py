@@ -0,0 +1,205 @@
+"""Captura de artefatos de falha (screenshot, DOM e log recente) por job.
+
+A captura no driver é feita na thread que detectou a falha (o WebDriver não
+é seguro entre threads); a compressão e a gravação ficam em uma thread de
+fundo. O diretório funciona como um anel limitado por quantidade de
+arquivos e bytes: ao exceder um dos limites, os artefatos mais antigos são
+apagados.
+
+Estrutura: ``<diretorio>/<job_id>/<data_hora>_<etapa>.zip``, com
+``screenshot.png``, ``dom.html``, ``log.txt`` e ``info.json``.
+
+Exemplo:
+    artefatos = get_artefatos()
+    artefatos.capturar(driver, job_id="42", etapa="configurado", erro="Modo de edição não confirmado")
+    print(artefatos.listar("42"))
+"""
+import json
+import os
+import re
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .config import get_configuracao
+from .logger import get_logger, linhas_recentes
+
+DIRETORIO_PADRAO = "artefatos"
+MAX_ARQUIVOS_PADRAO = 200
+MAX_MB_PADRAO = 200
+LINHAS_LOG_PADRAO = 200
+
+# Pasta dos artefatos de transferências executadas sem job_id
+JOB_SEM_ID = "sem_job"
+
+
+def _nome_seguro(valor: str) -> str:
+    return re.sub(r"[^\w.-]", "_", valor)[:80] or "_"
+
+
+class ArmazemArtefatos:
+    """Grava artefatos de falha em segundo plano, com armazenamento limitado.
+
+    Args:
+        diretorio: Diretório raiz dos artefatos.
+        max_arquivos: Número máximo de artefatos mantidos.
+        max_bytes: Tamanho máximo somado dos artefatos.
+        linhas_log: Linhas de log recentes incluídas em cada artefato.
+    """
+
+    def __init__(self,
+                 diretorio: str = DIRETORIO_PADRAO,
+                 max_arquivos: int = MAX_ARQUIVOS_PADRAO,
+                 max_bytes: int = MAX_MB_PADRAO * 1024 * 1024,
+                 linhas_log: int = LINHAS_LOG_PADRAO) -> None:
+        self.diretorio = os.path.abspath(diretorio)
+        self.max_arquivos = max_arquivos
+        self.max_bytes = max_bytes
+        self.linhas_log = linhas_log
+        self.logger = get_logger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="soc-artefatos")
+
+    def capturar(self,
+                 driver,
+                 job_id: Optional[str],
+                 etapa: str,
+                 erro: Optional[str] = None,
+                 **dados: Any) -> Optional[Future]:
+        """Coleta os artefatos do driver e agenda a gravação.
+
+        Nunca lança exceção: falhas na captura são apenas registradas no log.
+
+        Args:
+            driver: WebDriver no estado da falha
+            job_id: Job em execução (None agrupa em ``sem_job``)
+            etapa: Etapa em que a falha ocorreu
+            erro: Descrição da falha
+            **dados: Informações extras gravadas em info.json
+
+        Returns:
+            Optional[Future]: Gravação agendada (resultado: caminho do .zip)
+        """
+        info: Dict[str, Any] = dict(dados, job_id=job_id, etapa=etapa, erro=erro,
+                                    capturado_em=datetime.now().isoformat(timespec="milliseconds"))
+        screenshot = dom = None
+        try:
+            screenshot = driver.get_screenshot_as_png()
+        except Exception as e:
+            info["erro_screenshot"] = str(e)
+        try:
+            dom = driver.page_source
+            info["url"] = driver.current_url
+        except Exception as e:
+            info["erro_dom"] = str(e)
+        log = "\n".join(linhas_recentes(self.linhas_log))
+
+        try:
+            return self._executor.submit(self._gravar, job_id or JOB_SEM_ID, etapa, info, screenshot, dom, log)
+        except RuntimeError:
+            # Armazém já encerrado (fim do processo)
+            return None
+
+    def _gravar(self, job_id: str, etapa: str, info: Dict[str, Any],
+                screenshot: Optional[bytes], dom: Optional[str], log: str) -> Optional[str]:
+        try:
+            pasta = os.path.join(self.diretorio, _nome_seguro(job_id))
+            os.makedirs(pasta, exist_ok=True)
+            nome = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{_nome_seguro(etapa)}.zip"
+            caminho = os.path.join(pasta, nome)
+            temporario = f"{caminho}.tmp"
+
+            with zipfile.ZipFile(temporario, "w", compression=zipfile.ZIP_DEFLATED) as arquivo:
+                arquivo.writestr("info.json", json.dumps(info, ensure_ascii=False, indent=2))
+                arquivo.writestr("log.txt", log)
+                if dom is not None:
+                    arquivo.writestr("dom.html", dom)
+                if screenshot is not None:
+                    # PNG já é comprimido
+                    arquivo.writestr("screenshot.png", screenshot, compress_type=zipfile.ZIP_STORED)
+            os.replace(temporario, caminho)
+
+            self._aplicar_limites()
+            self.logger.info(f"Artefatos da falha salvos em {caminho}")
+            return caminho
+        except Exception as e:
+            self.logger.warning(f"Erro ao gravar artefatos da falha: {str(e)}")
+            return None
+
+    def _arquivos(self) -> List[os.DirEntry]:
+        arquivos = []
+        if not os.path.isdir(self.diretorio):
+            return arquivos
+        for pasta in os.scandir(self.diretorio):
+            if pasta.is_dir():
+                arquivos.extend(e for e in os.scandir(pasta.path) if e.name.endswith(".zip"))
+        return arquivos
+
+    def _aplicar_limites(self) -> None:
+        """Apaga os artefatos mais antigos até respeitar os limites de quantidade e bytes."""
+        arquivos = []
+        for entrada in self._arquivos():
+            try:
+                estado = entrada.stat()
+            except FileNotFoundError:
+                continue
+            arquivos.append((estado.st_mtime, estado.st_size, entrada.path))
+        arquivos.sort()
+
+        total_bytes = sum(tamanho for _, tamanho, _ in arquivos)
+        quantidade = len(arquivos)
+        for _, tamanho, caminho in arquivos:
+            if quantidade <= self.max_arquivos and total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(caminho)
+            except FileNotFoundError:
+                # Já removido por outro processo do lote
+                pass
+            quantidade -= 1
+            total_bytes -= tamanho
+            try:
+                os.rmdir(os.path.dirname(caminho))
+            except OSError:
+                pass
+
+    def listar(self, job_id: Optional[str] = None) -> Dict[str, List[str]]:
+        """Índice dos artefatos por job_id (mais antigos primeiro).
+
+        Args:
+            job_id: Restringe a um job (None lista todos)
+        """
+        indice: Dict[str, List[str]] = {}
+        for entrada in sorted(self._arquivos(), key=lambda e: e.name):
+            job = os.path.basename(os.path.dirname(entrada.path))
+            if job_id is None or job == _nome_seguro(job_id):
+                indice.setdefault(job, []).append(entrada.path)
+        return indice
+
+    def aguardar(self) -> None:
+        """Aguarda a gravação dos artefatos já agendados."""
+        self._executor.submit(lambda: None).result()
+
+    def fechar(self) -> None:
+        """Grava os artefatos pendentes e encerra a thread de fundo."""
+        self._executor.shutdown(wait=True)
+
+
+_armazem: Optional[ArmazemArtefatos] = None
+_armazem_lock = threading.Lock()
+
+
+def get_artefatos() -> ArmazemArtefatos:
+    """Obtém o armazém de artefatos do processo, configurado pela seção ``artefatos`` do config.yaml."""
+    global _armazem
+    with _armazem_lock:
+        if _armazem is None:
+            config = get_configuracao().artefatos
+            _armazem = ArmazemArtefatos(
+                diretorio=config.directory,
+                max_arquivos=config.max_arquivos,
+                max_bytes=int(config.max_mb * 1024 * 1024),
+                linhas_log=config.linhas_log,
+            )
+        return _armazem
@@ -0,0 +1,179 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from selenium.common.exceptions import TimeoutException
+
+from .browser import Browser
+from .config import get_configuracao
+from .logger import get_logger
+from .session_store import SessionStore
+from ..utils.wait_utils import EXCECOES_IGNORADAS, Condicao
+
+T = TypeVar("T")
+
+
+class AsyncBrowser:
+    """Fachada asyncio para ``Browser`` e ``FuncionarioOperations``.
+
+    Todo acesso ao WebDriver roda em um executor dedicado de uma única
+    thread, de modo que o event loop nunca bloqueia e um mesmo loop pode
+    conduzir vários navegadores em paralelo (um ``AsyncBrowser`` por sessão).
+
+    Em cancelamento ou timeout, a sessão do navegador é encerrada a partir de
+    outra thread, o que interrompe o comando que estiver em execução no
+    executor. O próximo ``login`` inicia um navegador novo.
+
+    Exemplo:
+        async with AsyncBrowser(headless=True) as browser:
+            await browser.login("usuario", "senha", "id", timeout=60)
+            await browser.transferir("846.872.660-59", tipo_busca="cpf",
+                                     empresa_destino="2498", timeout=120)
+    """
+
+    def __init__(self,
+                 headless: Optional[bool] = None,
+                 session_store: Optional[SessionStore] = None,
+                 **operacoes_kwargs: Any) -> None:
+        """
+        Args:
+            headless: Se True, executa o navegador em modo headless (padrão: ``browser.headless``)
+            session_store: Cache de sessões usado no login
+            **operacoes_kwargs: Repassados para ``FuncionarioOperations`` (ex: cache, journal)
+        """
+        self.logger = get_logger(__name__)
+        self.browser = Browser(headless=headless, session_store=session_store)
+        self._operacoes_kwargs: Dict[str, Any] = operacoes_kwargs
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="soc-driver")
+        self._lock_encerramento = threading.Lock()
+
+    async def _executar(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Executa uma chamada bloqueante no executor do driver."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _com_limite(self, operacao: Awaitable[T], timeout: Optional[float], descricao: str) -> T:
+        """Aguarda a operação; em cancelamento ou timeout, encerra a sessão do navegador."""
+        try:
+            return await asyncio.wait_for(operacao, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            motivo = "timeout" if isinstance(e, asyncio.TimeoutError) else "cancelamento"
+            self.logger.warning(f"{descricao} interrompido por {motivo}; encerrando sessão do navegador")
+            # O executor do driver está ocupado com o comando interrompido
+            await asyncio.get_running_loop().run_in_executor(None, self._encerrar_sessao)
+            raise
+
+    def _encerrar_sessao(self) -> None:
+        """Encerra o driver; a chamada pendente no executor falha em seguida."""
+        with self._lock_encerramento:
+            try:
+                self.browser.quit()
+            except Exception as e:
+                self.logger.error(f"Erro ao encerrar sessão do navegador: {str(e)}")
+                self.browser.driver = None
+
+    async def start(self) -> None:
+        """Inicia o navegador."""
+        await self._executar(self.browser.start)
+
+    async def login(self,
+                    username: str,
+                    password: str,
+                    company_id: str,
+                    timeout: Optional[float] = None) -> bool:
+        """Realiza login no sistema SOC sem bloquear o event loop.
+
+        Args:
+            username: Nome de usuário
+            password: Senha
+            company_id: ID da empresa
+            timeout: Tempo máximo em segundos (None = sem limite)
+
+        Returns:
+            bool: True se login bem-sucedido
+        """
+        return await self._com_limite(
+            self._executar(self.browser.login, username, password, company_id),
+            timeout,
+            "Login"
+        )
+
+    async def ensure_session(self) -> bool:
+        """Verifica a sessão e refaz o login se necessário (ver ``Browser.ensure_session``)."""
+        return await self._executar(self.browser.ensure_session)
+
+    async def transferir(self, termo_busca: str, timeout: Optional[float] = None, **kwargs: Any) -> bool:
+        """Transfere um funcionário, executando uma etapa por vez no executor do driver.
+
+        O cancelamento é atendido entre etapas e, durante uma etapa, encerra
+        a sessão do navegador.
+
+        Args:
+            termo_busca: Termo para busca do funcionário
+            timeout: Tempo máximo em segundos para a transferência inteira
+            **kwargs: Demais argumentos de ``FuncionarioOperations.transferir``
+
+        Returns:
+            bool: True se transferência concluída com sucesso
+        """
+        return await self._com_limite(self._transferir(termo_busca, **kwargs), timeout, "Transferência")
+
+    async def _transferir(self, termo_busca: str, **kwargs: Any) -> bool:
+        func_ops = await self._executar(self.browser.get_funcionario_operations, **self._operacoes_kwargs)
+        etapas = func_ops.etapas_transferencia(termo_busca, **kwargs)
+
+        try:
+            for etapa, executar in etapas:
+                if not await self._executar(func_ops.executar_etapa, etapa, executar):
+                    return False
+            return True
+        except asyncio.CancelledError:
+            # O registro no journal (com fsync) vai para a fila do executor do driver, sem
+            # bloquear o event loop; roda quando o comando interrompido terminar
+            self._executor.submit(func_ops.abortar_transferencia, "Transferência cancelada",
+                                  recuperar_contexto=False)
+            raise
+        except Exception as e:
+            await self._executar(func_ops.abortar_transferencia, str(e))
+            return False
+
+    async def esperar(self,
+                      condicao: Condicao,
+                      timeout: Optional[float] = None,
+                      intervalo: Optional[float] = None) -> Any:
+        """Versão aguardável de ``wait_utils.esperar``.
+
+        Cada verificação roda no executor do driver; entre verificações o
+        event loop fica livre (``asyncio.sleep``).
+
+        Raises:
+            TimeoutException: Se a condição não for atingida no tempo limite
+        """
+        config = get_configuracao().browser
+        timeout = config.timeout if timeout is None else timeout
+        intervalo = config.intervalo_poll if intervalo is None else intervalo
+        limite = time.monotonic() + timeout
+        while True:
+            try:
+                valor = await self._executar(condicao, self.browser.driver)
+                if valor:
+                    return valor
+            except EXCECOES_IGNORADAS:
+                pass
+            if time.monotonic() >= limite:
+                raise TimeoutException(f"Condição não atingida em {timeout}s")
+            await asyncio.sleep(intervalo)
+
+    async def quit(self) -> None:
+        """Fecha o navegador e libera o executor."""
+        await self._executar(self._encerrar_sessao)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncBrowser":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.quit()
@@ -1,21 +1,45 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 
+from .config import get_configuracao
 from .driver_manager import DriverManager
 from .logger import get_logger
+from .metrics import get_metricas
+from .session_context import get_session_context
+from .session_store import SessionStore
 from ..pages.login_page import LoginPage
 from ..pages.home_page import HomePage
 
 
 class Browser:
-    """Classe principal para gerenciar o navegador."""
+    """Classe principal para gerenciar o navegador.
     
-    def __init__(self, headless: bool = False) -> None:
+    ``headless`` e ``performance_profile`` não informados vêm da seção
+    ``browser`` do config.yaml; a URL do sistema, de ``soc.url``.
+    
+    Navegadores simultâneos na mesma conta e no mesmo ``session_store``
+    devem receber ``session_id`` distintos, para não compartilharem a
+    sessão (e a empresa selecionada) no servidor.
+    """
+    
+    def __init__(self,
+                 headless: Optional[bool] = None,
+                 session_store: Optional[SessionStore] = None,
+                 performance_profile: Optional[bool] = None,
+                 user_data_dir: Optional[str] = None,
+                 session_id: Optional[str] = None) -> None:
         self.logger = get_logger(__name__)
-        self.driver_manager = DriverManager()
+        config = get_configuracao().browser
+        if performance_profile is None:
+            performance_profile = config.performance_profile
+        self.driver_manager = DriverManager(performance_profile=performance_profile, user_data_dir=user_data_dir)
         self.driver: Optional[webdriver.Chrome] = None
-        self.headless = headless
+        self.headless = config.headless if headless is None else headless
+        self.session_store = session_store
+        self.session_id = session_id
+        self._credentials: Optional[Tuple[str, str, str]] = None
     
     def start(self) -> webdriver.Chrome:
         """Inicia o navegador."""
@@ -37,15 +61,19 @@ class Browser:
             self.start()
         
         self.driver.get(url)
+        get_session_context(self.driver).invalidar_navegacao()
         self.logger.info(f"Navegando para: {url}")
     
     def navigate_to_soc(self) -> None:
         """Navega para o sistema SOC."""
-        self.navigate_to("https://sistema.soc.com.br/WebSoc/")
+        self.navigate_to(get_configuracao().soc.url)
     
     def login(self, username: str, password: str, company_id: str) -> bool:
         """Realiza login no sistema SOC.
         
+        Com um ``session_store`` configurado, tenta primeiro restaurar a sessão
+        salva e só faz o login com credenciais se ela tiver expirado.
+        
         Args:
             username: Nome de usuário
             password: Senha
@@ -54,12 +82,123 @@ class Browser:
         Returns:
             bool: True se login bem sucedido, False caso contrário
         """
-        if not self.driver:
-            self.start()
+        with get_metricas().span("login", metodo="credenciais") as span:
+            if not self.driver:
+                self.start()
+            
+            self.navigate_to_soc()
+            login_page = LoginPage(self.driver)
+            get_session_context(self.driver).reset()
+            
+            if self._restore_session(login_page, username, company_id):
+                span.rotulos["metodo"] = "sessao_salva"
+                self._credentials = (username, password, company_id)
+                HomePage(self.driver).sincronizar_empresa()
+                return True
+            
+            success = login_page.login(username, password, company_id)
+            if success:
+                self._credentials = (username, password, company_id)
+                # A sessão já abre em uma empresa; sem isso a primeira troca nunca seria evitada
+                HomePage(self.driver).sincronizar_empresa()
+                if self.session_store:
+                    self.session_store.save(self.driver, username, company_id, self.session_id)
+            else:
+                span.falhou()
+            return success
+    
+    def _restore_session(self, login_page: LoginPage, username: str, company_id: str) -> bool:
+        """Tenta reutilizar a sessão salva em cache."""
+        if not self.session_store:
+            return False
         
+        if not self.session_store.restore(self.driver, username, company_id, self.session_id):
+            return False
+        
+        if login_page.verify_login_success():
+            self.logger.info("Login reaproveitado da sessão em cache")
+            return True
+        
+        self.logger.info("Sessão em cache expirada, realizando login com credenciais")
+        self.session_store.delete(username, company_id, self.session_id)
+        self.driver.delete_all_cookies()
         self.navigate_to_soc()
-        login_page = LoginPage(self.driver)
-        return login_page.login(username, password, company_id)
+        return False
+    
+    def is_session_alive(self) -> bool:
+        """Verifica, com uma única chamada, se a sessão SOC continua ativa.
+        
+        Returns:
+            bool: True se o driver responde e a barra do SOC (#barra) está presente
+        """
+        if not self.driver:
+            return False
+        
+        script = "return !!window.top.document.getElementById('barra');"
+        try:
+            return bool(self.driver.execute_script(script))
+        except WebDriverException:
+            # A janela atual pode ter sido fechada (ex: popup); tenta a primeira janela
+            try:
+                handle = self.driver.window_handles[0]
+                self.driver.switch_to.window(handle)
+                get_session_context(self.driver).registrar_janela(handle)
+                return bool(self.driver.execute_script(script))
+            except (WebDriverException, IndexError):
+                return False
+    
+    def ensure_session(self) -> bool:
+        """Garante uma sessão ativa, refazendo o login se ela expirou.
+        
+        Se o driver não responder mais, o navegador é reiniciado antes do login.
+        
+        Returns:
+            bool: True se a sessão está ativa ao final
+        """
+        if self.is_session_alive():
+            return True
+        
+        if not self._credentials:
+            self.logger.error("Sessão inativa e nenhuma credencial registrada para novo login")
+            return False
+        
+        self.logger.warning("Sessão SOC expirada ou inativa, refazendo login")
+        try:
+            self.driver.current_url
+        except (WebDriverException, AttributeError):
+            self.logger.warning("Driver não responde, reiniciando navegador")
+            try:
+                self.quit()
+            except WebDriverException:
+                self.driver = None
+        
+        return self.login(*self._credentials)
+    
+    def restart(self) -> bool:
+        """Encerra e reinicia o navegador, restaurando a sessão.
+        
+        Com ``session_store``, os cookies atuais são salvos antes de encerrar,
+        de modo que a restauração normalmente dispensa novo login.
+        
+        Returns:
+            bool: True se a sessão está ativa no novo navegador
+        """
+        if not self._credentials:
+            self.logger.error("Nenhuma credencial registrada para restaurar a sessão")
+            return False
+        
+        username, _, company_id = self._credentials
+        if self.driver and self.session_store:
+            try:
+                self.session_store.save(self.driver, username, company_id, self.session_id)
+            except Exception as e:
+                self.logger.warning(f"Não foi possível salvar a sessão antes de reiniciar: {str(e)}")
+        try:
+            self.quit()
+        except WebDriverException:
+            self.driver = None
+        
+        return self.login(*self._credentials)
     
     def get_home_page(self) -> HomePage:
         """Retorna instância da página home."""
@@ -67,9 +206,13 @@ class Browser:
             self.start()
         return HomePage(self.driver)
     
-    def get_funcionario_operations(self):
-        """Retorna instância de operações de funcionário."""
+    def get_funcionario_operations(self, **kwargs):
+        """Retorna instância de operações de funcionário.
+
+        Args:
+            **kwargs: Repassados para ``FuncionarioOperations`` (ex: cache, journal)
+        """
         from ..operations.funcionario_operations import FuncionarioOperations
         if not self.driver:
             self.start()
-        return FuncionarioOperations(self)
\ No newline at end of file
+        return FuncionarioOperations(self, **kwargs)
\ No newline at end of file
@@ -0,0 +1,142 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from .browser import Browser
+from .logger import get_logger
+from .session_store import SessionStore
+
+
+class BrowserPoolError(Exception):
+    """Erro ao obter ou manter sessões do pool."""
+
+
+class BrowserPool:
+    """Pool de navegadores já autenticados no SOC.
+
+    Mantém ``size`` instâncias de ``Browser`` logadas e prontas para uso.
+    Cada checkout verifica a sessão (presença de ``#barra``) e refaz o
+    login de forma transparente se ela tiver expirado.
+
+    Exemplo:
+        with BrowserPool("usuario", "senha", "id", size=3) as pool:
+            with pool.session() as browser:
+                browser.get_funcionario_operations().transferir(...)
+    """
+
+    def __init__(self,
+                 username: str,
+                 password: str,
+                 company_id: str,
+                 size: int = 2,
+                 headless: Optional[bool] = None,
+                 session_store: Optional[SessionStore] = None) -> None:
+        self.logger = get_logger(__name__)
+        self.username = username
+        self.password = password
+        self.company_id = company_id
+        self.size = size
+        self.headless = headless
+        self.session_store = session_store
+        self._available: "queue.Queue[Browser]" = queue.Queue()
+        self._browsers: List[Browser] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> None:
+        """Inicia e autentica todos os navegadores do pool em paralelo."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            browsers = list(executor.map(self._create_browser, range(self.size)))
+
+        for browser in browsers:
+            if browser:
+                self._browsers.append(browser)
+                self._available.put(browser)
+
+        if not self._browsers:
+            raise BrowserPoolError("Nenhum navegador do pool conseguiu fazer login")
+
+        self.logger.info(f"Pool iniciado com {len(self._browsers)}/{self.size} navegador(es)")
+
+    def _create_browser(self, indice: int) -> Optional[Browser]:
+        """Cria um navegador e faz login; retorna None em caso de falha.
+
+        Cada posição do pool tem sua própria sessão no ``session_store``.
+        """
+        browser = Browser(headless=self.headless, session_store=self.session_store,
+                          session_id=f"pool-{indice}")
+        try:
+            if browser.login(self.username, self.password, self.company_id):
+                return browser
+            self.logger.error("Falha no login de um navegador do pool")
+        except Exception as e:
+            self.logger.error(f"Erro ao iniciar navegador do pool: {str(e)}")
+        browser.quit()
+        return None
+
+    def checkout(self, timeout: Optional[float] = None) -> Browser:
+        """Retira um navegador autenticado do pool.
+
+        Args:
+            timeout: Tempo máximo de espera por um navegador livre (None = indefinido).
+
+        Returns:
+            Browser: Navegador com sessão ativa.
+
+        Raises:
+            BrowserPoolError: Se o pool estiver fechado, esgotado no prazo ou
+                a sessão não puder ser restabelecida.
+        """
+        if self._closed:
+            raise BrowserPoolError("Pool encerrado")
+
+        try:
+            browser = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise BrowserPoolError(f"Nenhum navegador livre em {timeout}s")
+
+        if not browser.ensure_session():
+            self._available.put(browser)
+            raise BrowserPoolError("Não foi possível restabelecer a sessão SOC")
+
+        return browser
+
+    def checkin(self, browser: Browser) -> None:
+        """Devolve um navegador ao pool."""
+        if self._closed:
+            browser.quit()
+            return
+        self._available.put(browser)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[Browser]:
+        """Context manager que faz checkout e checkin automaticamente."""
+        browser = self.checkout(timeout)
+        try:
+            yield browser
+        finally:
+            self.checkin(browser)
+
+    def close(self) -> None:
+        """Fecha todos os navegadores do pool."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        for browser in self._browsers:
+            try:
+                browser.quit()
+            except Exception as e:
+                self.logger.warning(f"Erro ao fechar navegador do pool: {str(e)}")
+        self._browsers.clear()
+        self.logger.info("Pool encerrado")
+
+    def __enter__(self) -> "BrowserPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,258 @@
+import copy
+import dataclasses
+import os
+import threading
+import typing
+import warnings
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+# Variável de ambiente com o caminho do arquivo de configuração
+VARIAVEL_CONFIG = "SOC_CONFIG"
+
+# Variável de ambiente com o ambiente ativo (seção ``ambientes.<nome>`` do config.yaml)
+VARIAVEL_AMBIENTE = "SOC_ENV"
+
+# Prefixo das variáveis que sobrescrevem chaves: SOC_<SECAO>_<CHAVE> (ex: SOC_BROWSER_TIMEOUT=20)
+PREFIXO_VARIAVEIS = "SOC_"
+
+_cache: Optional[Dict[str, Any]] = None
+_lock = threading.Lock()
+
+
+@dataclass
+class ConfigBrowser:
+    """Seção ``browser``: navegador, esperas e flags do Chrome."""
+    headless: bool = False
+    # Espera padrão por telas e elementos (s)
+    timeout: float = 10.0
+    # Confirmações opcionais, onde a condição pode nunca ocorrer (s)
+    timeout_curto: float = 2.0
+    # Espera pela barra do sistema após o login (s)
+    timeout_login: float = 10.0
+    # Espera pelos ícones da barra, depois que a barra do sistema apareceu (s)
+    timeout_confirmacao_login: float = 5.0
+    # Espera por modais do SOC (s)
+    timeout_modal: float = 2.0
+    # Intervalo entre verificações das esperas por condição (s)
+    intervalo_poll: float = 0.1
+    performance_profile: bool = False
+    window_size: str = "1366,768"
+    argumentos: List[str] = field(
+        default_factory=lambda: ["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"]
+    )
+
+
+@dataclass
+class ConfigSoc:
+    """Seção ``soc``: endereço do sistema."""
+    url: str = "https://sistema.soc.com.br/WebSoc/"
+
+
+@dataclass
+class ConfigRetry:
+    """Seção ``retry``: novas tentativas e disjuntor (ver ``core.retry``)."""
+    tentativas: int = 3
+    base: float = 0.5
+    multiplicador: float = 2.0
+    maximo: float = 10.0
+    jitter: bool = True
+    tentativas_login: int = 2
+    # Espera base do backoff entre tentativas de login (s)
+    base_login: float = 1.0
+    limite_falhas_disjuntor: int = 5
+    pausa_disjuntor: float = 30.0
+
+
+@dataclass
+class ConfigLote:
+    """Seção ``lote``: workers e reciclagem de navegadores em ``transferir_lote``."""
+    # None calcula pela CPU e memória disponível
+    workers: Optional[int] = None
+    adaptativo: bool = False
+    memoria_por_worker_mb: int = 600
+    intervalo_monitoramento: float = 1.0
+    max_jobs_por_navegador: int = 200
+    max_memoria_navegador_mb: int = 1500
+
+
+@dataclass
+class ConfigLogging:
+    """Seção ``logging`` (ver ``core.logger.configure_logging``)."""
+    level: str = "INFO"
+    format: Optional[str] = None
+    datefmt: Optional[str] = None
+    # Diretório dos arquivos de log (None: ./logs)
+    directory: Optional[str] = None
+    file: Optional[str] = None
+    json: bool = False
+
+
+@dataclass
+class ConfigArtefatos:
+    """Seção ``artefatos`` (ver ``core.artefatos``)."""
+    directory: str = "artefatos"
+    max_arquivos: int = 200
+    max_mb: float = 200.0
+    linhas_log: int = 200
+
+
+@dataclass
+class Configuracao:
+    """Configuração tipada, montada a partir do config.yaml.
+
+    Ordem de precedência: valores padrão das seções, config.yaml, seção
+    ``ambientes.<SOC_ENV>`` e variáveis ``SOC_<SECAO>_<CHAVE>``.
+    """
+    ambiente: Optional[str] = None
+    browser: ConfigBrowser = field(default_factory=ConfigBrowser)
+    soc: ConfigSoc = field(default_factory=ConfigSoc)
+    retry: ConfigRetry = field(default_factory=ConfigRetry)
+    lote: ConfigLote = field(default_factory=ConfigLote)
+    logging: ConfigLogging = field(default_factory=ConfigLogging)
+    artefatos: ConfigArtefatos = field(default_factory=ConfigArtefatos)
+
+
+def _secoes() -> Dict[str, type]:
+    return {f.name: f.type for f in dataclasses.fields(Configuracao) if dataclasses.is_dataclass(f.type)}
+
+
+def find_config_file() -> Optional[Path]:
+    """Localiza o config.yaml.
+
+    Ordem: variável SOC_CONFIG, ``config/config.yaml`` no diretório atual e
+    ``config/config.yaml`` na raiz do projeto.
+    """
+    explicit_path = os.environ.get(VARIAVEL_CONFIG)
+    candidates = [Path(explicit_path)] if explicit_path else []
+    candidates.append(Path.cwd() / "config" / "config.yaml")
+    candidates.append(Path(__file__).resolve().parents[3] / "config" / "config.yaml")
+
+    for path in candidates:
+        if path.is_file():
+            return path
+    return None
+
+
+def _mesclar(base: Dict[str, Any], sobrescrita: Dict[str, Any]) -> Dict[str, Any]:
+    """Mescla dicionários recursivamente; ``sobrescrita`` prevalece."""
+    for chave, valor in sobrescrita.items():
+        if isinstance(valor, dict) and isinstance(base.get(chave), dict):
+            _mesclar(base[chave], valor)
+        else:
+            base[chave] = valor
+    return base
+
+
+def _variaveis_ambiente() -> Dict[str, Dict[str, Any]]:
+    """Sobrescritas vindas de variáveis SOC_<SECAO>_<CHAVE>, com valores em sintaxe YAML."""
+    secoes = _secoes()
+    sobrescritas: Dict[str, Dict[str, Any]] = {}
+    for nome, valor in os.environ.items():
+        if not nome.startswith(PREFIXO_VARIAVEIS):
+            continue
+        secao, _, chave = nome[len(PREFIXO_VARIAVEIS):].lower().partition("_")
+        if secao not in secoes or not chave:
+            continue
+        try:
+            valor = yaml.safe_load(valor) if valor else None
+        except yaml.YAMLError:
+            pass
+        sobrescritas.setdefault(secao, {})[chave] = valor
+    return sobrescritas
+
+
+def load_config(reload: bool = False) -> Dict[str, Any]:
+    """Carrega o config.yaml uma única vez por processo.
+
+    A seção ``ambientes.<SOC_ENV>`` e as variáveis ``SOC_<SECAO>_<CHAVE>``
+    são aplicadas sobre o arquivo.
+
+    Args:
+        reload: Se True, relê o arquivo mesmo que já esteja em cache.
+
+    Returns:
+        Dicionário com a configuração (vazio se o arquivo não existir).
+    """
+    global _cache
+    with _lock:
+        if _cache is None or reload:
+            config: Dict[str, Any] = {}
+            path = find_config_file()
+            if path:
+                with open(path, encoding="utf-8") as f:
+                    config = yaml.safe_load(f) or {}
+
+            ambientes = config.pop("ambientes", None) or {}
+            ambiente = os.environ.get(VARIAVEL_AMBIENTE) or config.get("ambiente")
+            if ambiente:
+                if ambiente in ambientes:
+                    _mesclar(config, copy.deepcopy(ambientes[ambiente]) or {})
+                else:
+                    warnings.warn(f"Ambiente '{ambiente}' não definido em 'ambientes' do config.yaml")
+                config["ambiente"] = ambiente
+
+            _cache = _mesclar(config, _variaveis_ambiente())
+        return _cache
+
+
+def _converter(valor: Any, tipo: Any, nome: str) -> Any:
+    """Converte ``valor`` para o tipo anotado do campo ``nome``."""
+    argumentos = typing.get_args(tipo)
+    if typing.get_origin(tipo) is typing.Union:
+        if valor is None:
+            return None
+        tipo = next(t for t in argumentos if t is not type(None))
+        argumentos = typing.get_args(tipo)
+
+    try:
+        if typing.get_origin(tipo) in (list, List):
+            if isinstance(valor, str):
+                valor = [item.strip() for item in valor.split(",") if item.strip()]
+            return [_converter(item, argumentos[0], nome) for item in valor]
+        if tipo is bool:
+            if isinstance(valor, str):
+                return valor.strip().lower() in ("1", "true", "sim", "yes", "on")
+            return bool(valor)
+        return tipo(valor)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Valor inválido para '{nome}': {valor!r}") from e
+
+
+def _montar_secao(classe: type, nome_secao: str, dados: Dict[str, Any]) -> Any:
+    tipos = typing.get_type_hints(classe)
+    valores = {}
+    for chave, valor in (dados or {}).items():
+        if chave not in tipos:
+            warnings.warn(f"Chave desconhecida ignorada no config.yaml: {nome_secao}.{chave}")
+            continue
+        valores[chave] = _converter(valor, tipos[chave], f"{nome_secao}.{chave}")
+    return classe(**valores)
+
+
+_configuracao: Optional[Configuracao] = None
+_configuracao_lock = threading.Lock()
+
+
+def get_configuracao(reload: bool = False) -> Configuracao:
+    """Obtém a configuração tipada do processo.
+
+    Args:
+        reload: Se True, relê o config.yaml e as variáveis de ambiente.
+
+    Raises:
+        ValueError: Se algum valor não puder ser convertido para o tipo da chave.
+    """
+    global _configuracao
+    with _configuracao_lock:
+        if _configuracao is None or reload:
+            config = load_config(reload)
+            _configuracao = Configuracao(
+                ambiente=config.get("ambiente"),
+                **{nome: _montar_secao(classe, nome, config.get(nome))
+                   for nome, classe in _secoes().items()}
+            )
+        return _configuracao
@@ -1,21 +1,86 @@
+import json
+import os
 import subprocess
 import sys
-from typing import Optional
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
 
+from .config import get_configuracao
 from .logger import get_logger
 
+# Cache em disco do caminho do chromedriver, por versão principal do Chrome
+CACHE_DRIVER_PADRAO = Path.home() / ".soc_automation" / "chromedriver.json"
+
+# Caminho explícito do chromedriver (ignora detecção e cache)
+VARIAVEL_CHROMEDRIVER = "SOC_CHROMEDRIVER"
+
+# Recursos não essenciais bloqueados no perfil de desempenho (padrões de Network.setBlockedURLs)
+URLS_BLOQUEADAS_PADRAO = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*hotjar.com*", "*facebook.net*", "*clarity.ms*",
+)
+
+# Flags do perfil de desempenho: sem tráfego nem processos de segundo plano
+ARGUMENTOS_DESEMPENHO = (
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--blink-settings=imagesEnabled=false",
+)
+
 
 class DriverManager:
     """Gerencia a inicialização e configuração do WebDriver."""
     
-    def __init__(self) -> None:
+    # Cache em memória compartilhado pelas instâncias do processo
+    _driver_paths: Dict[str, str] = {}
+    # Versão principal do Chrome, detectada uma vez por processo (None = não detectada)
+    _chrome_major_version: Optional[str] = None
+    _lock = threading.Lock()
+    
+    def __init__(self,
+                 update_dependencies: bool = False,
+                 cache_path: Optional[str] = None,
+                 performance_profile: bool = False,
+                 blocked_urls: Optional[Sequence[str]] = None,
+                 user_data_dir: Optional[str] = None) -> None:
+        """Inicializa o gerenciador.
+        
+        Args:
+            update_dependencies: Se True, atualiza selenium/webdriver-manager via pip
+                (lento e requer rede; desativado por padrão).
+            cache_path: Arquivo de cache do caminho do chromedriver.
+            performance_profile: Se True, usa o perfil de desempenho: estratégia
+                de carregamento 'eager', sem serviços de segundo plano e com
+                recursos não essenciais bloqueados.
+            blocked_urls: Padrões bloqueados no perfil de desempenho
+                (padrão: URLS_BLOQUEADAS_PADRAO).
+            user_data_dir: Diretório de perfil do Chrome (cookies, cache). Cada
+                navegador aberto ao mesmo tempo precisa de um diretório próprio;
+                None usa um perfil temporário.
+        """
         self.logger = get_logger(__name__)
-        self._ensure_dependencies()
+        self.cache_path = Path(cache_path) if cache_path else CACHE_DRIVER_PADRAO
+        self.performance_profile = performance_profile
+        self.blocked_urls: List[str] = list(URLS_BLOQUEADAS_PADRAO if blocked_urls is None else blocked_urls)
+        self.user_data_dir = user_data_dir
+        self.startup_timings: Dict[str, float] = {}
+        if update_dependencies:
+            self._ensure_dependencies()
     
     def _ensure_dependencies(self) -> None:
         """Garante que as dependências estão instaladas e atualizadas."""
@@ -40,24 +105,123 @@ class DriverManager:
         Returns:
             Uma instância configurada do ChromeDriver.
         """
+        self.startup_timings = {}
+        inicio = time.perf_counter()
         options = self._get_chrome_options(headless)
         
         try:
-            # Usa o ChromeDriverManager para baixar e usar a versão correta
-            driver_path = ChromeDriverManager().install()
-            service = ChromeService(executable_path=driver_path)
+            driver_path = self._resolve_driver_path()
+            service = ChromeService(executable_path=driver_path) if driver_path else ChromeService()
             
+            fase = time.perf_counter()
             driver = webdriver.Chrome(service=service, options=options)
-            self.logger.info("ChromeDriver inicializado com sucesso")
+            self.startup_timings["iniciar_chrome"] = time.perf_counter() - fase
+            if self.performance_profile:
+                self._block_resources(driver)
+            self.startup_timings["total"] = time.perf_counter() - inicio
+            
+            detalhes = ", ".join(f"{k}={v:.2f}s" for k, v in self.startup_timings.items())
+            self.logger.info(f"ChromeDriver inicializado com sucesso ({detalhes})")
             return driver
             
         except Exception as e:
             self.logger.error(f"Erro ao criar ChromeDriver: {e}")
             raise
     
+    def _resolve_driver_path(self) -> Optional[str]:
+        """Resolve o caminho do chromedriver sem acessar a rede quando possível.
+        
+        Ordem: variável SOC_CHROMEDRIVER, cache em memória, cache em disco
+        (por versão principal do Chrome) e, só então, o ChromeDriverManager.
+        A versão do Chrome é detectada só no primeiro driver do processo.
+        
+        Returns:
+            Caminho do chromedriver, ou None para delegar ao Selenium Manager.
+        """
+        explicit_path = os.environ.get(VARIAVEL_CHROMEDRIVER)
+        if explicit_path:
+            return explicit_path
+        
+        fase = time.perf_counter()
+        major_version = self._detect_chrome_major_version()
+        self.startup_timings["detectar_versao_chrome"] = time.perf_counter() - fase
+        
+        fase = time.perf_counter()
+        try:
+            with self._lock:
+                driver_path = self._driver_paths.get(major_version)
+                if not driver_path:
+                    driver_path = self._read_cache().get(major_version)
+                if not driver_path or not os.path.exists(driver_path):
+                    self.logger.info(f"Resolvendo chromedriver para Chrome {major_version or 'desconhecido'}")
+                    driver_path = ChromeDriverManager().install()
+                    self._write_cache(major_version, driver_path)
+                self._driver_paths[major_version] = driver_path
+            return driver_path
+        except Exception as e:
+            self.logger.warning(f"Falha ao resolver chromedriver ({e}); usando Selenium Manager")
+            return None
+        finally:
+            self.startup_timings["resolver_chromedriver"] = time.perf_counter() - fase
+    
+    def _detect_chrome_major_version(self) -> str:
+        """Detecta a versão principal do Chrome instalado (ex: '126').
+        
+        A detecção inicia um subprocesso; o resultado fica em memória para
+        os drivers seguintes do processo.
+        """
+        cls = type(self)
+        if cls._chrome_major_version is not None:
+            return cls._chrome_major_version
+        try:
+            version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+            major_version = version.split(".")[0] if version else ""
+        except Exception as e:
+            self.logger.warning(f"Não foi possível detectar a versão do Chrome: {e}")
+            major_version = ""
+        cls._chrome_major_version = major_version
+        return major_version
+    
+    def _read_cache(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_cache(self, major_version: str, driver_path: str) -> None:
+        if not major_version:
+            return
+        try:
+            cache = self._read_cache()
+            cache[major_version] = driver_path
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(cache))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Não foi possível gravar o cache do chromedriver: {e}")
+    
+    def _block_resources(self, driver: webdriver.Chrome) -> None:
+        """Bloqueia os padrões de ``blocked_urls`` via CDP.
+        
+        Vale para a aba do driver e seus frames (incluindo o socframe);
+        janelas popup abertas depois não herdam o bloqueio.
+        """
+        if not self.blocked_urls:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+            self.logger.info(f"{len(self.blocked_urls)} padrão(ões) de URL bloqueado(s)")
+        except Exception as e:
+            self.logger.warning(f"Não foi possível bloquear recursos via CDP: {e}")
+    
     def _get_chrome_options(self, headless: bool) -> ChromeOptions:
         """Configura as opções do Chrome.
         
+        O tamanho da janela e as flags básicas vêm de ``browser.window_size``
+        e ``browser.argumentos`` do config.yaml.
+        
         Args:
             headless: Se True, configura o modo headless.
             
@@ -65,18 +229,31 @@ class DriverManager:
             Objeto ChromeOptions configurado.
         """
         options = ChromeOptions()
+        config = get_configuracao().browser
         
         # Configurações básicas
-        options.add_argument("--window-size=1366,768")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument(f"--window-size={config.window_size}")
+        for argument in config.argumentos:
+            options.add_argument(argument)
         
         # Previne detecção de automação
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
         
         if headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
+        
+        if self.user_data_dir:
+            os.makedirs(self.user_data_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={os.path.abspath(self.user_data_dir)}")
+        
+        if self.performance_profile:
+            # Retorna no DOMContentLoaded; as esperas seguintes são por condição
+            options.page_load_strategy = "eager"
+            for argument in ARGUMENTOS_DESEMPENHO:
+                options.add_argument(argument)
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
             
         return options
\ No newline at end of file
@@ -1,60 +1,194 @@
+import atexit
+import json
 import logging
 import os
+import queue
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional, Union
 
+from .config import get_configuracao
+
+# Logger raiz do pacote; todos os loggers de módulo (soc_automation.*) herdam dele
+ROOT_LOGGER_NAME = __name__.rsplit(".", 2)[0]
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+# Linhas recentes mantidas em memória para os artefatos de falha
+LINHAS_RECENTES_PADRAO = 500
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+# Arquivo em que o listener atual grava
+_log_file: Optional[str] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formata cada registro como um objeto JSON em uma linha."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class BufferLogHandler(logging.Handler):
+    """Mantém as últimas linhas formatadas em um buffer circular na memória."""
+
+    def __init__(self, capacidade: int = LINHAS_RECENTES_PADRAO) -> None:
+        super().__init__()
+        self._linhas = deque(maxlen=capacidade)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._linhas.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def linhas(self, quantidade: Optional[int] = None) -> List[str]:
+        linhas = list(self._linhas)
+        return linhas[-quantidade:] if quantidade else linhas
+
+
+_buffer = BufferLogHandler()
+
+
+def linhas_recentes(quantidade: Optional[int] = None) -> List[str]:
+    """Retorna as últimas linhas de log do processo (mais antigas primeiro).
+
+    Args:
+        quantidade: Número máximo de linhas (None para todo o buffer).
+    """
+    return _buffer.linhas(quantidade)
+
+
+def configure_logging(level: Optional[Union[int, str]] = None,
+                      log_file: Optional[str] = None,
+                      json_format: Optional[bool] = None,
+                      force: bool = False) -> None:
+    """Configura o logging do pacote uma única vez por processo.
+
+    Os loggers de módulo enviam registros para uma fila (``QueueHandler``);
+    um ``QueueListener`` em thread separada grava no console e no arquivo,
+    de forma que a automação nunca bloqueia em I/O de disco. Valores não
+    informados vêm da seção ``logging`` do config.yaml.
+
+    Args:
+        level: Nível de logging.
+        log_file: Caminho do arquivo de log (padrão: logs/soc_automation_<data>_<pid>.log).
+        json_format: Se True, grava registros estruturados em JSON.
+        force: Se True, reconfigura mesmo que o logging já esteja ativo.
+    """
+    global _listener, _log_file
+
+    with _lock:
+        if _listener is not None and not force:
+            return
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+        config = get_configuracao().logging
+        level = level or config.level
+        json_format = config.json if json_format is None else json_format
+
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                config.format or DEFAULT_FORMAT,
+                datefmt=config.datefmt or DEFAULT_DATEFMT
+            )
+
+        if not log_file:
+            log_file = config.file
+        if not log_file:
+            log_dir = config.directory or os.path.join(os.getcwd(), "logs")
+            os.makedirs(log_dir, exist_ok=True)
+            log_filename = f"soc_automation_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.log"
+            log_file = os.path.join(log_dir, log_filename)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(formatter)
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(QueueHandler(log_queue))
+        root_logger.setLevel(level)
+        root_logger.propagate = False
+
+        _buffer.setFormatter(formatter)
+        _listener = QueueListener(log_queue, console_handler, file_handler, _buffer, respect_handler_level=True)
+        _listener.start()
+        _log_file = os.path.abspath(log_file)
+
+
+def shutdown_logging() -> None:
+    """Esvazia a fila e encerra a thread de escrita dos logs."""
+    global _listener, _log_file
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                if handler is not _buffer:
+                    handler.close()
+            _listener = None
+            _log_file = None
+
+
+atexit.register(shutdown_logging)
+
+
+def setup_logger(name: str, log_file: Optional[str] = None, level: Optional[int] = None) -> logging.Logger:
+    """Configura o logging do pacote (se necessário) e retorna o logger.
+
+    Mantido por compatibilidade; prefira ``get_logger``. Com o logging já
+    ativo, ``level`` e ``log_file`` informados são aplicados ao do pacote:
+    o nível muda na hora e um arquivo diferente do atual reinicia o
+    listener gravando nele.
 
-def setup_logger(name: str, log_file: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
-    """Configura um logger com formatação personalizada.
-    
     Args:
         name: Nome do logger.
         log_file: Caminho do arquivo de log (opcional).
-        level: Nível de logging.
-        
+        level: Nível de logging (padrão: ``logging.level`` do config.yaml).
+
     Returns:
         Logger configurado.
     """
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    else:
-        # Default log file
-        log_dir = os.path.join(os.getcwd(), "logs")
-        os.makedirs(log_dir, exist_ok=True)
-        
-        log_filename = f"soc_automation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        log_path = os.path.join(log_dir, log_filename)
-        
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
-    return logger
+    configure_logging(level=level, log_file=log_file)
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    with _lock:
+        trocar_arquivo = bool(log_file) and os.path.abspath(log_file) != _log_file
+    if trocar_arquivo:
+        configure_logging(level=level or root_logger.level, log_file=log_file, force=True)
+    elif level is not None:
+        root_logger.setLevel(level)
+    return logging.getLogger(name)
 
 
 def get_logger(name: str) -> logging.Logger:
     """Obtém um logger configurado.
-    
+
     Args:
         name: Nome do logger.
-        
+
     Returns:
         Logger configurado.
     """
-    return setup_logger(name)
\ No newline at end of file
+    configure_logging()
+    return logging.getLogger(name)
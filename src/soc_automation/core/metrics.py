@@ -0,0 +1,268 @@
+"""Spans de tempo e histogramas das operações SOC, exportáveis para Prometheus.
+
+Cada span mede o tempo de parede de uma operação (login, navegação, etapa de
+transferência, tratamento de modal) e alimenta um histograma por nome e
+rótulos. Os histogramas podem ser exportados no formato texto do Prometheus
+(arquivo para o textfile collector do node_exporter) ou servidos por HTTP.
+
+Exemplo:
+    metricas = get_metricas()
+    with metricas.span("login") as span:
+        if not fazer_login():
+            span.falhou()
+    metricas.gravar_arquivo("/var/lib/node_exporter/soc.prom")
+"""
+import bisect
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+
+from .logger import get_logger
+
+NOME_METRICA = "soc_span_segundos"
+
+# Limites dos buckets (segundos): de operações JS rápidas a transferências inteiras
+BUCKETS_PADRAO = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+QUANTIS = (0.5, 0.95, 0.99)
+
+# Amostras recentes mantidas por série para o cálculo dos quantis
+JANELA_AMOSTRAS = 1024
+
+RESULTADO_OK = "ok"
+RESULTADO_FALHA = "falha"
+RESULTADO_ERRO = "erro"
+
+Rotulos = Tuple[Tuple[str, str], ...]
+
+# (nome, duração, rótulos) de uma observação, como enviada entre processos
+Observacao = Tuple[str, float, Dict[str, str]]
+
+
+class Histograma:
+    """Histograma cumulativo com janela de amostras recentes para quantis."""
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS_PADRAO) -> None:
+        self.buckets = buckets
+        self.contagens = [0] * (len(buckets) + 1)
+        self.soma = 0.0
+        self.total = 0
+        self._amostras: Deque[float] = deque(maxlen=JANELA_AMOSTRAS)
+
+    def observar(self, valor: float) -> None:
+        self.contagens[bisect.bisect_left(self.buckets, valor)] += 1
+        self.soma += valor
+        self.total += 1
+        self._amostras.append(valor)
+
+    def quantil(self, q: float) -> Optional[float]:
+        """Quantil das amostras recentes (None se não houver amostras)."""
+        if not self._amostras:
+            return None
+        ordenadas = sorted(self._amostras)
+        return ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))]
+
+
+class Span:
+    """Mede uma operação; o resultado é 'ok', 'falha' (via ``falhou``) ou 'erro' (exceção)."""
+
+    def __init__(self, registro: "RegistroMetricas", nome: str, rotulos: Dict[str, str]) -> None:
+        self._registro = registro
+        self.nome = nome
+        self.rotulos = rotulos
+        self.resultado = RESULTADO_OK
+        self.duracao: Optional[float] = None
+        self._inicio = 0.0
+
+    def falhou(self) -> None:
+        """Marca a operação como concluída sem sucesso (sem exceção)."""
+        self.resultado = RESULTADO_FALHA
+
+    def __enter__(self) -> "Span":
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.duracao = time.perf_counter() - self._inicio
+        if exc_type is not None:
+            self.resultado = RESULTADO_ERRO
+        self._registro.observar(self.nome, self.duracao, resultado=self.resultado, **self.rotulos)
+
+
+def _formatar_rotulos(rotulos: Rotulos, extra: Optional[Tuple[str, str]] = None) -> str:
+    pares = list(rotulos) + ([extra] if extra else [])
+    if not pares:
+        return ""
+    conteudo = ",".join(
+        '{}="{}"'.format(nome, valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for nome, valor in pares
+    )
+    return "{" + conteudo + "}"
+
+
+def _formatar_numero(valor: float) -> str:
+    return "+Inf" if valor == float("inf") else repr(float(valor))
+
+
+class RegistroMetricas:
+    """Histogramas de spans por (nome, rótulos). Seguro para uso entre threads.
+
+    Em processos worker, ``iniciar_coleta`` guarda também cada observação
+    bruta; ``drenar`` as entrega para envio ao processo principal, que as
+    registra com ``registrar_observacoes``.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS_PADRAO) -> None:
+        self.buckets = buckets
+        self._series: Dict[Rotulos, Histograma] = {}
+        self._pendentes: Optional[List[Observacao]] = None
+        self._lock = threading.Lock()
+
+    def span(self, nome: str, **rotulos: str) -> Span:
+        """Cria um span (use com ``with``) para a operação informada."""
+        return Span(self, nome, {chave: str(valor) for chave, valor in rotulos.items()})
+
+    def observar(self, nome: str, duracao: float, **rotulos: str) -> None:
+        """Registra uma duração diretamente, sem span."""
+        chave: Rotulos = (("span", nome),) + tuple(sorted((k, str(v)) for k, v in rotulos.items()))
+        with self._lock:
+            histograma = self._series.get(chave)
+            if histograma is None:
+                histograma = self._series[chave] = Histograma(self.buckets)
+            histograma.observar(duracao)
+            if self._pendentes is not None:
+                self._pendentes.append((nome, duracao, {k: str(v) for k, v in rotulos.items()}))
+
+    def iniciar_coleta(self) -> None:
+        """Passa a guardar as observações para ``drenar``."""
+        with self._lock:
+            if self._pendentes is None:
+                self._pendentes = []
+
+    def drenar(self) -> List[Observacao]:
+        """Retorna e descarta as observações guardadas desde a última drenagem."""
+        with self._lock:
+            if self._pendentes is None:
+                return []
+            pendentes, self._pendentes = self._pendentes, []
+        return pendentes
+
+    def registrar_observacoes(self, observacoes: List[Observacao], **rotulos: str) -> None:
+        """Registra observações drenadas de outro processo, com rótulos adicionais."""
+        for nome, duracao, rotulos_observacao in observacoes:
+            self.observar(nome, duracao, **dict(rotulos_observacao, **rotulos))
+
+    def resumo(self) -> Dict[str, Dict[str, float]]:
+        """Contagem, soma e p50/p95/p99 de cada série, indexados pelos rótulos formatados."""
+        with self._lock:
+            series = list(self._series.items())
+        return {
+            _formatar_rotulos(chave): dict(
+                {"total": h.total, "soma": h.soma},
+                **{f"p{int(q * 100)}": h.quantil(q) for q in QUANTIS}
+            )
+            for chave, h in series
+        }
+
+    def exportar_texto(self, openmetrics: bool = False) -> str:
+        """Exporta os histogramas no formato texto do Prometheus (ou OpenMetrics).
+
+        Além do histograma ``soc_span_segundos``, exporta o summary
+        ``soc_span_segundos_quantis`` com p50/p95/p99 das amostras recentes.
+        """
+        with self._lock:
+            series = sorted(self._series.items())
+            linhas: List[str] = [
+                f"# HELP {NOME_METRICA} Duração das operações SOC em segundos.",
+                f"# TYPE {NOME_METRICA} histogram",
+            ]
+            for rotulos, h in series:
+                acumulado = 0
+                for limite, contagem in zip(self.buckets + (float("inf"),), h.contagens):
+                    acumulado += contagem
+                    rotulo_le = ("le", _formatar_numero(limite))
+                    linhas.append(f"{NOME_METRICA}_bucket{_formatar_rotulos(rotulos, rotulo_le)} {acumulado}")
+                linhas.append(f"{NOME_METRICA}_sum{_formatar_rotulos(rotulos)} {_formatar_numero(h.soma)}")
+                linhas.append(f"{NOME_METRICA}_count{_formatar_rotulos(rotulos)} {h.total}")
+
+            resumo = f"{NOME_METRICA}_quantis"
+            linhas.append(f"# HELP {resumo} Quantis da duração das operações SOC (amostras recentes).")
+            linhas.append(f"# TYPE {resumo} summary")
+            for rotulos, h in series:
+                for q in QUANTIS:
+                    valor = h.quantil(q)
+                    if valor is not None:
+                        rotulo_q = ("quantile", str(q))
+                        linhas.append(f"{resumo}{_formatar_rotulos(rotulos, rotulo_q)} {_formatar_numero(valor)}")
+                linhas.append(f"{resumo}_sum{_formatar_rotulos(rotulos)} {_formatar_numero(h.soma)}")
+                linhas.append(f"{resumo}_count{_formatar_rotulos(rotulos)} {h.total}")
+
+        if openmetrics:
+            linhas.append("# EOF")
+        return "\n".join(linhas) + "\n"
+
+    def gravar_arquivo(self, caminho: str) -> None:
+        """Grava a exportação de forma atômica (para o textfile collector)."""
+        diretorio = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(diretorio, exist_ok=True)
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            f.write(self.exportar_texto())
+        os.replace(temporario, caminho)
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class _MetricasHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in (self.headers.get("Accept") or "")
+        corpo = self.server.registro.exportar_texto(openmetrics).encode("utf-8")
+        tipo = (
+            "application/openmetrics-text; version=1.0.0; charset=utf-8" if openmetrics
+            else "text/plain; version=0.0.4; charset=utf-8"
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def iniciar_servidor_metricas(porta: int = 9464,
+                              host: str = "0.0.0.0",
+                              registro: Optional[RegistroMetricas] = None) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` em uma thread daemon.
+
+    Returns:
+        ThreadingHTTPServer: Servidor iniciado (use ``shutdown()`` para encerrar)
+    """
+    servidor = ThreadingHTTPServer((host, porta), _MetricasHandler)
+    servidor.daemon_threads = True
+    servidor.registro = registro or get_metricas()
+    threading.Thread(target=servidor.serve_forever, name="soc-metricas", daemon=True).start()
+    get_logger(__name__).info(f"Métricas disponíveis em http://{host}:{servidor.server_address[1]}/metrics")
+    return servidor
+
+
+_registro_padrao: Optional[RegistroMetricas] = None
+_registro_lock = threading.Lock()
+
+
+def get_metricas() -> RegistroMetricas:
+    """Obtém o registro de métricas compartilhado pelo processo."""
+    global _registro_padrao
+    with _registro_lock:
+        if _registro_padrao is None:
+            _registro_padrao = RegistroMetricas()
+        return _registro_padrao
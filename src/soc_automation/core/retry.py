@@ -0,0 +1,284 @@
+"""Política central de novas tentativas, com backoff exponencial e disjuntor.
+
+Os erros são classificados em transitórios (vale tentar de novo: timeouts,
+elementos ainda não carregados, conexão) e determinísticos (credenciais
+incorretas, funcionário não encontrado, erros de programação), que falham
+imediatamente. Timeouts alimentam um ``Disjuntor`` compartilhado: quando o
+SOC começa a não responder, todos os workers pausam em vez de insistir.
+
+Exemplo:
+    politica = PoliticaRetry(tentativas=3, base=0.5)
+    politica.executar(lambda: driver.execute_script("doAcao('alt');"), descricao="alt")
+"""
+import multiprocessing
+import random
+import socket
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchFrameException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    UnexpectedAlertPresentException,
+    WebDriverException,
+)
+
+from .config import get_configuracao
+from .logger import get_logger
+
+T = TypeVar("T")
+
+TRANSITORIO = "transitorio"
+DETERMINISTICO = "deterministico"
+
+# Trechos de mensagens que indicam falha que não muda com nova tentativa
+MARCADORES_DETERMINISTICOS = (
+    "incorret", "senha inválida", "usuário inválido", "bloquead",
+    "não encontrado", "nao encontrado", "not found", "sem permissão", "acesso negado",
+)
+
+# Trechos de mensagens de timeout do driver/rede
+MARCADORES_TIMEOUT = ("timed out", "timeout", "tempo esgotado")
+
+
+class ErroTransitorio(Exception):
+    """Falha que pode não se repetir em uma nova tentativa."""
+
+
+class ErroDeterministico(Exception):
+    """Falha que se repetirá em qualquer nova tentativa; não deve ser retentada."""
+
+
+def e_timeout(erro: BaseException) -> bool:
+    """Indica se o erro é um timeout do SOC, do driver ou da rede."""
+    if isinstance(erro, (TimeoutException, socket.timeout, TimeoutError)):
+        return True
+    return any(marcador in str(erro).lower() for marcador in MARCADORES_TIMEOUT)
+
+
+def _mensagem_deterministica(mensagem: Optional[str]) -> bool:
+    mensagem = (mensagem or "").lower()
+    return any(marcador in mensagem for marcador in MARCADORES_DETERMINISTICOS)
+
+
+def classificar_erro(erro: BaseException) -> str:
+    """Classifica o erro como ``TRANSITORIO`` ou ``DETERMINISTICO``.
+
+    Exceções do Selenium e de conexão são transitórias pelo tipo: mensagens
+    como ``web view not found`` descrevem o estado do driver, não do SOC.
+    Os marcadores de mensagem valem só para o texto de alertas do SOC e
+    para as demais exceções.
+    """
+    if isinstance(erro, ErroDeterministico):
+        return DETERMINISTICO
+    if isinstance(erro, ErroTransitorio) or e_timeout(erro):
+        return TRANSITORIO
+
+    if isinstance(erro, UnexpectedAlertPresentException) and _mensagem_deterministica(erro.alert_text):
+        return DETERMINISTICO
+    if isinstance(erro, (StaleElementReferenceException, NoSuchElementException,
+                         NoSuchFrameException, NoSuchWindowException, WebDriverException,
+                         ConnectionError)):
+        return TRANSITORIO
+
+    if _mensagem_deterministica(str(erro)):
+        return DETERMINISTICO
+    if isinstance(erro, OSError):
+        return TRANSITORIO
+    # Demais exceções (ValueError, KeyError, ...) indicam erro de programação ou dados
+    return DETERMINISTICO
+
+
+class Disjuntor:
+    """Disjuntor (circuit breaker) compartilhado entre threads e processos.
+
+    Após ``limite_falhas`` timeouts consecutivos, abre por ``pausa``
+    segundos: ``aguardar_liberacao`` bloqueia todos os chamadores. Vencida a
+    pausa, um único chamador passa como sonda; se ela tiver sucesso o
+    disjuntor fecha, se falhar ele reabre.
+
+    O estado fica em ``multiprocessing.Value``; para compartilhar com
+    workers, passe a instância nos argumentos do processo. Sem valores
+    explícitos, os limites vêm da seção ``retry`` do config.yaml.
+    """
+
+    def __init__(self,
+                 limite_falhas: Optional[int] = None,
+                 pausa: Optional[float] = None,
+                 contexto=None) -> None:
+        config = get_configuracao().retry
+        contexto = contexto or multiprocessing.get_context("spawn")
+        self.limite_falhas = config.limite_falhas_disjuntor if limite_falhas is None else limite_falhas
+        self.pausa = config.pausa_disjuntor if pausa is None else pausa
+        self._falhas = contexto.Value("i", 0)
+        # Instante (time.time) até o qual o disjuntor fica aberto
+        self._aberto_ate = contexto.Value("d", 0.0)
+
+    @property
+    def aberto(self) -> bool:
+        with self._falhas.get_lock():
+            return self._falhas.value >= self.limite_falhas and time.time() < self._aberto_ate.value
+
+    def registrar_sucesso(self) -> None:
+        with self._falhas.get_lock():
+            if self._falhas.value >= self.limite_falhas:
+                get_logger(__name__).info("Disjuntor fechado: SOC voltou a responder")
+            self._falhas.value = 0
+            self._aberto_ate.value = 0.0
+
+    def registrar_timeout(self) -> None:
+        with self._falhas.get_lock():
+            self._falhas.value += 1
+            if self._falhas.value >= self.limite_falhas:
+                self._aberto_ate.value = time.time() + self.pausa
+                get_logger(__name__).warning(
+                    f"Disjuntor aberto após {self._falhas.value} timeout(s); pausando por {self.pausa:.0f}s"
+                )
+
+    def aguardar_liberacao(self) -> float:
+        """Bloqueia enquanto o disjuntor estiver aberto.
+
+        Returns:
+            float: Tempo esperado em segundos
+        """
+        inicio = time.monotonic()
+        while True:
+            with self._falhas.get_lock():
+                if self._falhas.value < self.limite_falhas:
+                    break
+                restante = self._aberto_ate.value - time.time()
+                if restante <= 0:
+                    # Sonda: os demais continuam esperando até o resultado dela
+                    self._aberto_ate.value = time.time() + self.pausa
+                    break
+            time.sleep(min(restante, 1.0))
+        return time.monotonic() - inicio
+
+
+class PoliticaRetry:
+    """Executa operações com novas tentativas, backoff exponencial e jitter.
+
+    Parâmetros não informados vêm da seção ``retry`` do config.yaml.
+
+    Args:
+        tentativas: Número máximo de tentativas (inclui a primeira).
+        base: Espera máxima antes da 2ª tentativa, em segundos.
+        multiplicador: Fator de crescimento da espera a cada tentativa.
+        maximo: Teto da espera entre tentativas.
+        jitter: Se True, a espera é sorteada entre 0 e o teto da tentativa
+            (full jitter), evitando que workers tentem todos ao mesmo tempo.
+        classificar: Função que classifica exceções (ver ``classificar_erro``).
+        disjuntor: Disjuntor consultado antes de cada tentativa (padrão:
+            o disjuntor do processo, ver ``definir_disjuntor``).
+    """
+
+    def __init__(self,
+                 tentativas: Optional[int] = None,
+                 base: Optional[float] = None,
+                 multiplicador: Optional[float] = None,
+                 maximo: Optional[float] = None,
+                 jitter: Optional[bool] = None,
+                 classificar: Callable[[BaseException], str] = classificar_erro,
+                 disjuntor: Optional[Disjuntor] = None) -> None:
+        config = get_configuracao().retry
+        self.tentativas = max(1, config.tentativas if tentativas is None else tentativas)
+        self.base = config.base if base is None else base
+        self.multiplicador = config.multiplicador if multiplicador is None else multiplicador
+        self.maximo = config.maximo if maximo is None else maximo
+        self.jitter = config.jitter if jitter is None else jitter
+        self.classificar = classificar
+        self._disjuntor = disjuntor
+        # Timeouts observados por esta política (sinal de sobrecarga do SOC)
+        self.timeouts = 0
+        self.logger = get_logger(__name__)
+
+    @property
+    def disjuntor(self) -> Optional[Disjuntor]:
+        return self._disjuntor or obter_disjuntor()
+
+    def espera(self, tentativa: int) -> float:
+        """Espera antes da tentativa seguinte à informada (1 = após a primeira)."""
+        teto = min(self.maximo, self.base * self.multiplicador ** (tentativa - 1))
+        return random.uniform(0, teto) if self.jitter else teto
+
+    def executar(self,
+                 func: Callable[[], T],
+                 descricao: str = "operação",
+                 aceitar: Optional[Callable[[T], bool]] = None,
+                 rejeicao_e_timeout: bool = False) -> T:
+        """Executa ``func`` até obter sucesso ou esgotar as tentativas.
+
+        Args:
+            func: Operação sem argumentos.
+            descricao: Nome da operação nos logs.
+            aceitar: Critério de sucesso para o retorno; um retorno rejeitado
+                é tratado como falha transitória. Esgotadas as tentativas, o
+                último retorno é devolvido (sem exceção).
+            rejeicao_e_timeout: Se True, retornos rejeitados contam como
+                timeout no disjuntor (ex: tela que não carregou no prazo).
+
+        Returns:
+            O retorno de ``func``.
+
+        Raises:
+            Exception: O erro determinístico, ou o último erro transitório.
+        """
+        resultado = None
+        for tentativa in range(1, self.tentativas + 1):
+            disjuntor = self.disjuntor
+            if disjuntor:
+                esperado = disjuntor.aguardar_liberacao()
+                if esperado >= 1:
+                    self.logger.info(f"{descricao}: retomando após {esperado:.0f}s de pausa do disjuntor")
+
+            try:
+                resultado = func()
+            except Exception as e:
+                tipo = self.classificar(e)
+                if e_timeout(e):
+                    self.timeouts += 1
+                    if disjuntor:
+                        disjuntor.registrar_timeout()
+                if tipo == DETERMINISTICO:
+                    self.logger.error(f"{descricao}: erro determinístico, sem nova tentativa: {e}")
+                    raise
+                if tentativa == self.tentativas:
+                    self.logger.error(f"{descricao}: falhou após {tentativa} tentativa(s): {e}")
+                    raise
+                self.logger.warning(f"{descricao}: tentativa {tentativa}/{self.tentativas} falhou: {e}")
+            else:
+                if aceitar is None or aceitar(resultado):
+                    if disjuntor:
+                        disjuntor.registrar_sucesso()
+                    return resultado
+                if rejeicao_e_timeout:
+                    self.timeouts += 1
+                    if disjuntor:
+                        disjuntor.registrar_timeout()
+                if tentativa == self.tentativas:
+                    self.logger.warning(f"{descricao}: sem sucesso após {tentativa} tentativa(s)")
+                    return resultado
+                self.logger.warning(f"{descricao}: tentativa {tentativa}/{self.tentativas} sem sucesso")
+
+            time.sleep(self.espera(tentativa))
+        return resultado
+
+
+_disjuntor_processo: Optional[Disjuntor] = None
+_disjuntor_lock = threading.Lock()
+
+
+def definir_disjuntor(disjuntor: Optional[Disjuntor]) -> None:
+    """Define o disjuntor usado pelas políticas do processo (None desativa)."""
+    global _disjuntor_processo
+    with _disjuntor_lock:
+        _disjuntor_processo = disjuntor
+
+
+def obter_disjuntor() -> Optional[Disjuntor]:
+    """Retorna o disjuntor do processo, se definido."""
+    return _disjuntor_processo
@@ -0,0 +1,90 @@
+import threading
+import weakref
+from typing import Dict, Optional
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .config import get_configuracao
+
+# Frame em que o driver está: documento principal da janela ou socframe
+FRAME_PRINCIPAL = ""
+FRAME_SOC = "socframe"
+
+
+class SessionContext:
+    """Estado da sessão SOC compartilhado por todos os objetos de página de um driver.
+
+    Evita repetir operações caras quando o navegador já está no estado
+    desejado (ex: trocar para a empresa em que a sessão já está, ou para o
+    socframe quando o driver já está nele).
+    """
+
+    def __init__(self) -> None:
+        # Empresa selecionada na sessão (None = desconhecida)
+        self.empresa_atual: Optional[str] = None
+        # Índice do menu: número da tela -> script onclick (ver HomePage)
+        self.indice_telas: Optional[Dict[str, str]] = None
+        # Empresa da sessão quando o índice foi construído
+        self.indice_telas_empresa: Optional[str] = None
+        # Janela e frame em que o driver está (None = desconhecido, consultar o driver)
+        self.janela_atual: Optional[str] = None
+        self.frame_atual: Optional[str] = None
+        self._waits: Dict[float, WebDriverWait] = {}
+        self._modal_handler = None
+
+    def reset(self) -> None:
+        """Descarta o estado conhecido (ex: após novo login)."""
+        self.empresa_atual = None
+        self.indice_telas = None
+        self.indice_telas_empresa = None
+        self.janela_atual = None
+        self.frame_atual = None
+
+    def invalidar_navegacao(self) -> None:
+        """Marca o frame como desconhecido após navegação da janela (ex: driver.get, recarga)."""
+        self.frame_atual = None
+
+    def invalidar_janela(self) -> None:
+        """Marca janela e frame como desconhecidos (ex: após erro ao trocar de contexto)."""
+        self.janela_atual = None
+        self.frame_atual = None
+
+    def registrar_janela(self, handle: str) -> None:
+        """Registra a troca de janela; ``switch_to.window`` sempre volta ao documento principal."""
+        self.janela_atual = handle
+        self.frame_atual = FRAME_PRINCIPAL
+
+    def obter_wait(self, driver, timeout: float) -> WebDriverWait:
+        """WebDriverWait do driver para o timeout informado, compartilhado pelas páginas.
+
+        As verificações seguem o intervalo ``browser.intervalo_poll`` do config.yaml.
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(
+                driver, timeout, poll_frequency=get_configuracao().browser.intervalo_poll
+            )
+        return wait
+
+    def obter_modal_handler(self, driver):
+        """ModalHandler do driver, compartilhado para que modais drenados não se percam entre páginas."""
+        if self._modal_handler is None:
+            from ..handlers.modal_handler import ModalHandler
+            self._modal_handler = ModalHandler(driver)
+            # Uma recarga da janela principal descarta o frame em que o driver estava
+            self._modal_handler.observer.ao_navegar = self.invalidar_navegacao
+        return self._modal_handler
+
+
+_contexts: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_session_context(driver) -> SessionContext:
+    """Obtém o contexto de sessão associado ao driver, criando-o se necessário."""
+    with _lock:
+        context = _contexts.get(driver)
+        if context is None:
+            context = SessionContext()
+            _contexts[driver] = context
+        return context
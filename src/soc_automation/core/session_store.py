@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from .logger import get_logger
+
+# Diretório padrão para sessões e chave de criptografia
+DIRETORIO_PADRAO = Path.home() / ".soc_automation" / "sessions"
+
+# Variável de ambiente com a chave Fernet (tem prioridade sobre o arquivo de chave)
+VARIAVEL_CHAVE = "SOC_SESSION_KEY"
+
+_SCRIPT_CAPTURAR_STORAGE = """
+function copiar(storage) {
+    var dados = {};
+    for (var i = 0; i < storage.length; i++) {
+        var chave = storage.key(i);
+        dados[chave] = storage.getItem(chave);
+    }
+    return dados;
+}
+return {url: window.top.location.href,
+        local: copiar(window.top.localStorage),
+        session: copiar(window.top.sessionStorage)};
+"""
+
+_SCRIPT_RESTAURAR_STORAGE = """
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+"""
+
+
+class SessionStore:
+    """Armazena sessões autenticadas do SOC em arquivos criptografados.
+
+    Cada sessão (cookies, localStorage e sessionStorage) é identificada por
+    usuário, empresa e, opcionalmente, pelo navegador dono (``sessao``).
+    Navegadores simultâneos na mesma conta devem usar ``sessao`` distintos:
+    com o mesmo arquivo, todos restaurariam o mesmo cookie de servidor e
+    compartilhariam a empresa selecionada. A chave Fernet vem de ``SOC_SESSION_KEY`` ou de um
+    arquivo ``session.key`` criado no diretório com permissão 0600.
+    """
+
+    def __init__(self, directory: Optional[str] = None, key: Optional[bytes] = None) -> None:
+        self.logger = get_logger(__name__)
+        self.directory = Path(directory) if directory else DIRETORIO_PADRAO
+        self._key = key
+
+    def _fernet(self) -> Fernet:
+        """Obtém o objeto Fernet, criando a chave em disco se necessário."""
+        if self._key is None:
+            env_key = os.environ.get(VARIAVEL_CHAVE)
+            if env_key:
+                self._key = env_key.encode()
+            else:
+                self._key = self._load_or_create_key()
+        return Fernet(self._key)
+
+    def _load_or_create_key(self) -> bytes:
+        """Lê a chave do disco ou cria uma nova com permissão restrita.
+
+        Vários workers podem iniciar ao mesmo tempo: a chave é gravada em um
+        arquivo temporário e publicada de forma atômica sem sobrescrever a de
+        outro processo; todos usam a chave que ficou no disco.
+        """
+        key_path = self.directory / "session.key"
+        try:
+            key = key_path.read_bytes().strip()
+            if key:
+                return key
+        except FileNotFoundError:
+            pass
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = key_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(Fernet.generate_key())
+        try:
+            # link não sobrescreve: se outro processo publicou antes, vale a chave dele
+            os.link(tmp_path, key_path)
+            self.logger.info(f"Chave de sessão criada em {key_path}")
+        except FileExistsError:
+            pass
+        except OSError:
+            # Sistema de arquivos sem hard links
+            if not key_path.exists():
+                os.replace(tmp_path, key_path)
+        finally:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+        return key_path.read_bytes().strip()
+
+    def _session_path(self, username: str, company_id: str, sessao: Optional[str] = None) -> Path:
+        chave = f"{username}|{company_id}" if sessao is None else f"{username}|{company_id}|{sessao}"
+        identificador = hashlib.sha256(chave.encode()).hexdigest()[:24]
+        return self.directory / f"{identificador}.session"
+
+    def save(self, driver, username: str, company_id: str, sessao: Optional[str] = None) -> None:
+        """Salva cookies e storages da sessão atual do driver.
+
+        Args:
+            driver: Driver com sessão SOC autenticada.
+            username: Usuário da sessão.
+            company_id: Empresa da sessão.
+            sessao: Identificador do navegador dono da sessão (ex: worker).
+        """
+        try:
+            storage = driver.execute_script(_SCRIPT_CAPTURAR_STORAGE)
+            data = {
+                "saved_at": time.time(),
+                "url": storage["url"],
+                "cookies": driver.get_cookies(),
+                "local_storage": storage["local"],
+                "session_storage": storage["session"],
+            }
+            token = self._fernet().encrypt(json.dumps(data).encode())
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._session_path(username, company_id, sessao)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp_path, path)
+            self.logger.info("Sessão SOC salva em cache")
+        except Exception as e:
+            self.logger.warning(f"Não foi possível salvar a sessão: {str(e)}")
+
+    def load(self, username: str, company_id: str, sessao: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Carrega a sessão salva, ou None se não existir ou for inválida."""
+        path = self._session_path(username, company_id, sessao)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(self._fernet().decrypt(path.read_bytes()))
+        except (InvalidToken, ValueError) as e:
+            self.logger.warning(f"Sessão em cache inválida, descartando: {str(e)}")
+            self.delete(username, company_id, sessao)
+            return None
+
+    def restore(self, driver, username: str, company_id: str, sessao: Optional[str] = None) -> bool:
+        """Injeta a sessão salva no driver.
+
+        O driver deve estar em uma página do domínio do SOC (ex: tela de login),
+        pois cookies só podem ser definidos para o domínio atual. Ao final o
+        driver é levado à URL salva; a validade da sessão deve ser conferida
+        pelo chamador.
+
+        Returns:
+            bool: True se havia sessão salva e ela foi injetada
+        """
+        data = self.load(username, company_id, sessao)
+        if not data:
+            return False
+
+        try:
+            driver.delete_all_cookies()
+            for cookie in data["cookies"]:
+                # O Chrome rejeita valores de sameSite fora do padrão
+                if cookie.get("sameSite") not in (None, "Strict", "Lax", "None"):
+                    del cookie["sameSite"]
+                driver.add_cookie(cookie)
+            driver.execute_script(_SCRIPT_RESTAURAR_STORAGE, data["local_storage"], data["session_storage"])
+            driver.get(data["url"])
+            self.logger.info("Sessão SOC restaurada do cache")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Não foi possível restaurar a sessão: {str(e)}")
+            return False
+
+    def delete(self, username: str, company_id: str, sessao: Optional[str] = None) -> None:
+        """Remove a sessão salva."""
+        path = self._session_path(username, company_id, sessao)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,207 @@
+"""Watchdog de memória e reciclagem do navegador em workers de longa duração.
+
+Mede o RSS da árvore de processos do chromedriver (chromedriver + Chrome e
+seus processos filhos) e o número de janelas abertas. Em um ponto seguro
+(entre jobs), fecha janelas popup esquecidas e, após ``max_operacoes`` ou
+acima de ``max_memoria_mb``, recicla o ``Browser``: encerra, reinicia e
+restaura a sessão.
+
+O RSS vem do psutil quando instalado e, sem ele, de /proc (Linux). O RSS
+somado conta páginas compartilhadas mais de uma vez; serve como tendência,
+não como consumo exato.
+
+Exemplo:
+    watchdog = WatchdogNavegador(browser, max_operacoes=200, max_memoria_mb=1500)
+    for job in jobs:
+        executar(job)
+        watchdog.registrar_operacao()
+        watchdog.verificar()
+"""
+import os
+import time
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from .logger import get_logger
+from .metrics import get_metricas
+from .session_context import get_session_context
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+MAX_OPERACOES_PADRAO = 200
+MAX_MEMORIA_MB_PADRAO = 1500
+# Janelas acima deste número indicam popups esquecidos; o excedente é fechado
+MAX_JANELAS_PADRAO = 1
+
+
+def _arvore_proc(pid: int) -> List[int]:
+    """PIDs do processo e de todos os descendentes, lendo /proc."""
+    filhos: Dict[int, List[int]] = {}
+    for entrada in os.listdir("/proc"):
+        if not entrada.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entrada}/stat", "rb") as f:
+                # O nome do processo (campo 2) pode conter espaços; o ppid vem após o ')'
+                ppid = int(f.read().rsplit(b")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        filhos.setdefault(ppid, []).append(int(entrada))
+
+    arvore, pendentes = [], [pid]
+    while pendentes:
+        atual = pendentes.pop()
+        arvore.append(atual)
+        pendentes.extend(filhos.get(atual, ()))
+    return arvore
+
+
+def _rss_proc(pids: List[int]) -> int:
+    pagina = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                total += int(f.read().split()[1]) * pagina
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+def rss_arvore(pid: int) -> Optional[int]:
+    """RSS somado (bytes) do processo e de seus descendentes.
+
+    Returns:
+        Optional[int]: RSS em bytes, ou None se não houver psutil nem /proc
+    """
+    if psutil is not None:
+        try:
+            raiz = psutil.Process(pid)
+            processos = [raiz] + raiz.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for processo in processos:
+            try:
+                total += processo.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    if os.path.isdir("/proc"):
+        return _rss_proc(_arvore_proc(pid))
+    return None
+
+
+class WatchdogNavegador:
+    """Recicla o navegador de um worker por número de operações ou memória.
+
+    Args:
+        browser: ``Browser`` vigiado (deve ter feito login, para a restauração).
+        max_operacoes: Operações (jobs) até a reciclagem (0 desativa).
+        max_memoria_mb: RSS da árvore do chromedriver que dispara a reciclagem (0 desativa).
+        max_janelas: Janelas mantidas abertas; as excedentes são fechadas.
+    """
+
+    def __init__(self,
+                 browser,
+                 max_operacoes: int = MAX_OPERACOES_PADRAO,
+                 max_memoria_mb: int = MAX_MEMORIA_MB_PADRAO,
+                 max_janelas: int = MAX_JANELAS_PADRAO) -> None:
+        self.browser = browser
+        self.max_operacoes = max_operacoes
+        self.max_memoria_mb = max_memoria_mb
+        self.max_janelas = max(1, max_janelas)
+        self.operacoes = 0
+        self.reciclagens = 0
+        self.logger = get_logger(__name__)
+
+    def registrar_operacao(self) -> None:
+        self.operacoes += 1
+
+    def memoria_mb(self) -> Optional[float]:
+        """RSS atual da árvore do chromedriver em MB (None se não mensurável)."""
+        try:
+            pid = self.browser.driver.service.process.pid
+        except AttributeError:
+            return None
+        rss = rss_arvore(pid)
+        return rss / (1024 * 1024) if rss is not None else None
+
+    def fechar_janelas_excedentes(self) -> int:
+        """Fecha janelas além de ``max_janelas``, mantendo a janela atual (ou a primeira).
+
+        Returns:
+            int: Número de janelas fechadas
+        """
+        driver = self.browser.driver
+        handles = driver.window_handles
+        if len(handles) <= self.max_janelas:
+            return 0
+
+        contexto = get_session_context(driver)
+        principal = contexto.janela_atual if contexto.janela_atual in handles else handles[0]
+        manter = [principal] + [h for h in handles if h != principal][:self.max_janelas - 1]
+        fechadas = 0
+        for handle in handles:
+            if handle not in manter:
+                driver.switch_to.window(handle)
+                driver.close()
+                fechadas += 1
+        driver.switch_to.window(principal)
+        contexto.registrar_janela(principal)
+        self.logger.warning(f"{fechadas} janela(s) esquecida(s) fechada(s)")
+        return fechadas
+
+    def motivo_reciclagem(self) -> Optional[str]:
+        """Motivo para reciclar agora, ou None se o navegador pode continuar."""
+        if self.max_operacoes and self.operacoes >= self.max_operacoes:
+            return f"{self.operacoes} operações"
+        if self.max_memoria_mb:
+            memoria = self.memoria_mb()
+            if memoria is not None and memoria >= self.max_memoria_mb:
+                return f"memória {memoria:.0f} MB"
+        return None
+
+    def verificar(self) -> bool:
+        """Ponto seguro entre jobs: fecha popups esquecidos e recicla se necessário.
+
+        Returns:
+            bool: True se o navegador foi reciclado
+        """
+        if not self.browser.driver:
+            return False
+        try:
+            self.fechar_janelas_excedentes()
+        except WebDriverException as e:
+            self.logger.warning(f"Erro ao fechar janelas excedentes: {str(e)}")
+
+        motivo = self.motivo_reciclagem()
+        if not motivo:
+            return False
+        return self.reciclar(motivo)
+
+    def reciclar(self, motivo: str = "manual") -> bool:
+        """Reinicia o navegador e restaura a sessão.
+
+        Returns:
+            bool: True se a sessão foi restaurada
+        """
+        self.logger.info(f"Reciclando navegador ({motivo})")
+        inicio = time.perf_counter()
+        try:
+            sucesso = self.browser.restart()
+        except Exception as e:
+            # O próximo job refaz o login via ensure_session
+            self.logger.error(f"Erro ao reciclar navegador: {str(e)}")
+            sucesso = False
+        get_metricas().observar("reciclagem", time.perf_counter() - inicio,
+                                resultado="ok" if sucesso else "falha")
+        self.operacoes = 0
+        self.reciclagens += 1
+        if not sucesso:
+            self.logger.error("Sessão não restaurada após reciclar o navegador")
+        return sucesso
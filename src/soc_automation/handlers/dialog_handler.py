@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from ..core.logger import get_logger
+
+# Modais do SOC observados na janela principal e no socframe
+MODAIS_MONITORADOS = ("modalalertas", "alertaErroTransferencia", "modalTransfFuncionario")
+
+# Instala o observador (se ainda não estiver no documento) e esvazia a fila.
+# O observador grava aberturas de modais em window.top.__socFilaDialogos;
+# o socframe é reinstrumentado a cada 'load' do frame. 'novo' indica que a
+# janela principal carregou um documento desde a última drenagem.
+_SCRIPT_DRENAR = """
+var ids = arguments[0];
+var topo = window.top;
+var novo = !topo.document.__socObservador;
+if (!topo.__socFilaDialogos) { topo.__socFilaDialogos = []; }
+
+function visivel(el) {
+    var estilo = el.ownerDocument.defaultView.getComputedStyle(el);
+    return estilo.display !== 'none' && estilo.visibility !== 'hidden'
+        && el.getClientRects().length > 0;
+}
+
+function texto(el) {
+    var alvo = el.querySelector('#modalalertasConteudo, #conteudosTable, .modalConteudo') || el;
+    return (alvo.innerText || alvo.textContent || '').trim();
+}
+
+function instrumentar(win, origem) {
+    try {
+        var doc = win.document;
+        if (!doc || !doc.documentElement || doc.__socObservador) { return; }
+        doc.__socObservador = true;
+        var verificar = function () {
+            ids.forEach(function (id) {
+                var el = doc.getElementById(id);
+                var aberto = !!el && visivel(el);
+                if (aberto && !el.__socRegistrado) {
+                    el.__socRegistrado = true;
+                    topo.__socFilaDialogos.push({id: id, origem: origem, el: el, timestamp: Date.now()});
+                } else if (el && !aberto) {
+                    el.__socRegistrado = false;
+                }
+            });
+        };
+        new win.MutationObserver(verificar).observe(doc.documentElement, {
+            childList: true, subtree: true, attributes: true, attributeFilter: ['style', 'class']
+        });
+        verificar();
+    } catch (e) {
+        // Documento em transição ou de outra origem; será instrumentado no próximo 'load'
+    }
+}
+
+instrumentar(topo, 'principal');
+var frame = topo.document.getElementById('socframe') || topo.document.getElementsByName('socframe')[0];
+if (frame) {
+    if (!frame.__socObservado) {
+        frame.__socObservado = true;
+        frame.addEventListener('load', function () { instrumentar(frame.contentWindow, 'socframe'); });
+    }
+    if (frame.contentWindow) { instrumentar(frame.contentWindow, 'socframe'); }
+}
+
+var fila = topo.__socFilaDialogos;
+return {novo: novo, eventos: fila.splice(0, fila.length).map(function (evento) {
+    return {id: evento.id, origem: evento.origem, mensagem: texto(evento.el), timestamp: evento.timestamp};
+})};
+"""
+
+
+@dataclass
+class DialogEvent:
+    """Abertura de um modal registrada pelo observador."""
+
+    id: str
+    origem: str
+    mensagem: str
+    timestamp: float
+
+
+class DialogObserver:
+    """Observa modais do SOC via MutationObserver injetado na página.
+
+    O observador roda no navegador e registra aberturas de modais em uma
+    fila JavaScript. ``drain`` instala o observador quando necessário e
+    esvazia a fila em um único ``execute_script``, sem esperas quando não
+    há modais. Se a janela principal tiver carregado um novo documento desde
+    a última drenagem, ``ao_navegar`` é chamado.
+    """
+
+    def __init__(self, driver, modal_ids: Sequence[str] = MODAIS_MONITORADOS) -> None:
+        self.driver = driver
+        self.logger = get_logger(__name__)
+        self.modal_ids = list(modal_ids)
+        self.ao_navegar: Optional[Callable[[], None]] = None
+
+    def drain(self) -> List[DialogEvent]:
+        """Retorna (e remove da fila) os modais abertos desde a última chamada."""
+        resultado = self.driver.execute_script(_SCRIPT_DRENAR, self.modal_ids) or {}
+        if resultado.get("novo") and self.ao_navegar:
+            self.ao_navegar()
+        return [DialogEvent(**evento) for evento in resultado.get("eventos", [])]
@@ -1,41 +1,89 @@
+from typing import List, Optional
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
+from ..core.config import get_configuracao
 from ..core.logger import get_logger
+from ..core.metrics import get_metricas
+from .dialog_handler import DialogEvent, DialogObserver
+from .popup_handler import PopupHandler
 
 
 class ModalHandler:
-    """Handler para modais/alertas do sistema SOC."""
-    
-    def __init__(self, driver, timeout: int = 2):
+    """Handler para modais/alertas do sistema SOC.
+
+    A detecção usa o ``DialogObserver`` injetado na página, então verificar
+    quando não há modal custa uma única chamada e nenhuma espera.
+    """
+
+    def __init__(self, driver, timeout: Optional[float] = None):
         self.driver = driver
         self.logger = get_logger(__name__)
-        self.wait = WebDriverWait(driver, timeout)
-    
+        config = get_configuracao().browser
+        if timeout is None:
+            timeout = config.timeout_modal
+        self.wait = WebDriverWait(driver, timeout, poll_frequency=config.intervalo_poll)
+        self.observer = DialogObserver(driver)
+        self.popup_handler = PopupHandler(driver)
+        self._pending: List[DialogEvent] = []
+
+    def modal_detected(self):
+        """Condição para ``wait_utils.esperar``: algum modal foi aberto.
+
+        Os eventos drenados ficam pendentes até o próximo ``check_and_handle_modal``.
+        """
+        def _condicao(driver):
+            self._pending.extend(self.observer.drain())
+            return bool(self._pending)
+        return _condicao
+
     def check_and_handle_modal(self) -> tuple[bool, str]:
         """Verifica e lida com modais de alerta.
-        
+
         Returns:
             tuple[bool, str]: (modal_found, message)
         """
+        with get_metricas().span("modal", encontrado="nao") as span:
+            try:
+                events = self._pending + self.observer.drain()
+            except WebDriverException as e:
+                self.logger.debug(f"Observador de modais indisponível ({e}); usando verificação direta")
+                span.rotulos["verificacao"] = "direta"
+                modal_found, message = self._check_modal_directly()
+                span.rotulos["encontrado"] = "sim" if modal_found else "nao"
+                return modal_found, message
+            self._pending = []
+
+            if not events:
+                return False, ""
+
+            span.rotulos["encontrado"] = "sim"
+            self.popup_handler.dismiss(events)
+            message = " | ".join(e.mensagem for e in events if e.mensagem)
+            self.logger.warning(f"Modal detectado: {message}")
+            return True, message
+
+    def _check_modal_directly(self) -> tuple[bool, str]:
+        """Verificação por espera explícita, usada quando o script não pode rodar."""
         try:
             modal = self.wait.until(
                 EC.presence_of_element_located((By.ID, "modalalertas"))
             )
-            
+
             # Pega a mensagem do modal
             message_element = modal.find_element(By.ID, "modalalertasConteudo")
             message = message_element.text
-            
+
             self.logger.warning(f"Modal detectado: {message}")
-            
+
             # Clica no botão OK
             ok_button = modal.find_element(By.ID, "btn_ok")
             ok_button.click()
-            
+
             return True, message
-            
+
         except TimeoutException:
-            return False, ""
\ No newline at end of file
+            return False, ""
@@ -0,0 +1,57 @@
+from typing import List
+
+from ..core.logger import get_logger
+from .dialog_handler import DialogEvent
+
+# Fecha, em uma única chamada, os modais informados em cada documento de origem
+_SCRIPT_FECHAR = """
+var topo = window.top;
+var frame = topo.document.getElementById('socframe') || topo.document.getElementsByName('socframe')[0];
+var fechados = [];
+arguments[0].forEach(function (evento) {
+    var win = evento.origem === 'socframe' && frame ? frame.contentWindow : topo;
+    try {
+        var el = win.document.getElementById(evento.id);
+        if (!el) { return; }
+        if (evento.id === 'alertaErroTransferencia' && typeof win.fecharErroTransferencia === 'function') {
+            win.fecharErroTransferencia();
+            fechados.push(evento.id);
+            return;
+        }
+        var botao = el.querySelector('#btn_ok') || el.querySelector('.botaoT');
+        if (botao) {
+            botao.click();
+            fechados.push(evento.id);
+        }
+    } catch (e) {}
+});
+return fechados;
+"""
+
+
+class PopupHandler:
+    """Fecha os modais detectados pelo ``DialogObserver``."""
+
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.logger = get_logger(__name__)
+
+    def dismiss(self, events: List[DialogEvent]) -> List[str]:
+        """Fecha os modais dos eventos informados.
+
+        Args:
+            events: Eventos retornados por ``DialogObserver.drain``.
+
+        Returns:
+            IDs dos modais efetivamente fechados.
+        """
+        if not events:
+            return []
+
+        payload = [{"id": e.id, "origem": e.origem} for e in events]
+        fechados = self.driver.execute_script(_SCRIPT_FECHAR, payload) or []
+
+        for event in events:
+            if event.id not in fechados:
+                self.logger.warning(f"Não foi possível fechar o modal {event.id}")
+        return fechados
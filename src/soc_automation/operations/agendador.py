@@ -0,0 +1,69 @@
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, Optional, Set
+
+from ..utils.html_utils import normalizar_empresa
+from .models import TransferenciaJob
+
+
+class AgendadorAfinidade:
+    """Distribui jobs de transferência agrupados por empresa de origem.
+
+    Cada worker recebe preferencialmente jobs da empresa em que sua sessão
+    já está, evitando ``HomePage.change_company``. Quando a empresa do
+    worker se esgota, ele recebe jobs sem empresa de origem e, em seguida,
+    o grupo com menos workers atendendo (o maior, em caso de empate).
+
+    Empresas são comparadas pelo código (ver ``html_utils.normalizar_empresa``),
+    de modo que o texto de ``infoEmpresa`` informado em ``registrar_empresa``
+    corresponde ao ``empresa_origem`` dos jobs.
+    """
+
+    def __init__(self, jobs: Iterable[TransferenciaJob]) -> None:
+        self._grupos: "OrderedDict[Optional[str], Deque[TransferenciaJob]]" = OrderedDict()
+        for job in jobs:
+            self._grupos.setdefault(self._empresa(job), deque()).append(job)
+        self._atendentes: Dict[Optional[str], Set[int]] = {}
+        self._empresa_worker: Dict[int, Optional[str]] = {}
+
+    @staticmethod
+    def _empresa(job: TransferenciaJob) -> Optional[str]:
+        return normalizar_empresa(job.empresa_origem)
+
+    def pendentes(self) -> int:
+        return sum(len(fila) for fila in self._grupos.values())
+
+    def devolver(self, job: TransferenciaJob) -> None:
+        """Recoloca um job não executado no início do seu grupo."""
+        self._grupos.setdefault(self._empresa(job), deque()).appendleft(job)
+
+    def registrar_empresa(self, worker_id: int, empresa: Optional[str]) -> None:
+        """Atualiza a empresa em que a sessão do worker está."""
+        empresa = normalizar_empresa(empresa)
+        if empresa is not None:
+            self._empresa_worker[worker_id] = empresa
+
+    def proximo(self, worker_id: int) -> Optional[TransferenciaJob]:
+        """Escolhe o próximo job para o worker, ou None se não houver pendentes."""
+        empresa = self._empresa_worker.get(worker_id)
+
+        if self._grupos.get(empresa):
+            grupo = empresa
+        elif self._grupos.get(None):
+            grupo = None
+        else:
+            candidatos = [e for e, fila in self._grupos.items() if fila]
+            if not candidatos:
+                return None
+            grupo = min(
+                candidatos,
+                key=lambda e: (len(self._atendentes.get(e, ())), -len(self._grupos[e]))
+            )
+
+        # Jobs sem empresa de origem não mudam a empresa da sessão
+        if grupo is not None:
+            if empresa is not None and grupo != empresa:
+                self._atendentes.get(empresa, set()).discard(worker_id)
+            self._atendentes.setdefault(grupo, set()).add(worker_id)
+            self._empresa_worker[worker_id] = grupo
+
+        return self._grupos[grupo].popleft()
@@ -0,0 +1,112 @@
+import math
+import statistics
+import time
+from typing import Dict, List, Optional, Sequence
+
+from ..core.logger import get_logger
+from .models import ResultadoJob
+
+# Esperas cuja latência indica a carga do SOC: busca (doAcao('browse') até a
+# tabela renderizar) e confirmação do 'save'. São as esperas medidas por
+# ``FuncionarioOperations`` (ESPERA_*), sem retries nem backoff das etapas
+ETAPAS_MONITORADAS = ("resultados_busca", "confirmacao_save")
+
+# Latência mediana acima de referência * FATOR_LATENCIA indica sobrecarga
+FATOR_LATENCIA = 1.5
+
+# Fração de jobs com timeout acima da qual o SOC é considerado sobrecarregado
+LIMIAR_TIMEOUTS = 0.2
+
+# Redução multiplicativa do alvo de workers ao detectar sobrecarga
+FATOR_REDUCAO = 0.5
+
+# Crescimento máximo da referência de latência por janela, para que ela
+# acompanhe mudanças duradouras do SOC (ex: fechamento de mês)
+DERIVA_REFERENCIA = 0.05
+
+
+class ControladorConcorrencia:
+    """Ajusta o número de workers ativos por AIMD a partir da latência observada.
+
+    A cada janela de resultados (ao menos um por worker ativo), compara a
+    mediana de cada etapa monitorada com a referência (a menor mediana já
+    vista, que sobe lentamente) e a fração de jobs com timeout: sem sinais de
+    sobrecarga o alvo cresce um worker (aumento aditivo); com sobrecarga ele
+    é multiplicado por ``fator_reducao`` (redução multiplicativa).
+
+    Args:
+        maximo: Número máximo de workers ativos.
+        minimo: Número mínimo de workers ativos.
+        inicial: Alvo inicial (padrão: metade do máximo).
+        etapas: Chaves de ``duracoes_etapas`` monitoradas.
+        fator_latencia: Razão mediana/referência que indica sobrecarga.
+        limiar_timeouts: Fração de jobs com timeout que indica sobrecarga.
+        fator_reducao: Fator aplicado ao alvo na sobrecarga.
+    """
+
+    def __init__(self,
+                 maximo: int,
+                 minimo: int = 1,
+                 inicial: Optional[int] = None,
+                 etapas: Sequence[str] = ETAPAS_MONITORADAS,
+                 fator_latencia: float = FATOR_LATENCIA,
+                 limiar_timeouts: float = LIMIAR_TIMEOUTS,
+                 fator_reducao: float = FATOR_REDUCAO) -> None:
+        self.maximo = max(1, maximo)
+        self.minimo = max(1, min(minimo, self.maximo))
+        alvo = inicial if inicial is not None else math.ceil(self.maximo / 2)
+        self.alvo = max(self.minimo, min(self.maximo, alvo))
+        self.etapas = tuple(etapas)
+        self.fator_latencia = fator_latencia
+        self.limiar_timeouts = limiar_timeouts
+        self.fator_reducao = fator_reducao
+        self.referencia: Dict[str, float] = {}
+        self._janela: List[ResultadoJob] = []
+        self._inicio_janela = time.monotonic()
+        self.logger = get_logger(__name__)
+
+    def registrar(self, resultado: ResultadoJob) -> int:
+        """Registra o resultado de um job e, ao fechar uma janela, reavalia o alvo.
+
+        Returns:
+            int: Alvo de workers ativos após o registro
+        """
+        self._janela.append(resultado)
+        if len(self._janela) >= max(3, self.alvo):
+            self._avaliar()
+        return self.alvo
+
+    def _avaliar(self) -> None:
+        janela, self._janela = self._janela, []
+        duracao = time.monotonic() - self._inicio_janela
+        self._inicio_janela = time.monotonic()
+
+        medianas = {}
+        for etapa in self.etapas:
+            valores = [r.duracoes_etapas[etapa] for r in janela if etapa in r.duracoes_etapas]
+            if valores:
+                medianas[etapa] = statistics.median(valores)
+
+        lentas = []
+        for etapa, mediana in medianas.items():
+            referencia = self.referencia.get(etapa)
+            if referencia is not None and mediana > referencia * self.fator_latencia:
+                lentas.append(f"{etapa} {mediana:.2f}s (ref. {referencia:.2f}s)")
+            self.referencia[etapa] = (
+                mediana if referencia is None else min(mediana, referencia * (1 + DERIVA_REFERENCIA))
+            )
+
+        com_timeout = sum(1 for r in janela if r.timeouts) / len(janela)
+        throughput = len(janela) * 60.0 / duracao if duracao > 0 else 0.0
+        anterior = self.alvo
+
+        if lentas or com_timeout > self.limiar_timeouts:
+            self.alvo = max(self.minimo, min(self.alvo - 1, int(self.alvo * self.fator_reducao)))
+            motivo = ", ".join(lentas) or f"{com_timeout:.0%} dos jobs com timeout"
+            if self.alvo != anterior:
+                self.logger.warning(f"Sobrecarga do SOC ({motivo}): workers ativos {anterior} -> {self.alvo}")
+        elif self.alvo < self.maximo:
+            self.alvo += 1
+            self.logger.info(
+                f"SOC estável ({throughput:.1f} jobs/min na janela): workers ativos {anterior} -> {self.alvo}"
+            )
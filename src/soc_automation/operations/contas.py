@@ -0,0 +1,91 @@
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import Credenciais
+
+# Perfis do Chrome por conta e sessão (cookies e cache isolados)
+DIRETORIO_PERFIS_PADRAO = Path.home() / ".soc_automation" / "perfis"
+
+
+@dataclass(frozen=True)
+class Conta:
+    """Conta de serviço do SOC e o limite de sessões simultâneas com ela."""
+
+    credenciais: Credenciais
+    max_sessoes: int = 1
+
+    @property
+    def nome(self) -> str:
+        return self.credenciais.username
+
+
+def _nome_seguro(valor: str) -> str:
+    return re.sub(r"[^\w.-]", "_", valor) or "_"
+
+
+class RegistroContas:
+    """Associa cada worker a uma conta, respeitando o limite de sessões de cada uma.
+
+    Cada sessão recebe um diretório de perfil do Chrome próprio
+    (``<diretorio_perfis>/<conta>_<empresa>/sessao_<n>``), isolando cookies
+    entre contas e entre sessões da mesma conta. As reservas escolhem a
+    conta com menor ocupação proporcional, distribuindo os workers (e,
+    portanto, os jobs) entre as contas.
+
+    Usado pelo processo que despacha o lote; não é compartilhado com os workers.
+    """
+
+    def __init__(self, contas: Iterable[Conta], diretorio_perfis: Optional[str] = None) -> None:
+        self.contas: List[Conta] = list(contas)
+        if not self.contas:
+            raise ValueError("Nenhuma conta informada")
+        invalidas = [conta.nome for conta in self.contas if conta.max_sessoes < 1]
+        if invalidas:
+            raise ValueError(f"max_sessoes deve ser ao menos 1: {', '.join(invalidas)}")
+        self.diretorio_perfis = Path(diretorio_perfis) if diretorio_perfis else DIRETORIO_PERFIS_PADRAO
+        # worker_id -> (conta, índice da sessão na conta)
+        self._sessoes: Dict[int, Tuple[Conta, int]] = {}
+
+    @property
+    def capacidade(self) -> int:
+        """Sessões simultâneas permitidas somando todas as contas."""
+        return sum(conta.max_sessoes for conta in self.contas)
+
+    def sessoes_ativas(self, conta: Conta) -> int:
+        return sum(1 for reservada, _ in self._sessoes.values() if reservada == conta)
+
+    def reservar(self, worker_id: int) -> Optional[Tuple[Conta, str]]:
+        """Reserva uma sessão para o worker na conta menos ocupada.
+
+        Returns:
+            Optional[Tuple[Conta, str]]: Conta e diretório de perfil, ou None
+                se todas as contas estiverem no limite
+        """
+        if worker_id in self._sessoes:
+            conta, sessao = self._sessoes[worker_id]
+            return conta, self.diretorio_perfil(conta, sessao)
+
+        disponiveis = [conta for conta in self.contas if self.sessoes_ativas(conta) < conta.max_sessoes]
+        if not disponiveis:
+            return None
+        conta = min(disponiveis, key=lambda c: (self.sessoes_ativas(c) / c.max_sessoes, -c.max_sessoes))
+
+        em_uso = {sessao for reservada, sessao in self._sessoes.values() if reservada == conta}
+        sessao = min(set(range(conta.max_sessoes)) - em_uso)
+        self._sessoes[worker_id] = (conta, sessao)
+        return conta, self.diretorio_perfil(conta, sessao)
+
+    def liberar(self, worker_id: int) -> None:
+        """Libera a sessão reservada pelo worker (se houver)."""
+        self._sessoes.pop(worker_id, None)
+
+    def conta_do_worker(self, worker_id: int) -> Optional[Conta]:
+        reserva = self._sessoes.get(worker_id)
+        return reserva[0] if reserva else None
+
+    def diretorio_perfil(self, conta: Conta, sessao: int) -> str:
+        """Diretório de perfil do Chrome da sessão ``sessao`` da conta."""
+        pasta_conta = f"{_nome_seguro(conta.nome)}_{_nome_seguro(conta.credenciais.company_id)}"
+        return str(self.diretorio_perfis / pasta_conta / f"sessao_{sessao}")
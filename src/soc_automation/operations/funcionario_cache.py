@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from .models import FuncionarioEncontrado
+
+# Padrões do cache compartilhado pelo processo
+MAX_ENTRADAS_PADRAO = 5000
+TTL_PADRAO = 30 * 60
+
+ChaveCache = Tuple[str, str, str]
+
+
+class FuncionarioCache:
+    """Índice local (LRU com TTL) de buscas de funcionário já resolvidas.
+
+    Mapeia (empresa, tipo de busca, termo) para o funcionário encontrado,
+    incluindo o ``selbrowse_id``, permitindo pular o ``doAcao('browse')``
+    em buscas repetidas. Seguro para uso entre threads.
+    """
+
+    def __init__(self, max_entradas: int = MAX_ENTRADAS_PADRAO, ttl: float = TTL_PADRAO) -> None:
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self._dados: "OrderedDict[ChaveCache, Tuple[float, FuncionarioEncontrado]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def _chave(empresa: Optional[str], tipo_busca: str, termo_busca: str) -> ChaveCache:
+        return (empresa or "", tipo_busca, termo_busca.strip().lower())
+
+    def obter(self, empresa: Optional[str], tipo_busca: str, termo_busca: str) -> Optional[FuncionarioEncontrado]:
+        """Retorna o funcionário em cache, ou None se ausente ou expirado."""
+        chave = self._chave(empresa, tipo_busca, termo_busca)
+        with self._lock:
+            entrada = self._dados.get(chave)
+            if entrada is None or time.monotonic() - entrada[0] > self.ttl:
+                self._dados.pop(chave, None)
+                self.falhas += 1
+                return None
+            self._dados.move_to_end(chave)
+            self.acertos += 1
+            return entrada[1]
+
+    def registrar(self,
+                  empresa: Optional[str],
+                  tipo_busca: str,
+                  termo_busca: str,
+                  funcionario: FuncionarioEncontrado) -> None:
+        """Registra o resultado de uma busca, removendo o item menos usado se cheio."""
+        if not funcionario.selbrowse_id:
+            return
+        chave = self._chave(empresa, tipo_busca, termo_busca)
+        with self._lock:
+            self._dados[chave] = (time.monotonic(), funcionario)
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.max_entradas:
+                self._dados.popitem(last=False)
+
+    def invalidar(self, empresa: Optional[str], tipo_busca: str, termo_busca: str) -> None:
+        """Remove uma busca do cache."""
+        with self._lock:
+            self._dados.pop(self._chave(empresa, tipo_busca, termo_busca), None)
+
+    def invalidar_funcionario(self, codigo: str) -> None:
+        """Remove todas as buscas que resolveram para o código informado."""
+        with self._lock:
+            for chave in [c for c, (_, f) in self._dados.items() if f.codigo == codigo]:
+                del self._dados[chave]
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._dados.clear()
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+
+_cache_padrao: Optional[FuncionarioCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_funcionario_cache() -> FuncionarioCache:
+    """Obtém o cache de funcionários compartilhado pelo processo."""
+    global _cache_padrao
+    with _cache_lock:
+        if _cache_padrao is None:
+            _cache_padrao = FuncionarioCache()
+        return _cache_padrao
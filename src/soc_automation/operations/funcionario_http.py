@@ -0,0 +1,368 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin
+
+import urllib3
+
+from ..core.config import get_configuracao
+from ..core.logger import get_logger
+from ..utils.html_utils import ler_pagina
+from .funcionario_operations import FILTROS_PADRAO, FuncionarioOperations
+from .models import FuncionarioEncontrado
+
+# Trechos de href/onclick do link de próxima página (ver SELETOR_PROXIMA_PAGINA)
+MARCADORES_PROXIMA_PAGINA = ("proximaPagina", "doAcao('proxima')")
+
+# Conexões mantidas por host no pool keep-alive
+MAX_CONEXOES_PADRAO = 4
+
+_RE_CHARSET = re.compile(r"charset=([\w.:-]+)", re.IGNORECASE)
+
+# Executa a ação informada (ex: doAcao('browse')) no socframe com submit()
+# interceptado, capturando action, método e campos que seriam enviados,
+# além de name/value de cada checkbox e radio (marcado ou não). alert()
+# é suprimido durante a captura para não bloquear o driver.
+_SCRIPT_CAPTURAR_FORMULARIO = """
+var doc = window.top.document;
+var frame = doc.getElementById('socframe') || doc.getElementsByName('socframe')[0];
+if (!frame || !frame.contentWindow) { return null; }
+var win = frame.contentWindow;
+var proto = win.HTMLFormElement.prototype;
+var submitOriginal = proto.submit;
+var alertOriginal = win.alert;
+var capturado = null;
+proto.submit = function () {
+    var campos = [];
+    var controles = {};
+    for (var i = 0; i < this.elements.length; i++) {
+        var el = this.elements[i];
+        var tipo = (el.type || '').toLowerCase();
+        if (tipo === 'checkbox' || tipo === 'radio') {
+            var controle = [el.name, el.value, tipo];
+            if (el.id) { controles[el.id] = controle; }
+            if (tipo === 'checkbox' && el.name && !controles[el.name]) { controles[el.name] = controle; }
+        }
+        if (!el.name || el.disabled) { continue; }
+        if (['button', 'submit', 'reset', 'file', 'image'].indexOf(tipo) >= 0) { continue; }
+        if ((tipo === 'checkbox' || tipo === 'radio') && !el.checked) { continue; }
+        if (el.tagName === 'SELECT' && el.multiple) {
+            for (var j = 0; j < el.options.length; j++) {
+                if (el.options[j].selected) { campos.push([el.name, el.options[j].value]); }
+            }
+            continue;
+        }
+        campos.push([el.name, el.value]);
+    }
+    capturado = {
+        action: this.action || win.location.href,
+        metodo: (this.method || 'post').toUpperCase(),
+        campos: campos,
+        controles: controles,
+        charset: win.document.characterSet || 'ISO-8859-1',
+        url: win.location.href
+    };
+};
+win.alert = function () {};
+try {
+    win.eval(arguments[0]);
+} finally {
+    proto.submit = submitOriginal;
+    win.alert = alertOriginal;
+}
+return capturado;
+"""
+
+
+class ConsultaHttpError(Exception):
+    """Erro em uma consulta HTTP ao SOC."""
+
+
+class SessaoHttpExpirada(ConsultaHttpError):
+    """A sessão emprestada do navegador não é mais aceita pelo SOC."""
+
+
+@dataclass
+class FormularioSOC:
+    """Formulário de uma tela do SOC, capturado no momento do submit.
+
+    ``controles`` mapeia ID (ou name, para checkboxes) de cada checkbox e
+    radio para ``[name, value, tipo]``, permitindo marcar ou desmarcar
+    campos que não estavam marcados na captura.
+    """
+
+    action: str
+    metodo: str = "POST"
+    campos: List[Tuple[str, str]] = field(default_factory=list)
+    controles: Dict[str, List[str]] = field(default_factory=dict)
+    charset: str = "ISO-8859-1"
+    url: Optional[str] = None
+
+    def com_estados(self, estados: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Retorna os campos do formulário com os estados aplicados.
+
+        Segue as regras de ``aplicar_estado_formulario``: checkbox e radio
+        por ID recebem bool; grupo de radios por name e demais campos
+        recebem o valor.
+        """
+        campos = list(self.campos)
+        for chave, desejado in estados.items():
+            controle = self.controles.get(chave)
+            if controle and controle[2] == "checkbox":
+                nome, valor = controle[0], controle[1]
+                campos = [c for c in campos if c != (nome, valor)]
+                if desejado:
+                    campos.append((nome, valor))
+            elif controle and controle[2] == "radio":
+                if desejado:
+                    campos = [c for c in campos if c[0] != controle[0]]
+                    campos.append((controle[0], controle[1]))
+            else:
+                campos = [c for c in campos if c[0] != chave]
+                campos.append((chave, str(desejado)))
+        return campos
+
+
+class FuncionarioHttp:
+    """Consultas somente leitura ao SOC via HTTP, sem renderizar páginas.
+
+    Usa os cookies de uma sessão já autenticada e reenvia o formulário da
+    tela 232, capturado do navegador, por um pool keep-alive de conexões
+    (``urllib3``). Os resultados têm os mesmos tipos do caminho Selenium
+    (``FuncionarioOperations.buscar_funcionarios``, ``HomePage``), então o
+    chamador pode alternar entre os modos.
+
+    Com ``alternativo`` (um ``FuncionarioOperations``), falhas da consulta
+    HTTP, como sessão expirada ou resposta de erro, fazem a consulta seguir
+    pelo navegador em vez de propagar o erro.
+
+    Exemplo:
+        with FuncionarioHttp.from_browser(browser) as consulta:
+            for funcionario in consulta.buscar_funcionarios("846.872.660-59", "cpf"):
+                print(funcionario.codigo, funcionario.nome)
+    """
+
+    def __init__(self,
+                 formulario: FormularioSOC,
+                 cookies: Dict[str, str],
+                 url_principal: str,
+                 user_agent: Optional[str] = None,
+                 timeout: Optional[float] = None,
+                 max_conexoes: int = MAX_CONEXOES_PADRAO,
+                 alternativo: Optional[FuncionarioOperations] = None) -> None:
+        """
+        Args:
+            formulario: Formulário de busca da tela 232 (ver ``from_browser``)
+            cookies: Cookies da sessão autenticada
+            url_principal: URL da janela principal do SOC (com infoPrograma/infoEmpresa)
+            user_agent: User-Agent do navegador que originou a sessão
+            timeout: Tempo máximo de cada requisição em segundos (padrão: ``browser.timeout``)
+            max_conexoes: Conexões keep-alive mantidas por host
+            alternativo: Operações Selenium usadas quando a consulta HTTP falha
+        """
+        self.logger = get_logger(__name__)
+        self.formulario = formulario
+        self.url_principal = url_principal
+        self.timeout = get_configuracao().browser.timeout if timeout is None else timeout
+        self.alternativo = alternativo
+        self._cookies = dict(cookies)
+        self._lock = threading.Lock()
+        cabecalhos = {"User-Agent": user_agent} if user_agent else {}
+        self._pool = urllib3.PoolManager(maxsize=max_conexoes, block=False, headers=cabecalhos, retries=False)
+
+    @classmethod
+    def from_browser(cls, browser, **kwargs: Any) -> "FuncionarioHttp":
+        """Cria a consulta a partir de um ``Browser`` logado.
+
+        Abre a tela 232 no navegador, captura o formulário de busca e copia
+        os cookies da sessão. Depois disso o navegador fica livre, exceto
+        quando usado como alternativa às consultas HTTP que falharem
+        (``alternativo``, por padrão as operações do próprio navegador).
+
+        Raises:
+            ConsultaHttpError: Se a tela 232 ou o formulário não puderem ser lidos
+        """
+        from ..pages.home_page import HomePage
+
+        driver = browser.driver
+        home_page = HomePage(driver)
+        if not home_page.navigate_to_screen_by_number("232"):
+            raise ConsultaHttpError("Não foi possível abrir a tela 232 para capturar o formulário")
+
+        home_page.switch_to_default_frame()
+        dados = driver.execute_script(_SCRIPT_CAPTURAR_FORMULARIO, "doAcao('browse');")
+        if not dados:
+            raise ConsultaHttpError("Formulário de busca da tela 232 não capturado")
+
+        formulario = FormularioSOC(
+            action=dados["action"],
+            metodo=dados["metodo"],
+            campos=[(nome, valor) for nome, valor in dados["campos"]],
+            controles=dados["controles"],
+            charset=dados["charset"],
+            url=dados["url"],
+        )
+        cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+        url_principal = driver.execute_script("return window.top.location.href;")
+        user_agent = driver.execute_script("return navigator.userAgent;")
+        kwargs.setdefault("alternativo", browser.get_funcionario_operations())
+        return cls(formulario, cookies, url_principal, user_agent=user_agent, **kwargs)
+
+    def _cabecalho_cookies(self) -> str:
+        with self._lock:
+            return "; ".join(f"{nome}={valor}" for nome, valor in self._cookies.items())
+
+    def _atualizar_cookies(self, resposta) -> None:
+        for cabecalho in resposta.headers.getlist("Set-Cookie"):
+            cookie = SimpleCookie()
+            cookie.load(cabecalho)
+            with self._lock:
+                for nome, morsel in cookie.items():
+                    self._cookies[nome] = morsel.value
+
+    def _enviar(self, metodo: str, url: str, campos: Optional[List[Tuple[str, str]]] = None) -> str:
+        """Envia a requisição e retorna o HTML decodificado.
+
+        Raises:
+            SessaoHttpExpirada: Se o SOC redirecionar ou recusar a sessão
+            ConsultaHttpError: Em qualquer outra resposta de erro
+        """
+        cabecalhos = {"Cookie": self._cabecalho_cookies()}
+        if self.formulario.url:
+            cabecalhos["Referer"] = self.formulario.url
+
+        corpo = None
+        if campos is not None and metodo == "GET":
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(campos, encoding=self.formulario.charset)}"
+        elif campos is not None:
+            corpo = urlencode(campos, encoding=self.formulario.charset)
+            cabecalhos["Content-Type"] = "application/x-www-form-urlencoded"
+
+        try:
+            resposta = self._pool.request(
+                metodo, url, body=corpo, headers=cabecalhos, redirect=False, timeout=self.timeout
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise ConsultaHttpError(f"Falha na requisição a {url}: {str(e)}") from e
+
+        self._atualizar_cookies(resposta)
+        if resposta.status in (301, 302, 303, 401, 403):
+            raise SessaoHttpExpirada(f"SOC respondeu {resposta.status} para {url}")
+        if resposta.status >= 400:
+            raise ConsultaHttpError(f"SOC respondeu {resposta.status} para {url}")
+
+        charset = _RE_CHARSET.search(resposta.headers.get("Content-Type", ""))
+        return resposta.data.decode(charset.group(1) if charset else self.formulario.charset, errors="replace")
+
+    @staticmethod
+    def _verificar_sessao(pagina) -> None:
+        if "usu" in pagina.ids and "senha" in pagina.ids:
+            raise SessaoHttpExpirada("SOC retornou a página de login")
+
+    def _usar_alternativo(self, erro: ConsultaHttpError) -> FuncionarioOperations:
+        """Retorna as operações Selenium para seguir a consulta, ou propaga o erro."""
+        if self.alternativo is None:
+            raise erro
+        self.logger.warning(f"Consulta HTTP falhou ({str(erro)}); seguindo pelo navegador")
+        browser = getattr(self.alternativo, "browser", None)
+        if isinstance(erro, SessaoHttpExpirada) and browser is not None:
+            browser.ensure_session()
+        return self.alternativo
+
+    def buscar_funcionarios(self,
+                            termo_busca: str,
+                            tipo_busca: str = "nome",
+                            filtros: Optional[Dict[str, bool]] = None,
+                            max_paginas: Optional[int] = None) -> Iterator[FuncionarioEncontrado]:
+        """Busca funcionários na tela 232 via HTTP.
+
+        A busca é feita na empresa em que a sessão estava ao capturar o
+        formulário. Só links de paginação com URL simples são seguidos; se
+        a próxima página depender de JavaScript, a busca para na página
+        atual (use o caminho Selenium para percorrer todas).
+
+        Args:
+            termo_busca: Termo para buscar o funcionário
+            tipo_busca: Tipo de busca (ver ``FuncionarioOperations.TIPOS_BUSCA``)
+            filtros: Dicionário com filtros (ativo, inativo, pendente, afastado, ferias)
+            max_paginas: Limite de páginas a percorrer (None = todas)
+
+        Yields:
+            FuncionarioEncontrado: Um registro por linha de resultado
+
+        Raises:
+            ConsultaHttpError: Se a consulta HTTP falhar e não houver ``alternativo``
+        """
+        entregues = set()
+        try:
+            for funcionario in self._buscar_http(termo_busca, tipo_busca, filtros, max_paginas):
+                entregues.add(funcionario.codigo)
+                yield funcionario
+        except ConsultaHttpError as e:
+            alternativo = self._usar_alternativo(e)
+            # Registros já entregues pelo HTTP não são repetidos
+            for funcionario in alternativo.buscar_funcionarios(
+                termo_busca, tipo_busca, filtros, max_paginas=max_paginas
+            ):
+                if funcionario.codigo not in entregues:
+                    yield funcionario
+
+    def _buscar_http(self,
+                     termo_busca: str,
+                     tipo_busca: str,
+                     filtros: Optional[Dict[str, bool]],
+                     max_paginas: Optional[int]) -> Iterator[FuncionarioEncontrado]:
+        estados: Dict[str, Any] = {}
+        if tipo_busca in FuncionarioOperations.TIPOS_BUSCA:
+            estados["codigoPesquisaFuncionario"] = FuncionarioOperations.TIPOS_BUSCA[tipo_busca]
+        estados.update(FILTROS_PADRAO)
+        if filtros:
+            estados.update(filtros)
+        estados["nomeSeach"] = termo_busca
+
+        html = self._enviar(self.formulario.metodo, self.formulario.action, self.formulario.com_estados(estados))
+        pagina = 1
+        while True:
+            dados = ler_pagina(html, marcadores_proxima=MARCADORES_PROXIMA_PAGINA)
+            self._verificar_sessao(dados)
+            if dados.resultados is None:
+                self.logger.warning("Tabela de resultados não encontrada na resposta")
+                return
+
+            self.logger.info(f"Página {pagina} (HTTP): {len(dados.resultados)} funcionário(s)")
+            for registro in dados.resultados:
+                yield FuncionarioEncontrado(**registro)
+
+            if not dados.proxima or (max_paginas and pagina >= max_paginas):
+                return
+            if "(" in dados.proxima:
+                self.logger.warning("Paginação via JavaScript não suportada no modo HTTP; parando na página atual")
+                return
+
+            html = self._enviar("GET", urljoin(self.formulario.url or self.formulario.action, dados.proxima))
+            pagina += 1
+
+    def get_current_screen_info(self) -> Tuple[str, str]:
+        """Lê infoPrograma e infoEmpresa da janela principal (ver ``BasePage``)."""
+        try:
+            dados = ler_pagina(self._enviar("GET", self.url_principal), ids_texto=("infoPrograma", "infoEmpresa"))
+            self._verificar_sessao(dados)
+        except ConsultaHttpError as e:
+            return self._usar_alternativo(e).home_page.get_current_screen_info()
+        return dados.textos.get("infoPrograma", ""), dados.textos.get("infoEmpresa", "")
+
+    def get_current_company(self) -> str:
+        """Retorna o texto de infoEmpresa (ver ``HomePage.get_current_company``)."""
+        return self.get_current_screen_info()[1]
+
+    def close(self) -> None:
+        """Fecha as conexões do pool."""
+        self._pool.clear()
+
+    def __enter__(self) -> "FuncionarioHttp":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
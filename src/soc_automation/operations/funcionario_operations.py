@@ -1,13 +1,115 @@
-import time
-from typing import Dict, Optional, Any, Union, Tuple
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Any, Union, Tuple
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
+from ..core.artefatos import ArmazemArtefatos, get_artefatos
+from ..core.config import get_configuracao
 from ..core.logger import get_logger
+from ..core.metrics import get_metricas
+from ..core.retry import PoliticaRetry
 from ..pages.home_page import HomePage
-from ..handlers.modal_handler import ModalHandler
+from ..utils.element_utils import aplicar_estado_formulario, divergencias_formulario
+from .funcionario_cache import FuncionarioCache, get_funcionario_cache
+from .journal import (
+    ETAPA_CONFIGURADO,
+    ETAPA_DESTINO_DEFINIDO,
+    ETAPA_FALHOU,
+    ETAPA_INCERTO,
+    ETAPA_LOCALIZADO,
+    ETAPA_PREPARADO,
+    ETAPA_SALVANDO,
+    ETAPA_SALVO,
+    JournalTransferencias,
+)
+from .models import FuncionarioEncontrado
+from ..utils.wait_utils import (
+    alerta_presente,
+    checkbox_presente,
+    documento_pronto,
+    elemento_presente,
+    esperar_opcional,
+    janela_fechada,
+    janela_popup_aberta,
+    janela_recarregada,
+    marcar_janela,
+    marcar_socframe,
+    qualquer,
+    socframe_recarregado,
+    tabela_resultados_renderizada,
+    texto_presente,
+)
+
+# Situações incluídas na busca quando o chamador não informa filtros
+FILTROS_PADRAO = {
+    "ativo": True,
+    "inativo": True,
+    "pendente": True,
+    "afastado": True,
+    "ferias": True
+}
+
+# Nome do span de cada etapa de transferir (método que a executa)
+SPANS_ETAPAS = {
+    ETAPA_PREPARADO: "preparar_ambiente",
+    ETAPA_LOCALIZADO: "localizar_funcionario",
+    ETAPA_CONFIGURADO: "configurar_transferencia",
+    ETAPA_DESTINO_DEFINIDO: "definir_destino",
+    ETAPA_SALVO: "finalizar_transferencia",
+}
+
+# Esperas pela resposta do SOC, medidas à parte das etapas (sem retries nem backoff):
+# do doAcao('browse') até a tabela de resultados e do aceite do 'save' até a recarga
+ESPERA_RESULTADOS_BUSCA = "resultados_busca"
+ESPERA_CONFIRMACAO_SAVE = "confirmacao_save"
+
+# Link de próxima página da tabela de resultados; ajustar se a paginação do SOC mudar
+SELETOR_PROXIMA_PAGINA = (
+    "a[href*='proximaPagina'], a[onclick*='proximaPagina'], "
+    "a[href*=\"doAcao('proxima')\"], a[onclick*=\"doAcao('proxima')\"]"
+)
+
+# Extrai todas as linhas de table.resultados e o script da próxima página em uma chamada
+_SCRIPT_EXTRAIR_RESULTADOS = """
+var tabela = document.querySelector('table.resultados');
+if (!tabela) { return null; }
+var registros = [];
+var linhas = tabela.querySelectorAll('tr');
+for (var i = 1; i < linhas.length; i++) {
+    var linha = linhas[i];
+    var link = linha.querySelector('td.codigo a');
+    if (!link) { continue; }
+    var celulas = linha.cells;
+    var href = link.getAttribute('href') || '';
+    var id = href.match(/selbrowse\\('([^']*)'\\)/);
+    var celulaSituacao = linha.querySelector('td.situacao') || (celulas.length > 2 ? celulas[celulas.length - 1] : null);
+    registros.push({
+        codigo: (link.textContent || '').trim(),
+        nome: celulas.length > 1 ? (celulas[1].textContent || '').trim() : '',
+        situacao: celulaSituacao ? (celulaSituacao.textContent || '').trim() : '',
+        selbrowse_id: id ? id[1] : null
+    });
+}
+var proxima = document.querySelector(arguments[0]);
+var script = null;
+if (proxima) {
+    script = proxima.getAttribute('onclick') || proxima.getAttribute('href') || null;
+    if (script && script.indexOf('javascript:') === 0) { script = script.substring(11); }
+}
+return {registros: registros, proxima: script};
+"""
+
+# Confere se o cadastro aberto no socframe é do funcionário esperado (código ou nome)
+_SCRIPT_CONFERIR_CADASTRO = """
+var codigo = arguments[0], nome = (arguments[1] || '').trim().toLowerCase();
+var campos = document.querySelectorAll("input[name='codigo'], input[name='codigoFuncionario']");
+for (var i = 0; i < campos.length; i++) {
+    if ((campos[i].value || '').trim() === codigo) { return true; }
+}
+var texto = ((document.body && document.body.textContent) || '').toLowerCase();
+return nome.length > 0 && texto.indexOf(nome) >= 0;
+"""
 
 
 class FuncionarioOperations:
@@ -31,14 +133,36 @@ class FuncionarioOperations:
         "pis": "rbNit"
     }
     
-    def __init__(self, browser) -> None:
+    def __init__(self,
+                 browser,
+                 timeout: Optional[float] = None,
+                 cache: Optional[FuncionarioCache] = None,
+                 journal: Optional[JournalTransferencias] = None,
+                 politica_retry: Optional[PoliticaRetry] = None,
+                 artefatos: Optional[ArmazemArtefatos] = None) -> None:
         self.browser = browser
         self.driver = browser.driver
         self.home_page = HomePage(self.driver)
         self.logger = get_logger(__name__)
-        self.modal_handler = ModalHandler(self.driver)
-        self.wait = WebDriverWait(self.driver, 10)
+        self.modal_handler = self.home_page.modal_handler
+        config = get_configuracao().browser
+        self.timeout = config.timeout if timeout is None else timeout
+        self.timeout_curto = config.timeout_curto
+        self.wait = self.home_page.context.obter_wait(self.driver, self.timeout)
         self.main_window = None
+        self._resultados: List[FuncionarioEncontrado] = []
+        self._funcionario_selecionado: Optional[FuncionarioEncontrado] = None
+        self.cache = cache or get_funcionario_cache()
+        self.trocas_empresa = 0
+        self.trocas_evitadas = 0
+        self.journal = journal
+        self.job_id: Optional[str] = None
+        # Duração (s) de cada etapa executada, pelo nome do span
+        self.duracoes_etapas: Dict[str, float] = {}
+        # True a partir do registro de ``salvando`` no journal (ver ``_registrar_falha``)
+        self._save_iniciado = False
+        self.politica_retry = politica_retry or PoliticaRetry()
+        self.artefatos = artefatos or get_artefatos()
         
     def transferir(self, 
                   termo_busca: str, 
@@ -51,9 +175,13 @@ class FuncionarioOperations:
                   copiar_historico_vacinas: bool = True, 
                   copiar_historico_laboral: bool = True, 
                   copiar_socged: bool = True, 
-                  migrar_somente_ficha: bool = True) -> bool:
+                  migrar_somente_ficha: bool = True,
+                  job_id: Optional[str] = None) -> bool:
         """Transfere um funcionário para outra empresa/unidade.
         
+        Com um journal configurado, a conclusão de cada etapa é gravada com
+        o ``job_id`` (ver ``operations.journal``).
+        
         Args:
             termo_busca: Termo para buscar o funcionário
             tipo_busca: Tipo de busca (nome, codigo, rg, cpf, matricula, pis, registro_rh, nome_social)
@@ -66,97 +194,233 @@ class FuncionarioOperations:
             copiar_historico_laboral: Se deve copiar o histórico laboral
             copiar_socged: Se deve copiar o SocGed
             migrar_somente_ficha: Se deve migrar somente a ficha
+            job_id: Identificador do job no journal (opcional)
             
         Returns:
             bool: True se transferência concluída com sucesso
         """
-        self.logger.info(f"Iniciando transferência do funcionário: {termo_busca}")
-        
-        try:
-            # Guarda a janela principal para referência
-            self.main_window = self.driver.current_window_handle
-            self.logger.info(f"Janela principal: {self.main_window}")
-            
-            if not self._preparar_ambiente(empresa_origem):
-                return False
-                
-            if not self._localizar_funcionario(termo_busca, tipo_busca, filtros):
-                return False
-                
-            if not self._configurar_transferencia(
-                    copiar_ficha_clinica, 
-                    copiar_cadastro_medico,
-                    copiar_historico_vacinas, 
-                    copiar_historico_laboral,
-                    copiar_socged, 
-                    migrar_somente_ficha):
-                return False
-                
-            if not self._definir_destino(empresa_destino, termo_busca, tipo_busca):
-                return False
+        with get_metricas().span("transferir") as span:
+            try:
+                etapas = self.etapas_transferencia(
+                    termo_busca, tipo_busca, filtros, empresa_origem, empresa_destino,
+                    copiar_ficha_clinica, copiar_cadastro_medico, copiar_historico_vacinas,
+                    copiar_historico_laboral, copiar_socged, migrar_somente_ficha, job_id
+                )
+                for etapa, executar in etapas:
+                    if not self.executar_etapa(etapa, executar):
+                        span.falhou()
+                        return False
+                    
+                return True
                 
-            if not self._finalizar_transferencia():
+            except Exception as e:
+                self.abortar_transferencia(str(e))
+                span.falhou()
                 return False
-                
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Erro na transferência: {str(e)}")
+    
+    def etapas_transferencia(self,
+                             termo_busca: str,
+                             tipo_busca: str = "nome",
+                             filtros: Optional[Dict[str, bool]] = None,
+                             empresa_origem: Optional[str] = None,
+                             empresa_destino: Optional[str] = None,
+                             copiar_ficha_clinica: bool = True,
+                             copiar_cadastro_medico: bool = True,
+                             copiar_historico_vacinas: bool = True,
+                             copiar_historico_laboral: bool = True,
+                             copiar_socged: bool = True,
+                             migrar_somente_ficha: bool = True,
+                             job_id: Optional[str] = None) -> List[Tuple[str, Callable[[], bool]]]:
+        """Lista as etapas de ``transferir`` sem executá-las.
+        
+        Permite que um chamador (ex: ``AsyncBrowser``) execute as etapas uma
+        a uma com ``executar_etapa``, podendo interromper entre elas.
+        
+        Returns:
+            List[Tuple[str, Callable[[], bool]]]: Pares (etapa concluída, função da etapa)
+        """
+        self.logger.info(f"Iniciando transferência do funcionário: {termo_busca}")
+        self.job_id = job_id
+        self.duracoes_etapas = {}
+        self._save_iniciado = False
+        return [
+            (ETAPA_PREPARADO, lambda: self._preparar_ambiente(empresa_origem)),
+            (ETAPA_LOCALIZADO, lambda: self._localizar_funcionario(termo_busca, tipo_busca, filtros)),
+            (ETAPA_CONFIGURADO, lambda: self._configurar_transferencia(
+                copiar_ficha_clinica,
+                copiar_cadastro_medico,
+                copiar_historico_vacinas,
+                copiar_historico_laboral,
+                copiar_socged,
+                migrar_somente_ficha)),
+            (ETAPA_DESTINO_DEFINIDO, lambda: self._definir_destino(empresa_destino, termo_busca, tipo_busca)),
+            (ETAPA_SALVO, lambda: self._salvar_transferencia(termo_busca, tipo_busca)),
+        ]
+    
+    def executar_etapa(self, etapa: str, executar: Callable[[], bool]) -> bool:
+        """Executa uma etapa de ``etapas_transferencia``, medindo-a e registrando o resultado no journal."""
+        nome = SPANS_ETAPAS.get(etapa, etapa)
+        with get_metricas().span("transferir_etapa", etapa=nome) as span:
+            concluida = executar()
+            if not concluida:
+                span.falhou()
+        self.duracoes_etapas[nome] = span.duracao
+        if not concluida:
+            self._registrar_falha(f"Falha antes da etapa '{etapa}'")
+            self._capturar_falha(etapa, "Etapa não concluída")
+            return False
+        self._registrar_etapa(etapa)
+        return True
+    
+    def abortar_transferencia(self, erro: str, recuperar_contexto: bool = True) -> None:
+        """Registra uma transferência interrompida por erro.
+        
+        Args:
+            erro: Descrição do erro
+            recuperar_contexto: Se deve voltar à janela principal (False se o driver foi encerrado)
+        """
+        self.logger.error(f"Erro na transferência: {erro}")
+        self._registrar_falha(erro)
+        if recuperar_contexto:
+            self._capturar_falha(ETAPA_FALHOU, erro)
             self._garantir_contexto_principal()
+    
+    @property
+    def _empresa_atual(self) -> Optional[str]:
+        """Empresa da sessão, lida do ``SessionContext`` do driver (chave do cache de buscas)."""
+        return self.home_page.context.empresa_atual
+    
+    def _salvar_transferencia(self, termo_busca: str, tipo_busca: str) -> bool:
+        """Registra a intenção de salvar e finaliza a transferência."""
+        # Gravado antes do 'save' para que uma retomada não repita uma transferência já efetivada
+        self._registrar_etapa(ETAPA_SALVANDO)
+        # Após o save o funcionário muda de empresa; a entrada do cache deixa de valer
+        self.cache.invalidar(self._empresa_atual, tipo_busca, termo_busca)
+        if not self._finalizar_transferencia():
             return False
+        # Descarta também as buscas por outros termos que resolviam para o mesmo funcionário
+        if self._funcionario_selecionado:
+            self.cache.invalidar_funcionario(self._funcionario_selecionado.codigo)
+        return True
+    
+    @contextmanager
+    def _medir_espera(self, espera: str) -> Iterator[None]:
+        """Mede uma espera pelo SOC (span ``espera_soc``) e guarda a duração em ``duracoes_etapas``."""
+        with get_metricas().span("espera_soc", espera=espera) as span:
+            yield
+        self.duracoes_etapas[espera] = span.duracao
+    
+    def _registrar_falha(self, erro: str) -> None:
+        """Grava a falha no journal: ``incerto`` se o 'save' já foi iniciado, senão ``falhou``."""
+        if self._save_iniciado:
+            self.logger.warning(f"Falha após o início do 'save'; transferência pendente de verificação: {erro}")
+            self._registrar_etapa(ETAPA_INCERTO, erro=erro)
+        else:
+            self._registrar_etapa(ETAPA_FALHOU, erro=erro)
+    
+    def _registrar_etapa(self, etapa: str, **dados: Any) -> None:
+        """Grava a etapa no journal, se houver journal e job_id."""
+        if etapa == ETAPA_SALVANDO:
+            self._save_iniciado = True
+        if self.journal and self.job_id:
+            try:
+                self.journal.registrar(self.job_id, etapa, **dados)
+            except OSError as e:
+                self.logger.error(f"Erro ao gravar journal ({etapa}): {str(e)}")
+            
+    def _capturar_falha(self, etapa: str, erro: str) -> None:
+        """Captura screenshot, DOM e log recente; a gravação ocorre em segundo plano."""
+        self.artefatos.capturar(self.driver, self.job_id, etapa, erro)
             
     def _garantir_contexto_principal(self) -> None:
-        """Garante que estamos no contexto da janela principal."""
+        """Garante que estamos no socframe da janela principal.
+        
+        A janela e o frame atuais vêm do ``SessionContext``; quando o driver
+        já está no socframe da janela principal, nenhuma chamada é feita.
+        """
         try:
-            handles = self.driver.window_handles
-            
-            # Se houver mais de uma janela e não estivermos na principal
-            if len(handles) > 1 and self.main_window and self.driver.current_window_handle != self.main_window:
-                # Fecha outras janelas exceto a principal
-                current = self.driver.current_window_handle
-                for handle in handles:
-                    if handle != self.main_window:
-                        self.driver.switch_to.window(handle)
-                        self.driver.close()
-                
-                # Volta para janela principal
-                self.driver.switch_to.window(self.main_window)
-                self.logger.info("Contexto restaurado para janela principal")
+            # Se não estivermos na janela principal, fecha as demais e volta para ela
+            if self.main_window and self.home_page.current_window() != self.main_window:
+                handles = self.driver.window_handles
+                if len(handles) > 1:
+                    for handle in handles:
+                        if handle != self.main_window:
+                            self.driver.switch_to.window(handle)
+                            self.driver.close()
+                    
+                    self.home_page.switch_to_window(self.main_window)
+                    self.logger.info("Contexto restaurado para janela principal")
             
-            # Se só temos uma janela, garantimos que voltamos ao frame correto
-            self.home_page.switch_to_default_frame()
             self.home_page.switch_to_soc_frame()
             
         except Exception as e:
+            self.home_page.context.invalidar_janela()
             self.logger.error(f"Erro ao restaurar contexto: {str(e)}")
             
     def _preparar_ambiente(self, empresa_origem: Optional[str]) -> bool:
         """Prepara o ambiente para transferência."""
         try:
-            if empresa_origem:
-                self.logger.info(f"Mudando para empresa de origem: {empresa_origem}")
-                self.home_page.change_company(empresa_origem)
-                time.sleep(2)
+            # Guarda a janela principal para referência
+            self.main_window = self.home_page.current_window()
+            self.logger.info(f"Janela principal: {self.main_window}")
             
-            self.home_page.navigate_to_screen_by_number("232")
-            time.sleep(2)
+            # Contexto novo (ex: navegador reciclado): lê a empresa em vez de presumir uma troca
+            if self._empresa_atual is None:
+                self.home_page.sincronizar_empresa()
+            
+            if empresa_origem:
+                if self.home_page.ensure_company(empresa_origem):
+                    self.logger.info(f"Mudou para empresa de origem: {empresa_origem}")
+                    self.trocas_empresa += 1
+                else:
+                    self.trocas_evitadas += 1
+            
+            if self._tela_busca_ativa():
+                self.logger.info("Tela 232 já está aberta, navegação evitada")
+            else:
+                self.home_page.navigate_to_screen_by_number("232")
             self.home_page.switch_to_soc_frame()
             return True
         except Exception as e:
             self.logger.error(f"Erro ao preparar ambiente: {str(e)}")
             return False
     
+    def _tela_busca_ativa(self) -> bool:
+        """Verifica, em uma chamada, se a tela 232 com o formulário de busca está aberta."""
+        script = """
+        var doc = window.top.document;
+        var info = doc.getElementById('infoPrograma');
+        var frame = doc.getElementById('socframe') || doc.getElementsByName('socframe')[0];
+        if (!info || !frame || !frame.contentDocument) { return false; }
+        return (info.textContent || '').trim().indexOf('232') === 0
+            && frame.contentDocument.getElementsByName('nomeSeach').length > 0
+            && !frame.contentDocument.querySelector('table.resultados');
+        """
+        try:
+            return bool(self.driver.execute_script(script))
+        except Exception:
+            return False
+    
     def _localizar_funcionario(self, 
                               termo_busca: str, 
                               tipo_busca: str = "nome", 
                               filtros: Optional[Dict[str, bool]] = None) -> bool:
-        """Localiza e seleciona o funcionário na tela."""
+        """Localiza e seleciona o funcionário na tela.
+        
+        Usa o cache de buscas quando possível, indo direto ao selbrowse(id)
+        sem executar o 'browse'.
+        """
         try:
+            if self._localizar_pelo_cache(termo_busca, tipo_busca):
+                return True
+            
             if not self._buscar_funcionario(termo_busca, tipo_busca, filtros):
                 return False
                 
             if not self._selecionar_primeiro_funcionario():
                 return False
+            
+            self.cache.registrar(self._empresa_atual, tipo_busca, termo_busca, self._resultados[0])
                 
             if not self._iniciar_transferencia():
                 return False
@@ -166,6 +430,32 @@ class FuncionarioOperations:
             self.logger.error(f"Erro ao localizar funcionário: {str(e)}")
             return False
     
+    def _localizar_pelo_cache(self, termo_busca: str, tipo_busca: str) -> bool:
+        """Seleciona o funcionário a partir do cache, sem nova busca.
+        
+        Returns:
+            bool: True se o funcionário foi selecionado e a transferência iniciada
+        """
+        funcionario = self.cache.obter(self._empresa_atual, tipo_busca, termo_busca)
+        if not funcionario:
+            return False
+        
+        self.logger.info(f"Funcionário em cache: {funcionario.nome} (Código: {funcionario.codigo})")
+        try:
+            if (self._selecionar_funcionario(funcionario, exigir_recarga=True)
+                    and self._cadastro_confere(funcionario)
+                    and self._iniciar_transferencia(exigir_confirmacao=True)):
+                return True
+        except Exception as e:
+            self.logger.warning(f"Falha ao usar funcionário em cache: {str(e)}")
+        
+        # Entrada inválida: descarta e volta à tela 232 para a busca completa
+        self.cache.invalidar(self._empresa_atual, tipo_busca, termo_busca)
+        self._garantir_contexto_principal()
+        self.home_page.navigate_to_screen_by_number("232")
+        self.home_page.switch_to_soc_frame()
+        return False
+    
     def _configurar_transferencia(self, 
                                  copiar_ficha_clinica: bool, 
                                  copiar_cadastro_medico: bool,
@@ -178,32 +468,19 @@ class FuncionarioOperations:
             # Garante que estamos no contexto correto
             self._garantir_contexto_principal()
             
-            # Tenta até 3 vezes entrar no modo de alteração
-            for tentativa in range(3):
-                try:
-                    self.logger.info(f"Tentativa {tentativa+1} de configuração: executando 'alt'")
-                    self.driver.execute_script("doAcao('alt');")
-                    time.sleep(3)  # Espera mais tempo
-                    
-                    # Verifica se algum modal apareceu
-                    modal_found, modal_message = self.modal_handler.check_and_handle_modal()
-                    if modal_found:
-                        self.logger.info(f"Modal tratado: {modal_message}")
-                    
-                    # Verifica se conseguimos entrar no modo de edição procurando por um dos checkboxes
-                    checkboxes = self.driver.find_elements(By.ID, "copiaFichaClinica")
-                    if checkboxes and len(checkboxes) > 0:
-                        self.logger.info("Modo de edição ativado com sucesso")
-                        break
-                    else:
-                        self.logger.warning("Não foi possível confirmar o modo de edição")
-                        # Tira screenshot para debug
-                        screenshot_path = f"erro_transferencia_{int(time.time())}.png"
-                        self.driver.save_screenshot(screenshot_path)
-                        self.logger.info(f"Screenshot salvo em {screenshot_path}")
-                except Exception as e:
-                    self.logger.warning(f"Erro na tentativa {tentativa+1}: {str(e)}")
-                    time.sleep(2)
+            # Entra no modo de alteração, com novas tentativas pela política de retry
+            try:
+                modo_edicao = self.politica_retry.executar(
+                    self._entrar_modo_edicao, descricao="Configuração ('alt')",
+                    aceitar=bool, rejeicao_e_timeout=True
+                )
+            except Exception as e:
+                self.logger.warning(f"Erro ao entrar no modo de alteração: {str(e)}")
+                modo_edicao = False
+            
+            if not modo_edicao:
+                self.logger.warning("Não foi possível confirmar o modo de edição")
+                self._capturar_falha(ETAPA_CONFIGURADO, "Modo de edição não confirmado")
             
             # Configura os checkboxes, ignorando erros individuais
             checkboxes_config = {
@@ -215,16 +492,15 @@ class FuncionarioOperations:
                 "migrarSomenteFicha": migrar_somente_ficha
             }
             
-            for checkbox_id, valor in checkboxes_config.items():
-                try:
-                    self._definir_checkbox(checkbox_id, valor)
-                except:
-                    self.logger.warning(f"Não foi possível configurar o checkbox {checkbox_id}")
+            try:
+                self._aplicar_formulario(checkboxes_config, "checkbox")
+            except Exception as e:
+                self.logger.warning(f"Não foi possível configurar os checkboxes: {str(e)}")
             
             # Tenta associar todos
             try:
                 self.driver.execute_script("fassociarTodos();")
-                time.sleep(2)
+                esperar_opcional(self.driver, documento_pronto(), self.timeout)
             except:
                 self.logger.warning("Erro ao executar 'fassociarTodos'")
             
@@ -235,6 +511,22 @@ class FuncionarioOperations:
             self.logger.error(f"Erro ao configurar transferência: {str(e)}")
             return False
     
+    def _entrar_modo_edicao(self) -> bool:
+        """Executa 'alt' e confirma o modo de edição pelos checkboxes de transferência."""
+        marca = marcar_socframe(self.driver)
+        self.driver.execute_script("doAcao('alt');")
+        esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
+        
+        # Verifica se algum modal apareceu
+        modal_found, modal_message = self.modal_handler.check_and_handle_modal()
+        if modal_found:
+            self.logger.info(f"Modal tratado: {modal_message}")
+        
+        if esperar_opcional(self.driver, checkbox_presente("copiaFichaClinica"), self.timeout):
+            self.logger.info("Modo de edição ativado com sucesso")
+            return True
+        return False
+    
     def _definir_destino(self, 
                         empresa_destino: Optional[str], 
                         termo_busca: str,
@@ -263,50 +555,107 @@ class FuncionarioOperations:
             self.logger.error(f"Erro ao definir destino: {str(e)}")
             return False
     
+    def buscar_funcionarios(self,
+                            termo_busca: str,
+                            tipo_busca: str = "nome",
+                            filtros: Optional[Dict[str, bool]] = None,
+                            empresa: Optional[str] = None,
+                            max_paginas: Optional[int] = None) -> Iterator[FuncionarioEncontrado]:
+        """Busca funcionários na tela 232 e gera os resultados sob demanda.
+        
+        Cada página da tabela é lida em uma única chamada JavaScript; a
+        próxima página só é carregada quando o consumidor avança além da
+        página atual. O navegador não deve ser usado para outras operações
+        enquanto o gerador estiver ativo.
+        
+        Args:
+            termo_busca: Termo para buscar o funcionário
+            tipo_busca: Tipo de busca (ver TIPOS_BUSCA)
+            filtros: Dicionário com filtros (ativo, inativo, pendente, afastado, ferias)
+            empresa: Código da empresa onde buscar (se precisar mudar)
+            max_paginas: Limite de páginas a percorrer (None = todas)
+            
+        Yields:
+            FuncionarioEncontrado: Um registro por linha de resultado
+        """
+        if not self._preparar_ambiente(empresa):
+            return
+        if not self._executar_busca(termo_busca, tipo_busca, filtros):
+            return
+        
+        pagina = 1
+        while True:
+            registros, proxima = self._extrair_resultados()
+            self.logger.info(f"Página {pagina}: {len(registros)} funcionário(s)")
+            yield from registros
+            
+            if not proxima or (max_paginas and pagina >= max_paginas):
+                return
+            
+            marca = marcar_socframe(self.driver)
+            self.driver.execute_script(proxima)
+            if not esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout):
+                self.logger.warning(f"Página {pagina + 1} de resultados não carregou")
+                return
+            pagina += 1
+    
+    def _extrair_resultados(self) -> Tuple[List[FuncionarioEncontrado], Optional[str]]:
+        """Lê a página atual de table.resultados em uma única chamada.
+        
+        Returns:
+            (registros da página, script da próxima página ou None)
+        """
+        dados = self.driver.execute_script(_SCRIPT_EXTRAIR_RESULTADOS, SELETOR_PROXIMA_PAGINA)
+        if not dados:
+            return [], None
+        registros = [FuncionarioEncontrado(**registro) for registro in dados["registros"]]
+        return registros, dados["proxima"]
+    
     def _buscar_funcionario(self, 
                            termo_busca: str, 
                            tipo_busca: str = "nome",
                            filtros: Optional[Dict[str, bool]] = None) -> bool:
         """Busca funcionário com os critérios especificados."""
         try:
-            filtros_padrao = {
-                "ativo": True,
-                "inativo": True,
-                "pendente": True,
-                "afastado": True,
-                "ferias": True
-            }
+            if not self._executar_busca(termo_busca, tipo_busca, filtros):
+                return False
             
+            self._resultados, _ = self._extrair_resultados()
+            if not self._resultados:
+                self.logger.error(f"Nenhum funcionário encontrado: {termo_busca}")
+                return False
+                
+            self.logger.info(f"Encontrados {len(self._resultados)} funcionário(s)")
+            return True
+        except Exception as e:
+            self.logger.error(f"Erro na busca de funcionário: {str(e)}")
+            return False
+    
+    def _executar_busca(self,
+                        termo_busca: str,
+                        tipo_busca: str = "nome",
+                        filtros: Optional[Dict[str, bool]] = None) -> bool:
+        """Preenche o formulário de busca e executa 'browse'."""
+        try:
+            filtros_padrao = dict(FILTROS_PADRAO)
             if filtros:
                 filtros_padrao.update(filtros)
             
+            # Tipo de busca, filtros e termo aplicados em uma única chamada
+            estados: Dict[str, Any] = {}
             if tipo_busca in self.TIPOS_BUSCA:
-                tipo_busca_value = self.TIPOS_BUSCA[tipo_busca]
-                script = f"document.querySelector('input[name=\"codigoPesquisaFuncionario\"][value=\"{tipo_busca_value}\"]').checked = true"
-                self.driver.execute_script(script)
-            
-            for filtro, valor in filtros_padrao.items():
-                try:
-                    checkbox = self.driver.find_element(By.NAME, filtro)
-                    current_state = checkbox.is_selected()
-                    if current_state != valor:
-                        checkbox.click()
-                except NoSuchElementException:
-                    self.logger.warning(f"Filtro não encontrado: {filtro}")
-            
-            input_busca = self.driver.find_element(By.NAME, "nomeSeach")
-            input_busca.clear()
-            input_busca.send_keys(termo_busca)
-            
-            self.driver.execute_script("doAcao('browse');")
-            time.sleep(2)
-            
-            resultados = self.driver.find_elements(By.CSS_SELECTOR, "table.resultados tr:not(:first-child)")
-            if not resultados:
-                self.logger.error(f"Nenhum funcionário encontrado: {termo_busca}")
+                estados["codigoPesquisaFuncionario"] = self.TIPOS_BUSCA[tipo_busca]
+            estados.update(filtros_padrao)
+            estados["nomeSeach"] = termo_busca
+            if self._aplicar_formulario(estados, "filtro").get("nomeSeach") is None:
+                self.logger.error("Campo de busca 'nomeSeach' não encontrado")
                 return False
-                
-            self.logger.info(f"Encontrados {len(resultados)} funcionário(s)")
+            
+            marca = marcar_socframe(self.driver)
+            with self._medir_espera(ESPERA_RESULTADOS_BUSCA):
+                self.driver.execute_script("doAcao('browse');")
+                esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
+                esperar_opcional(self.driver, tabela_resultados_renderizada(), self.timeout_curto)
             return True
         except Exception as e:
             self.logger.error(f"Erro na busca de funcionário: {str(e)}")
@@ -315,36 +664,52 @@ class FuncionarioOperations:
     def _selecionar_primeiro_funcionario(self) -> bool:
         """Seleciona o primeiro funcionário dos resultados."""
         try:
-            links = self.driver.find_elements(By.CSS_SELECTOR, "table.resultados tr:not(:first-child) td.codigo a")
-            if not links:
+            if not self._resultados:
                 self.logger.error("Nenhum funcionário encontrado para seleção")
                 return False
-                
-            # Extrai dados para log
-            codigo = links[0].text.strip()
-            try:
-                linha = links[0].find_element(By.XPATH, "./../../..")
-                nome = linha.find_element(By.XPATH, "./td[2]").text.strip()
-                self.logger.info(f"Selecionando funcionário: {nome} (Código: {codigo})")
-            except:
-                self.logger.info(f"Selecionando funcionário: (Código: {codigo})")
             
-            href = links[0].get_attribute("href")
-            if href and "selbrowse" in href:
-                script_id = href.split("'")[1]
-                self.driver.execute_script(f"selbrowse('{script_id}');")
-                time.sleep(2)
-                return True
-            else:
-                self.logger.error("Link de seleção inválido")
-                return False
+            funcionario = self._resultados[0]
+            self.logger.info(f"Selecionando funcionário: {funcionario.nome} (Código: {funcionario.codigo})")
+            return self._selecionar_funcionario(funcionario)
         except Exception as e:
             self.logger.error(f"Erro ao selecionar funcionário: {str(e)}")
             return False
     
-    def _iniciar_transferencia(self) -> bool:
-        """Inicia o processo de transferência."""
+    def _selecionar_funcionario(self, funcionario: FuncionarioEncontrado, exigir_recarga: bool = False) -> bool:
+        """Abre o cadastro do funcionário via selbrowse(id).
+        
+        Args:
+            funcionario: Funcionário a selecionar
+            exigir_recarga: Se True, falha quando o socframe não recarrega
+        """
+        if not funcionario.selbrowse_id:
+            self.logger.error("Link de seleção inválido")
+            return False
+        
+        marca = marcar_socframe(self.driver)
+        self.driver.execute_script("selbrowse(arguments[0]);", funcionario.selbrowse_id)
+        self._funcionario_selecionado = funcionario
+        if not esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout):
+            self.logger.warning("Cadastro do funcionário não carregou após selbrowse")
+            return not exigir_recarga
+        return True
+    
+    def _cadastro_confere(self, funcionario: FuncionarioEncontrado) -> bool:
+        """Verifica se o cadastro aberto é o do funcionário (entrada de cache ainda válida)."""
+        if self.driver.execute_script(_SCRIPT_CONFERIR_CADASTRO, funcionario.codigo, funcionario.nome):
+            return True
+        self.logger.warning(f"Cadastro aberto não corresponde ao funcionário {funcionario.codigo}")
+        return False
+    
+    def _iniciar_transferencia(self, exigir_confirmacao: bool = False) -> bool:
+        """Inicia o processo de transferência.
+        
+        Args:
+            exigir_confirmacao: Se True, falha quando a tela de transferência não é confirmada
+        """
         try:
+            marca = marcar_socframe(self.driver)
+            
             # Tenta encontrar o botão/opção de transferência
             try:
                 # Primeiro tenta encontrar pelo link direto
@@ -355,36 +720,31 @@ class FuncionarioOperations:
                 self.logger.info("Executando ação de transferência via script")
                 self.driver.execute_script("doAcao('transfunc');")
             
-            # Aguarda mais tempo (5 segundos) para carregar
-            time.sleep(5)
+            # Aguarda o socframe carregar a tela de transferência
+            esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
             
             # Verifica modal que pode aparecer
             modal_found, modal_message = self.modal_handler.check_and_handle_modal()
             if modal_found:
                 self.logger.info(f"Modal tratado: {modal_message}")
             
-            # Tenta diferentes estratégias para verificar se a tela carregou
-            for _ in range(3):  # Tenta até 3 vezes
-                try:
-                    # Verifica se estamos na tela de transferência por diferentes elementos
-                    if self.driver.find_elements(By.ID, "copiaFichaClinica"):
-                        self.logger.info("Tela de transferência carregada (verificado por copiaFichaClinica)")
-                        return True
-                    elif self.driver.find_elements(By.NAME, "empVo.cod"):
-                        self.logger.info("Tela de transferência carregada (verificado por empVo.cod)")
-                        return True
-                    
-                    # Verifica por texto que possa indicar a tela de transferência
-                    page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                    if "Transferência de Funcionário" in page_text:
-                        self.logger.info("Tela de transferência carregada (verificado por texto)")
-                        return True
-                    
-                    self.logger.warning("Tela de transferência ainda não identificada, aguardando...")
-                    time.sleep(2)
-                except:
-                    self.logger.warning("Erro ao verificar tela, tentando novamente...")
-                    time.sleep(2)
+            # Verifica se estamos na tela de transferência por diferentes elementos;
+            # cada tentativa é uma espera curta, com backoff entre elas
+            tela_carregada = self.politica_retry.executar(
+                lambda: esperar_opcional(self.driver, qualquer(
+                    checkbox_presente("copiaFichaClinica"),
+                    elemento_presente((By.NAME, "empVo.cod")),
+                    texto_presente("Transferência de Funcionário")
+                ), self.timeout_curto),
+                descricao="Tela de transferência", aceitar=bool, rejeicao_e_timeout=True
+            )
+            if tela_carregada:
+                self.logger.info("Tela de transferência carregada")
+                return True
+            
+            if exigir_confirmacao:
+                self.logger.warning("Tela de transferência não confirmada")
+                return False
             
             # Se chegou aqui, tenta prosseguir para a alteração mesmo assim
             self.logger.warning("Tentando prosseguir mesmo sem confirmar a tela")
@@ -394,17 +754,23 @@ class FuncionarioOperations:
             self.logger.error(f"Erro ao iniciar transferência: {str(e)}")
             return False
     
-    def _definir_checkbox(self, checkbox_id: str, valor: bool) -> None:
-        """Define o estado de um checkbox."""
-        try:
-            checkbox = self.driver.find_element(By.ID, checkbox_id)
-            current_state = checkbox.is_selected()
-            if current_state != valor:
-                checkbox.click()
-        except NoSuchElementException:
-            self.logger.warning(f"Checkbox não encontrado: {checkbox_id}")
-        except Exception as e:
-            self.logger.warning(f"Erro ao definir checkbox {checkbox_id}: {str(e)}")
+    def _aplicar_formulario(self, estados: Dict[str, Any], descricao: str = "campo") -> Dict[str, Any]:
+        """Aplica o estado de vários campos em uma chamada e registra divergências.
+        
+        Args:
+            estados: Mapa id/name -> estado desejado
+            descricao: Tipo de campo usado nas mensagens de log
+            
+        Returns:
+            Estado resultante de cada campo
+        """
+        resultado = aplicar_estado_formulario(self.driver, estados)
+        for campo, (desejado, obtido) in divergencias_formulario(estados, resultado).items():
+            if obtido is None:
+                self.logger.warning(f"{descricao.capitalize()} não encontrado: {campo}")
+            else:
+                self.logger.warning(f"{descricao.capitalize()} {campo}: esperado {desejado}, obtido {obtido}")
+        return resultado
     
     def _selecionar_empresa_destino(self, empresa_destino: str) -> bool:
         """Seleciona a empresa destino."""
@@ -419,7 +785,7 @@ class FuncionarioOperations:
             script_update = "trazUnseca(document.getElementById('codigoDaEmpresa').value);"
             self.driver.execute_script(script_update)
             
-            time.sleep(2)
+            esperar_opcional(self.driver, documento_pronto(), self.timeout)
             self.logger.info(f"Empresa destino selecionada: {empresa_destino}")
             return True
         except Exception as e:
@@ -428,80 +794,62 @@ class FuncionarioOperations:
 
     def _selecionar_funcionario_destino(self, termo_busca: str, tipo_busca: str) -> bool:
         """Seleciona o funcionário destino usando o mesmo critério do funcionário origem."""
-        original_window = self.driver.current_window_handle
+        original_window = self.home_page.current_window()
         new_window = None
         
         try:
-            # Guarda o número de janelas antes de abrir uma nova
-            janelas_antes = len(self.driver.window_handles)
-            self.logger.info(f"Janelas antes de abrir popup: {janelas_antes}")
+            # Guarda as janelas antes de abrir uma nova
+            janelas_antes = self.driver.window_handles
+            self.logger.info(f"Janelas antes de abrir popup: {len(janelas_antes)}")
             
             # Abre a janela de seleção
             self.logger.info("Abrindo janela de seleção de funcionário destino")
             self.driver.execute_script("javascript:zoom();")
-            time.sleep(3)  # Espera mais tempo para a janela abrir
-            
-            # Verifica quantas janelas temos agora
-            janelas_depois = len(self.driver.window_handles)
-            self.logger.info(f"Janelas depois de tentar abrir popup: {janelas_depois}")
-            
-            if janelas_depois <= janelas_antes:
-                self.logger.warning("Nova janela não foi aberta. Prosseguindo sem selecionar funcionário.")
-                return False
-            
-            # Identifica a nova janela
-            for window_handle in self.driver.window_handles:
-                if window_handle != original_window:
-                    new_window = window_handle
-                    self.driver.switch_to.window(new_window)
-                    self.logger.info(f"Mudou para nova janela: {new_window}")
-                    break
             
+            new_window = esperar_opcional(self.driver, janela_popup_aberta(janelas_antes), self.timeout)
             if not new_window:
-                self.logger.warning("Nova janela não detectada. Prosseguindo sem selecionar funcionário.")
+                self.logger.warning("Nova janela não foi aberta. Prosseguindo sem selecionar funcionário.")
                 return False
             
-            # Executa a busca na nova janela
-            input_busca = self.driver.find_element(By.NAME, "nomeSeach")
-            input_busca.clear()
-            input_busca.send_keys(termo_busca)
+            self.home_page.switch_to_window(new_window)
+            self.logger.info(f"Mudou para nova janela: {new_window}")
+            esperar_opcional(self.driver, elemento_presente((By.NAME, "nomeSeach")), self.timeout)
             
-            # Seleciona tipo de busca
+            # Preenche termo e tipo de busca na nova janela em uma única chamada
+            estados: Dict[str, Any] = {"nomeSeach": termo_busca}
             if tipo_busca in self.TIPOS_BUSCA_POPUP:
-                radio_id = self.TIPOS_BUSCA_POPUP[tipo_busca]
-                try:
-                    radio = self.driver.find_element(By.ID, radio_id)
-                    if not radio.is_selected():
-                        radio.click()
-                except:
-                    self.logger.warning(f"Radio button {radio_id} não encontrado")
+                estados[self.TIPOS_BUSCA_POPUP[tipo_busca]] = True
+            if self._aplicar_formulario(estados, "campo").get("nomeSeach") is None:
+                self.logger.warning("Campo de busca não encontrado na janela de seleção")
+                self.driver.close()
+                self.home_page.switch_to_window(original_window)
+                return False
             
             # Executa busca
+            marca = marcar_janela(self.driver)
             self.driver.execute_script("doAcao('browse');")
-            time.sleep(2)
+            esperar_opcional(self.driver, janela_recarregada(marca), self.timeout)
             
             # Seleciona o primeiro resultado
             links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='javascript:sendValue']")
             if not links:
                 self.logger.warning("Nenhum funcionário destino encontrado. Fechando janela.")
                 self.driver.close()
-                self.driver.switch_to.window(original_window)
+                self.home_page.switch_to_window(original_window)
                 return False
                 
             # Executa a seleção
             href = links[0].get_attribute("href")
             self.logger.info(f"Selecionando via script: {href.split('javascript:')[1]}")
             self.driver.execute_script(href.split("javascript:")[1])
-            time.sleep(2)
             
-            # Verifica se a janela ainda existe ou foi fechada automaticamente
-            window_handles = self.driver.window_handles
-            if new_window in window_handles:
+            # Verifica se a janela foi fechada automaticamente
+            if not esperar_opcional(self.driver, janela_fechada(new_window), self.timeout_curto):
                 self.logger.info("Fechando janela manualmente")
                 self.driver.close()
             
             # Volta para janela original
-            self.driver.switch_to.window(original_window)
+            self.home_page.switch_to_window(original_window)
             self.logger.info("Voltou para janela original")
             
             # Garante que estamos no frame correto
@@ -526,48 +874,10 @@ class FuncionarioOperations:
     def _verificar_modais_transferencia(self) -> None:
         """Verifica modais específicos de transferência."""
         try:
-            # Lista de possíveis IDs de modais de transferência
-            modal_ids = ["alertaErroTransferencia", "modalalertas", "modalTransfFuncionario"]
-            
-            for modal_id in modal_ids:
-                try:
-                    # Tenta encontrar o modal
-                    modal = self.driver.find_element(By.ID, modal_id)
-                    
-                    if modal.is_displayed():
-                        # Extrai a mensagem
-                        mensagem = ""
-                        try:
-                            # Tenta diferentes localizadores para a mensagem
-                            mensagem_element = modal.find_element(By.ID, "conteudosTable")
-                            mensagem = mensagem_element.text
-                        except:
-                            try:
-                                # Tenta outro padrão de mensagem
-                                mensagem_element = modal.find_element(By.CSS_SELECTOR, ".modalConteudo")
-                                mensagem = mensagem_element.text
-                            except:
-                                self.logger.warning(f"Não foi possível extrair texto do modal {modal_id}")
-                        
-                        if mensagem:
-                            self.logger.info(f"Modal de transferência encontrado: {mensagem}")
-                        
-                        # Tenta clicar no botão OK
-                        try:
-                            # Primeiro tenta pelo script específico
-                            if modal_id == "alertaErroTransferencia":
-                                self.driver.execute_script("fecharErroTransferencia();")
-                            else:
-                                # Tenta encontrar o botão OK e clicar
-                                botao_ok = modal.find_element(By.CSS_SELECTOR, ".botaoT")
-                                botao_ok.click()
-                        except:
-                            self.logger.warning(f"Não foi possível clicar no botão do modal {modal_id}")
-                        
-                        time.sleep(1)
-                        break
-                except NoSuchElementException:
-                    continue
+            # O observador cobre alertaErroTransferencia, modalalertas e modalTransfFuncionario
+            modal_found, mensagem = self.modal_handler.check_and_handle_modal()
+            if modal_found and mensagem:
+                self.logger.info(f"Modal de transferência encontrado: {mensagem}")
                 
         except Exception as e:
             self.logger.warning(f"Erro ao verificar modais de transferência: {str(e)}")
@@ -579,12 +889,13 @@ class FuncionarioOperations:
             self.home_page.switch_to_default_frame()
             
             # Executa script para retornar à tela inicial
+            marca = marcar_socframe(self.driver)
             script = "javascript:Empresas(); hideall();hidemenus('');menu_close();avisoLogin();"
             self.driver.execute_script(script)
             self.logger.info("Retornando à tela inicial")
             
             # Aguarda carregar
-            time.sleep(3)
+            esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
             
             # Verifica possíveis modais
             modal_found, modal_message = self.modal_handler.check_and_handle_modal()
@@ -601,22 +912,26 @@ class FuncionarioOperations:
             self._garantir_contexto_principal()
             
             self.logger.info("Finalizando transferência: executando 'save'")
+            marca = marcar_socframe(self.driver)
             self.driver.execute_script("doAcao('save');")
-            time.sleep(2)
             
             # Trata possível alerta javascript
             alerta_encontrado = False
-            for _ in range(3):  # Tenta várias vezes, pois o alerta pode demorar
-                try:
-                    alert = self.driver.switch_to.alert
-                    mensagem_alert = alert.text
-                    self.logger.info(f"Alerta confirmado: {mensagem_alert}")
-                    alert.accept()
-                    alerta_encontrado = True
-                    time.sleep(2)
-                    break
-                except:
-                    time.sleep(1)  # Espera um pouco e tenta novamente
+            alert = self.politica_retry.executar(
+                lambda: esperar_opcional(self.driver, alerta_presente(), self.timeout_curto),
+                descricao="Alerta de confirmação", aceitar=bool
+            )
+            # O envio do 'save' ocorre no aceite do alerta; mede só a resposta do SOC
+            with self._medir_espera(ESPERA_CONFIRMACAO_SAVE):
+                if alert:
+                    try:
+                        mensagem_alert = alert.text
+                        self.logger.info(f"Alerta confirmado: {mensagem_alert}")
+                        alert.accept()
+                        alerta_encontrado = True
+                    except:
+                        self.logger.warning("Alerta fechado antes de ser confirmado")
+                esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
             
             # Verifica possíveis modais específicos de transferência
             self._verificar_modais_transferencia()
@@ -649,7 +964,7 @@ class FuncionarioOperations:
             return True
             
         except Exception as e:
+            # O 'save' pode ter sido efetivado; a falha fica registrada como incerta no journal
             self.logger.error(f"Erro ao finalizar transferência: {str(e)}")
-            # Ainda consideramos como potencial sucesso mesmo com erro
             self.logger.warning("Transferência pode ter sido concluída apesar do erro")
-            return True
\ No newline at end of file
+            return False
\ No newline at end of file
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ..core.logger import get_logger
+
+# Etapas de FuncionarioOperations.transferir, na ordem em que são concluídas
+ETAPA_PREPARADO = "preparado"
+ETAPA_LOCALIZADO = "localizado"
+ETAPA_CONFIGURADO = "configurado"
+ETAPA_DESTINO_DEFINIDO = "destino_definido"
+# Gravada antes do 'save': a partir daqui a transferência pode ter sido efetivada
+ETAPA_SALVANDO = "salvando"
+ETAPA_SALVO = "salvo"
+ETAPA_FALHOU = "falhou"
+# Falha depois de ``salvando``: a transferência pode ter sido efetivada e precisa de conferência
+ETAPA_INCERTO = "incerto"
+
+ETAPAS = (
+    ETAPA_PREPARADO,
+    ETAPA_LOCALIZADO,
+    ETAPA_CONFIGURADO,
+    ETAPA_DESTINO_DEFINIDO,
+    ETAPA_SALVANDO,
+    ETAPA_SALVO,
+)
+
+
+class JournalTransferencias:
+    """Journal append-only e com fsync do progresso de cada job de transferência.
+
+    Cada linha é um JSON ``{"ts", "job_id", "etapa", ...}``. Várias
+    instâncias (ex: um por processo worker) podem gravar no mesmo arquivo:
+    cada registro é escrito com uma única chamada ``write`` em modo append.
+    """
+
+    def __init__(self, caminho: str) -> None:
+        self.caminho = caminho
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+
+    def _abrir(self) -> int:
+        if self._fd is None:
+            diretorio = os.path.dirname(os.path.abspath(self.caminho))
+            os.makedirs(diretorio, exist_ok=True)
+            self._fd = os.open(self.caminho, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        return self._fd
+
+    def registrar(self, job_id: str, etapa: str, **dados: Any) -> None:
+        """Grava a conclusão de uma etapa e só retorna após o fsync."""
+        registro = {"ts": time.time(), "job_id": job_id, "etapa": etapa}
+        registro.update(dados)
+        linha = (json.dumps(registro, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            fd = self._abrir()
+            os.write(fd, linha)
+            os.fsync(fd)
+
+    def estado(self) -> Dict[str, str]:
+        """Lê o journal e retorna, por job, a etapa que decide a retomada.
+
+        É a última etapa registrada, exceto quando o job já passou pelo
+        'save': ``salvo`` prevalece sobre qualquer registro posterior e
+        ``salvando`` prevalece sobre tudo que não seja ``salvo`` (ex:
+        ``salvando`` seguido de ``falhou`` continua ``salvando``), pois a
+        transferência pode ter sido efetivada.
+
+        Linhas incompletas (ex: queda durante a escrita) são ignoradas.
+        """
+        estados: Dict[str, str] = {}
+        if not os.path.exists(self.caminho):
+            return estados
+
+        with open(self.caminho, encoding="utf-8", errors="replace") as f:
+            for numero, linha in enumerate(f, start=1):
+                try:
+                    registro = json.loads(linha)
+                    job_id, etapa = registro["job_id"], registro["etapa"]
+                except (ValueError, KeyError, TypeError):
+                    self.logger.warning(f"Linha {numero} do journal ignorada (incompleta ou inválida)")
+                    continue
+                anterior = estados.get(job_id)
+                if anterior == ETAPA_SALVO or (anterior == ETAPA_SALVANDO and etapa != ETAPA_SALVO):
+                    continue
+                estados[job_id] = etapa
+        return estados
+
+    def fechar(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
@@ -0,0 +1,457 @@
+import multiprocessing
+import os
+import queue
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import get_configuracao
+from ..core.logger import get_logger
+from ..core.metrics import get_metricas
+from ..core.retry import Disjuntor, definir_disjuntor
+from ..core.session_store import SessionStore
+from ..core.watchdog import WatchdogNavegador
+from .agendador import AgendadorAfinidade
+from .concorrencia import ControladorConcorrencia
+from .contas import Conta, RegistroContas
+from .journal import ETAPA_SALVANDO, ETAPA_SALVO, JournalTransferencias
+from .models import Credenciais, ResultadoJob, ResultadoLote, TransferenciaJob
+
+# Tempo máximo (s) para os workers encerrarem ao fim do lote antes de serem terminados
+TIMEOUT_ENCERRAMENTO = 30
+
+
+def calcular_workers(total_jobs: int, workers: Optional[int] = None) -> int:
+    """Calcula quantos workers podem ser usados na máquina atual.
+
+    Args:
+        total_jobs: Quantidade de jobs do lote.
+        workers: Quantidade solicitada (None usa ``lote.workers`` do config.yaml
+            ou, se ausente, calcula automaticamente).
+
+    Returns:
+        int: Número de workers limitado por CPU, memória disponível e jobs.
+    """
+    logger = get_logger(__name__)
+    config = get_configuracao().lote
+    limite = os.cpu_count() or 1
+
+    try:
+        # memoria_por_worker_mb: estimativa por worker (Python + Chrome + chromedriver)
+        memoria_livre = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+        limite = min(limite, max(1, memoria_livre // (config.memoria_por_worker_mb * 1024 * 1024)))
+    except (ValueError, OSError, AttributeError):
+        # sysconf indisponível (ex: Windows); limita apenas pela CPU
+        pass
+
+    if workers is None:
+        workers = config.workers
+    if workers is None:
+        workers = limite
+    elif workers > limite:
+        logger.warning(f"{workers} workers solicitados, limitando a {limite} (CPU/memória)")
+        workers = limite
+
+    return max(1, min(workers, total_jobs))
+
+
+def _executar_worker(worker_id: int,
+                     credenciais: Credenciais,
+                     headless: Optional[bool],
+                     session_store: Optional[SessionStore],
+                     journal_path: Optional[str],
+                     disjuntor: Disjuntor,
+                     user_data_dir: Optional[str],
+                     reciclagem: Tuple[int, int],
+                     fila_jobs,
+                     fila_eventos) -> None:
+    """Loop de um processo worker: faz login uma vez e executa jobs até receber None.
+
+    Entre jobs, o ``WatchdogNavegador`` fecha popups esquecidos e recicla o
+    navegador por número de jobs ou memória (``reciclagem``).
+
+    Os spans do worker são enviados ao processo principal (evento
+    "metricas", antes de cada "resultado" e ao encerrar), que os agrega no
+    seu registro de métricas.
+    """
+    from ..core.browser import Browser
+    from ..core.session_context import get_session_context
+
+    logger = get_logger(__name__)
+    metricas = get_metricas()
+    metricas.iniciar_coleta()
+    definir_disjuntor(disjuntor)
+    # Sessão salva própria do worker: workers da mesma conta não compartilham o
+    # cookie do servidor (nem a empresa selecionada nele)
+    browser = Browser(headless=headless, session_store=session_store, user_data_dir=user_data_dir,
+                      session_id=user_data_dir or f"worker-{worker_id}")
+    journal = JournalTransferencias(journal_path) if journal_path else None
+    erro_worker = None
+
+    try:
+        if not browser.login(credenciais.username, credenciais.password, credenciais.company_id):
+            erro_worker = "Falha no login"
+            logger.error(f"Worker {worker_id}: falha no login, encerrando")
+            return
+        max_operacoes, max_memoria_mb = reciclagem
+        watchdog = WatchdogNavegador(browser, max_operacoes, max_memoria_mb)
+
+        while True:
+            job = fila_jobs.get()
+            if job is None:
+                break
+
+            # Com o SOC sem responder, todos os workers pausam antes do próximo job
+            pausa = disjuntor.aguardar_liberacao()
+            if pausa >= 1:
+                logger.info(f"Worker {worker_id}: retomando após {pausa:.0f}s de pausa do disjuntor")
+
+            fila_eventos.put(("inicio", worker_id, job.job_id))
+            inicio = time.perf_counter()
+            erro = None
+            trocas_evitadas = 0
+            duracoes_etapas: Dict[str, float] = {}
+            timeouts = 0
+            try:
+                if not browser.ensure_session():
+                    raise RuntimeError("Sessão SOC inativa e novo login falhou")
+                func_ops = browser.get_funcionario_operations(journal=journal)
+                try:
+                    sucesso = func_ops.transferir(job_id=job.job_id, **job.como_kwargs())
+                finally:
+                    duracoes_etapas = func_ops.duracoes_etapas
+                    timeouts = func_ops.politica_retry.timeouts
+                trocas_evitadas = func_ops.trocas_evitadas
+                if not sucesso:
+                    erro = "Transferência não concluída"
+            except Exception as e:
+                sucesso = False
+                erro = str(e)
+
+            fila_eventos.put(("metricas", worker_id, metricas.drenar()))
+            fila_eventos.put(("resultado", worker_id, ResultadoJob(
+                job_id=job.job_id,
+                sucesso=sucesso,
+                duracao=time.perf_counter() - inicio,
+                worker_id=worker_id,
+                erro=erro,
+                empresa_final=get_session_context(browser.driver).empresa_atual if browser.driver else None,
+                trocas_evitadas=trocas_evitadas,
+                conta=credenciais.username,
+                duracoes_etapas=duracoes_etapas,
+                timeouts=timeouts
+            )))
+
+            # Ponto seguro: nenhum job em andamento neste navegador
+            watchdog.registrar_operacao()
+            watchdog.verificar()
+    except Exception as e:
+        erro_worker = str(e)
+        logger.error(f"Worker {worker_id}: erro inesperado: {erro_worker}")
+    finally:
+        browser.quit()
+        if journal:
+            journal.fechar()
+        fila_eventos.put(("metricas", worker_id, metricas.drenar()))
+        fila_eventos.put(("fim", worker_id, erro_worker))
+
+
+def _retomar_do_journal(jobs: List[TransferenciaJob],
+                        journal_path: str,
+                        reprocessar_incertos: bool,
+                        resultados: Dict[str, ResultadoJob]) -> List[TransferenciaJob]:
+    """Separa os jobs que precisam ser executados segundo o journal.
+
+    Jobs já salvos e jobs incertos (que chegaram ao 'save' sem registro de
+    ``salvo``, mesmo que uma falha tenha sido gravada depois) são
+    registrados diretamente em ``resultados`` (ver ``JournalTransferencias.estado``).
+
+    Returns:
+        List[TransferenciaJob]: Jobs a executar, na ordem original.
+    """
+    logger = get_logger(__name__)
+    estados = JournalTransferencias(journal_path).estado()
+    pendentes = []
+
+    for job in jobs:
+        etapa = estados.get(job.job_id)
+        if etapa == ETAPA_SALVO:
+            resultados[job.job_id] = ResultadoJob(job.job_id, True, retomado=True)
+        elif etapa == ETAPA_SALVANDO and not reprocessar_incertos:
+            logger.warning(f"Job {job.job_id} interrompido durante o 'save'; verifique no SOC antes de reprocessar")
+            resultados[job.job_id] = ResultadoJob(
+                job.job_id, False, erro="Interrompido durante o 'save' (pendente de verificação)"
+            )
+        else:
+            pendentes.append(job)
+
+    logger.info(
+        f"Retomando lote: {len(jobs) - len(pendentes)} job(s) resolvido(s) pelo journal, "
+        f"{len(pendentes)} a executar"
+    )
+    return pendentes
+
+
+def transferir_lote(jobs: Sequence[TransferenciaJob],
+                    credenciais: Optional[Credenciais] = None,
+                    workers: Optional[int] = None,
+                    headless: Optional[bool] = None,
+                    session_store: Optional[SessionStore] = None,
+                    journal_path: Optional[str] = None,
+                    retomar: bool = False,
+                    reprocessar_incertos: bool = False,
+                    disjuntor: Optional[Disjuntor] = None,
+                    contas: Optional[Sequence[Conta]] = None,
+                    diretorio_perfis: Optional[str] = None,
+                    adaptativo: Optional[bool] = None,
+                    max_jobs_por_navegador: Optional[int] = None,
+                    max_memoria_navegador_mb: Optional[int] = None) -> ResultadoLote:
+    """Executa transferências em paralelo, um navegador logado por processo worker.
+
+    Os jobs são agrupados por empresa de origem e cada worker recebe, de
+    preferência, jobs da empresa em que sua sessão já está (ver
+    ``AgendadorAfinidade``), evitando trocas de empresa.
+
+    Com ``journal_path``, cada worker grava no journal a conclusão de cada
+    etapa dos seus jobs. Com ``retomar=True``, o journal de uma execução
+    interrompida é lido antes de iniciar: jobs já salvos não são
+    reexecutados e jobs interrompidos antes do 'save' recomeçam do início.
+    Jobs interrompidos durante o 'save' podem ter sido efetivados no SOC e
+    são reportados como falha até serem conferidos, a menos que
+    ``reprocessar_incertos`` seja True.
+
+    Com ``contas``, cada worker fica preso a uma conta de serviço, com perfil
+    do Chrome próprio, e os workers são distribuídos entre as contas sem
+    exceder o ``max_sessoes`` de cada uma; o total de workers fica limitado
+    à soma desses limites.
+
+    Com ``adaptativo=True``, ``workers`` passa a ser o máximo: um
+    ``ControladorConcorrencia`` aumenta ou reduz os workers ativos conforme
+    a latência das etapas e os timeouts observados. Workers excedentes
+    ficam ociosos, logados, até o alvo voltar a crescer.
+
+    Os workers compartilham um ``Disjuntor``: após timeouts consecutivos do
+    SOC em qualquer worker, todos pausam antes da próxima tentativa.
+
+    Parâmetros de ajuste não informados (``workers``, ``adaptativo`` e os
+    limites de reciclagem) vêm da seção ``lote`` do config.yaml.
+
+    Deve ser chamado sob ``if __name__ == "__main__":``, pois os workers
+    são iniciados com o método ``spawn``.
+
+    Args:
+        jobs: Lista de transferências a executar.
+        credenciais: Credenciais usadas pelos workers para login (equivale a
+            uma única conta sem limite de sessões; ignorado com ``contas``).
+        workers: Número de processos (None usa ``lote.workers`` ou calcula por CPU/memória).
+        headless: Se True, executa os navegadores em modo headless (None usa ``browser.headless``).
+        session_store: Cache de sessões para evitar novo login a cada execução.
+        journal_path: Arquivo do journal de progresso (None desativa).
+        retomar: Se True, retoma a partir do journal existente.
+        reprocessar_incertos: Se True, reexecuta jobs interrompidos durante o 'save'.
+        disjuntor: Disjuntor compartilhado (None cria um com os valores padrão).
+        contas: Contas de serviço entre as quais os workers são distribuídos.
+        diretorio_perfis: Raiz dos perfis do Chrome por conta (com ``contas``).
+        adaptativo: Se True, ajusta os workers ativos pela latência do SOC.
+        max_jobs_por_navegador: Jobs até reciclar o navegador do worker (0 desativa).
+        max_memoria_navegador_mb: RSS do Chrome/chromedriver que dispara a reciclagem (0 desativa).
+
+    Returns:
+        ResultadoLote: Resultados por job e throughput agregado.
+    """
+    logger = get_logger(__name__)
+    jobs = list(jobs)
+    if not jobs:
+        return ResultadoLote()
+
+    config = get_configuracao().lote
+    if adaptativo is None:
+        adaptativo = config.adaptativo
+    if max_jobs_por_navegador is None:
+        max_jobs_por_navegador = config.max_jobs_por_navegador
+    if max_memoria_navegador_mb is None:
+        max_memoria_navegador_mb = config.max_memoria_navegador_mb
+
+    inicio = time.perf_counter()
+    resultados: Dict[str, ResultadoJob] = {}
+    pendentes = jobs
+    if retomar and journal_path:
+        pendentes = _retomar_do_journal(jobs, journal_path, reprocessar_incertos, resultados)
+        if not pendentes:
+            logger.info("Todos os jobs já constam como concluídos no journal")
+            return ResultadoLote(
+                resultados=[resultados[job.job_id] for job in jobs],
+                duracao_total=time.perf_counter() - inicio
+            )
+
+    registro = None
+    if contas:
+        registro = RegistroContas(contas, diretorio_perfis)
+    elif credenciais is None:
+        raise ValueError("Informe credenciais ou contas")
+
+    total_workers = calcular_workers(len(pendentes), workers)
+    if registro and total_workers > registro.capacidade:
+        logger.info(f"Workers limitados a {registro.capacidade} pelas sessões permitidas nas contas")
+        total_workers = registro.capacidade
+    controlador = ControladorConcorrencia(total_workers) if adaptativo else None
+    logger.info(
+        f"Iniciando lote de {len(pendentes)} transferência(s) com {total_workers} worker(s)"
+        + (f" ({controlador.alvo} ativo(s) inicialmente)" if controlador else "")
+    )
+
+    contexto = multiprocessing.get_context("spawn")
+    fila_eventos = contexto.Queue()
+    disjuntor = disjuntor or Disjuntor(contexto=contexto)
+    agendador = AgendadorAfinidade(pendentes)
+
+    processos: Dict[int, multiprocessing.Process] = {}
+    filas_jobs: Dict[int, "multiprocessing.Queue"] = {}
+    # Job enviado a cada worker e ainda sem resultado
+    enviados: Dict[int, TransferenciaJob] = {}
+    iniciados: Dict[int, str] = {}
+    # Workers que já enviaram o evento "fim"
+    finalizados = set()
+    ociosos = set()
+    ativos = set()
+
+    def alvo() -> int:
+        return controlador.alvo if controlador else total_workers
+
+    def iniciar_worker() -> bool:
+        worker_id = len(processos)
+        credenciais_worker, user_data_dir = credenciais, None
+        if registro:
+            reserva = registro.reservar(worker_id)
+            if reserva is None:
+                return False
+            conta, user_data_dir = reserva
+            credenciais_worker = conta.credenciais
+            logger.info(f"Worker {worker_id}: conta {conta.nome}")
+        filas_jobs[worker_id] = contexto.Queue()
+        processo = contexto.Process(
+            target=_executar_worker,
+            args=(worker_id, credenciais_worker, headless, session_store, journal_path, disjuntor,
+                  user_data_dir, (max_jobs_por_navegador, max_memoria_navegador_mb), filas_jobs[worker_id], fila_eventos),
+            name=f"soc-worker-{worker_id}",
+            daemon=True
+        )
+        processo.start()
+        processos[worker_id] = processo
+        ativos.add(worker_id)
+        despachar(worker_id)
+        return True
+
+    def ajustar_workers() -> None:
+        """Inicia workers até o alvo e despacha para os ociosos enquanto houver vaga."""
+        while len(ativos) < alvo() and len(processos) < total_workers and agendador.pendentes():
+            if not iniciar_worker():
+                break
+        for ocioso in list(ociosos):
+            despachar(ocioso)
+
+    def despachar(worker_id: int) -> None:
+        # Workers além do alvo ficam ociosos (logados) até o alvo crescer
+        if len(enviados) >= alvo():
+            ociosos.add(worker_id)
+            return
+        job = agendador.proximo(worker_id)
+        if job is None:
+            ociosos.add(worker_id)
+            return
+        ociosos.discard(worker_id)
+        enviados[worker_id] = job
+        filas_jobs[worker_id].put(job)
+
+    def encerrar_worker(worker_id: int, motivo: str) -> None:
+        ativos.discard(worker_id)
+        ociosos.discard(worker_id)
+        if registro:
+            registro.liberar(worker_id)
+        job = enviados.pop(worker_id, None)
+        if job is None or job.job_id in resultados:
+            return
+        if iniciados.get(worker_id) == job.job_id:
+            # O job pode ter sido executado parcialmente; não é reenviado
+            resultados[job.job_id] = ResultadoJob(job.job_id, False, worker_id=worker_id, erro=motivo)
+        else:
+            agendador.devolver(job)
+            for ocioso in list(ociosos):
+                despachar(ocioso)
+
+    for _ in range(alvo()):
+        if not iniciar_worker():
+            break
+
+    while ativos and len(resultados) < len(jobs):
+        try:
+            evento, worker_id, dado = fila_eventos.get(timeout=config.intervalo_monitoramento)
+        except queue.Empty:
+            # Detecta workers que morreram sem avisar (ex: falta de memória)
+            for worker_id in list(ativos):
+                if not processos[worker_id].is_alive():
+                    encerrar_worker(worker_id, "Worker encerrado inesperadamente")
+            continue
+
+        if evento == "inicio":
+            iniciados[worker_id] = dado
+        elif evento == "metricas":
+            get_metricas().registrar_observacoes(dado)
+        elif evento == "resultado":
+            enviados.pop(worker_id, None)
+            resultados[dado.job_id] = dado
+            status = "OK" if dado.sucesso else f"FALHA ({dado.erro})"
+            logger.info(f"[{len(resultados)}/{len(jobs)}] Job {dado.job_id}: {status} em {dado.duracao:.1f}s")
+            agendador.registrar_empresa(worker_id, dado.empresa_final)
+            if controlador:
+                controlador.registrar(dado)
+            despachar(worker_id)
+            ajustar_workers()
+        elif evento == "fim":
+            finalizados.add(worker_id)
+            if dado:
+                logger.warning(f"Worker {worker_id} encerrado: {dado}")
+            encerrar_worker(worker_id, dado or "Worker encerrado")
+
+    for worker_id in ativos:
+        filas_jobs[worker_id].put(None)
+
+    # Jobs que nenhum worker conseguiu executar
+    for job in jobs:
+        if job.job_id not in resultados:
+            resultados[job.job_id] = ResultadoJob(job.job_id, False, erro="Nenhum worker disponível")
+
+    # A fila é esvaziada até o "fim" de cada worker antes do join: um worker ainda
+    # enviando seus últimos spans não termina enquanto a fila não for lida
+    limite = time.monotonic() + TIMEOUT_ENCERRAMENTO
+    aguardando = {w for w in processos if w not in finalizados}
+    while aguardando and time.monotonic() < limite:
+        try:
+            evento, worker_id, dado = fila_eventos.get(timeout=config.intervalo_monitoramento)
+        except queue.Empty:
+            aguardando = {w for w in aguardando if processos[w].is_alive()}
+            continue
+        if evento == "metricas":
+            # Spans enviados depois do último resultado (ex: reciclagem, encerramento)
+            get_metricas().registrar_observacoes(dado)
+        elif evento == "fim":
+            aguardando.discard(worker_id)
+
+    for processo in processos.values():
+        processo.join(timeout=max(0.0, limite - time.monotonic()))
+        if processo.is_alive():
+            processo.terminate()
+
+    resultado = ResultadoLote(
+        resultados=[resultados[job.job_id] for job in jobs],
+        duracao_total=time.perf_counter() - inicio,
+        workers=len(processos)
+    )
+    logger.info(
+        f"Lote concluído: {resultado.sucessos} sucesso(s), {resultado.falhas} falha(s), "
+        f"{resultado.trocas_evitadas} troca(s) de empresa evitada(s), "
+        f"{resultado.throughput:.1f} transferências/min"
+    )
+    if registro:
+        distribuicao = ", ".join(f"{conta}: {total}" for conta, total in resultado.jobs_por_conta.items())
+        logger.info(f"Jobs por conta: {distribuicao}")
+    return resultado
@@ -0,0 +1,118 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Credenciais:
+    """Credenciais de acesso ao sistema SOC."""
+
+    username: str
+    password: str
+    company_id: str
+
+
+@dataclass
+class TransferenciaJob:
+    """Descreve uma transferência de funcionário a ser executada em lote.
+
+    Os campos espelham os argumentos de ``FuncionarioOperations.transferir``.
+    """
+
+    job_id: str
+    termo_busca: str
+    tipo_busca: str = "nome"
+    filtros: Optional[Dict[str, bool]] = None
+    empresa_origem: Optional[str] = None
+    empresa_destino: Optional[str] = None
+    copiar_ficha_clinica: bool = True
+    copiar_cadastro_medico: bool = True
+    copiar_historico_vacinas: bool = True
+    copiar_historico_laboral: bool = True
+    copiar_socged: bool = True
+    migrar_somente_ficha: bool = True
+
+    def como_kwargs(self) -> Dict[str, Any]:
+        """Retorna os argumentos para ``FuncionarioOperations.transferir``."""
+        return {
+            "termo_busca": self.termo_busca,
+            "tipo_busca": self.tipo_busca,
+            "filtros": self.filtros,
+            "empresa_origem": self.empresa_origem,
+            "empresa_destino": self.empresa_destino,
+            "copiar_ficha_clinica": self.copiar_ficha_clinica,
+            "copiar_cadastro_medico": self.copiar_cadastro_medico,
+            "copiar_historico_vacinas": self.copiar_historico_vacinas,
+            "copiar_historico_laboral": self.copiar_historico_laboral,
+            "copiar_socged": self.copiar_socged,
+            "migrar_somente_ficha": self.migrar_somente_ficha,
+        }
+
+
+@dataclass
+class ResultadoJob:
+    """Resultado da execução de um job de transferência."""
+
+    job_id: str
+    sucesso: bool
+    duracao: float = 0.0
+    worker_id: Optional[int] = None
+    erro: Optional[str] = None
+    # Empresa em que a sessão do worker ficou ao final do job
+    empresa_final: Optional[str] = None
+    trocas_evitadas: int = 0
+    # True quando o job já constava como salvo no journal e não foi reexecutado
+    retomado: bool = False
+    # Conta SOC (username) usada pelo worker
+    conta: Optional[str] = None
+    # Duração (s) de cada etapa executada (ver SPANS_ETAPAS) e das esperas pelo SOC (ESPERA_*)
+    duracoes_etapas: Dict[str, float] = field(default_factory=dict)
+    # Timeouts do SOC observados durante o job
+    timeouts: int = 0
+
+
+@dataclass
+class ResultadoLote:
+    """Resultado agregado de uma execução em lote."""
+
+    resultados: List[ResultadoJob] = field(default_factory=list)
+    duracao_total: float = 0.0
+    workers: int = 0
+
+    @property
+    def sucessos(self) -> int:
+        return sum(1 for r in self.resultados if r.sucesso)
+
+    @property
+    def falhas(self) -> int:
+        return len(self.resultados) - self.sucessos
+
+    @property
+    def trocas_evitadas(self) -> int:
+        """Trocas de empresa evitadas por a sessão já estar na empresa de origem."""
+        return sum(r.trocas_evitadas for r in self.resultados)
+
+    @property
+    def jobs_por_conta(self) -> Dict[str, int]:
+        """Jobs executados por conta SOC (exclui retomados e não executados)."""
+        contagem: Dict[str, int] = {}
+        for r in self.resultados:
+            if r.conta:
+                contagem[r.conta] = contagem.get(r.conta, 0) + 1
+        return contagem
+
+    @property
+    def throughput(self) -> float:
+        """Jobs concluídos por minuto."""
+        if self.duracao_total <= 0:
+            return 0.0
+        return len(self.resultados) * 60.0 / self.duracao_total
+
+
+@dataclass(frozen=True)
+class FuncionarioEncontrado:
+    """Linha da tabela de resultados da busca de funcionários (tela 232)."""
+
+    codigo: str
+    nome: str
+    situacao: str = ""
+    selbrowse_id: Optional[str] = None
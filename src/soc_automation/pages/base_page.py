@@ -1,20 +1,34 @@
+from typing import Optional
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from ..core.config import get_configuracao
 from ..core.logger import get_logger
-from ..handlers.modal_handler import ModalHandler
+from ..core.session_context import FRAME_PRINCIPAL, FRAME_SOC, get_session_context
 
 
 class BasePage:
-    """Classe base para todas as páginas."""
+    """Classe base para todas as páginas.
+    
+    As páginas de um mesmo driver compartilham o ``SessionContext``: o
+    WebDriverWait, o ModalHandler e a janela/frame atuais, de modo que trocas
+    de frame redundantes não chegam ao driver.
+    
+    Sem ``timeout`` explícito, as esperas usam ``browser.timeout`` e
+    ``browser.timeout_curto`` do config.yaml.
+    """
     
-    def __init__(self, driver: webdriver.Chrome) -> None:
+    def __init__(self, driver: webdriver.Chrome, timeout: Optional[float] = None) -> None:
         self.driver = driver
         self.logger = get_logger(__name__)
-        self.wait = WebDriverWait(driver, 10)
-        self.modal_handler = ModalHandler(driver)
+        config = get_configuracao().browser
+        self.timeout = config.timeout if timeout is None else timeout
+        self.timeout_curto = config.timeout_curto
+        self.context = get_session_context(driver)
+        self.wait = self.context.obter_wait(driver, self.timeout)
+        self.modal_handler = self.context.obter_modal_handler(driver)
     
     def find_element(self, locator):
         """Encontra um elemento com espera."""
@@ -40,12 +54,34 @@ class BasePage:
         self.modal_handler.check_and_handle_modal()
     
     def switch_to_default_frame(self) -> None:
-        """Muda para o frame padrão."""
+        """Muda para o frame padrão (sem chamada ao driver se já estiver nele)."""
+        if self.context.frame_atual == FRAME_PRINCIPAL:
+            return
+        self.context.frame_atual = None
         self.driver.switch_to.default_content()
+        self.context.frame_atual = FRAME_PRINCIPAL
     
     def switch_to_soc_frame(self) -> None:
-        """Muda para o frame socframe."""
+        """Muda para o frame socframe (sem chamada ao driver se já estiver nele)."""
+        if self.context.frame_atual == FRAME_SOC:
+            return
+        if self.context.frame_atual is None:
+            self.switch_to_default_frame()
+        self.context.frame_atual = None
         self.wait.until(EC.frame_to_be_available_and_switch_to_it("socframe"))
+        self.context.frame_atual = FRAME_SOC
+    
+    def current_window(self) -> str:
+        """Handle da janela atual, consultando o driver apenas se ainda não for conhecido."""
+        if self.context.janela_atual is None:
+            self.context.janela_atual = self.driver.current_window_handle
+        return self.context.janela_atual
+    
+    def switch_to_window(self, handle: str) -> None:
+        """Muda para a janela informada e registra a troca no contexto."""
+        self.context.janela_atual = None
+        self.driver.switch_to.window(handle)
+        self.context.registrar_janela(handle)
     
     def navigate_to_screen(self, screen_code: str) -> None:
         """Navega para uma tela específica usando JavaScript."""
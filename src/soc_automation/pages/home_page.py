@@ -1,7 +1,34 @@
 import re
+from typing import Optional
+
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
 from ..core.logger import get_logger
+from ..core.metrics import get_metricas
+from ..utils.html_utils import codigo_empresa, normalizar_empresa
+from ..utils.wait_utils import (
+    esperar_opcional,
+    executar_marcando_socframe,
+    info_programa_comeca_com,
+    marcar_socframe,
+    socframe_recarregado,
+)
+
+# Mapeia cada número entre aspas no onclick das linhas do menu (MainJava) para o script;
+# vale a primeira linha em que o número aparece, como na busca linha a linha
+_SCRIPT_INDICE_TELAS = """
+var indice = {};
+var linhas = window.top.document.querySelectorAll("tr[onclick*='MainJava']");
+for (var i = 0; i < linhas.length; i++) {
+    var onclick = linhas[i].getAttribute('onclick') || '';
+    var numeros = onclick.match(/'\\d+'/g) || [];
+    numeros.forEach(function (numero) {
+        var chave = numero.slice(1, -1);
+        if (!(chave in indice)) { indice[chave] = onclick; }
+    });
+}
+return indice;
+"""
 
 
 class HomePage(BasePage):
@@ -13,52 +40,120 @@ class HomePage(BasePage):
     
     def navigate_to_screen_by_number(self, screen_number: str) -> bool:
         """Navega para uma tela pelo número e verifica se chegou corretamente."""
-        self.switch_to_default_frame()
-        
-        # Busca o menu
-        menu_items = self.driver.find_elements(By.XPATH, "//tr[contains(@onclick, 'MainJava')]")
+        with get_metricas().span("navegacao", tela=screen_number) as span:
+            self.switch_to_default_frame()
+            
+            onclick = self._find_screen_script(screen_number)
+            if not onclick:
+                self.logger.error(f"Tela {screen_number} não encontrada")
+                span.falhou()
+                return False
+            
+            marca = executar_marcando_socframe(self.driver, onclick)
+            self.logger.info(f"Navegando para tela {screen_number}")
+            
+            # Verifica se chegou na tela correta
+            if not self._verify_screen_navigation(screen_number, marca):
+                span.falhou()
+                return False
+            return True
+    
+    def _find_screen_script(self, screen_number: str) -> Optional[str]:
+        """Obtém o onclick da tela pelo índice do menu da sessão.
         
-        for item in menu_items:
-            onclick = item.get_attribute("onclick")
-            if onclick and f"'{screen_number}'" in onclick:
-                self.driver.execute_script(onclick)
-                self.logger.info(f"Navegando para tela {screen_number}")
-                
-                # Verifica se chegou na tela correta
-                return self._verify_screen_navigation(screen_number)
+        O índice é reconstruído quando a empresa muda ou quando a tela não é
+        encontrada (o menu pode ter sido recarregado).
+        """
+        context = self.context
+        if context.indice_telas is None or context.indice_telas_empresa != context.empresa_atual:
+            self._build_screen_index()
         
-        self.logger.error(f"Tela {screen_number} não encontrada")
-        return False
+        onclick = context.indice_telas.get(screen_number)
+        if onclick is None:
+            self._build_screen_index()
+            onclick = context.indice_telas.get(screen_number)
+        return onclick
     
-    def _verify_screen_navigation(self, expected_number: str) -> bool:
-        """Verifica se chegou na tela correta."""
-        import time
-        time.sleep(3) 
+    def _build_screen_index(self) -> None:
+        """Constrói, em uma única chamada, o mapa número da tela -> onclick do menu."""
+        self.context.indice_telas = self.driver.execute_script(_SCRIPT_INDICE_TELAS) or {}
+        self.context.indice_telas_empresa = self.context.empresa_atual
+        self.logger.info(f"Índice do menu construído com {len(self.context.indice_telas)} tela(s)")
+    
+    def _verify_screen_navigation(self, expected_number: str, marca=None) -> bool:
+        """Verifica se chegou na tela correta.
         
+        Args:
+            expected_number: Número da tela esperada
+            marca: Marca do socframe gravada antes da navegação (opcional)
+        """
         try:
-            screen_info, _ = self.get_current_screen_info()
-            if screen_info.startswith(expected_number):
+            screen_info = esperar_opcional(
+                self.driver, info_programa_comeca_com(expected_number), self.timeout
+            )
+            if screen_info:
+                esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
                 self.logger.info(f"Navegação confirmada: {screen_info}")
                 return True
             else:
+                screen_info, _ = self.get_current_screen_info()
                 self.logger.error(f"Esperado tela {expected_number}, mas está em: {screen_info}")
                 return False
         except Exception as e:
             self.logger.error(f"Erro ao verificar navegação: {e}")
             return False
     
+    def get_current_company(self) -> str:
+        """Retorna o texto de infoEmpresa da janela principal, em qualquer frame."""
+        script = """
+        var info = window.top.document.getElementById('infoEmpresa');
+        return info ? (info.textContent || '').trim() : '';
+        """
+        return self.driver.execute_script(script) or ""
+    
+    def sincronizar_empresa(self) -> Optional[str]:
+        """Lê o código da empresa da sessão para o ``SessionContext`` (ex: após login ou reinício do navegador).
+        
+        Returns:
+            Optional[str]: Código da empresa atual, ou None se não foi possível lê-lo
+        """
+        try:
+            self.context.empresa_atual = codigo_empresa(self.get_current_company())
+        except Exception as e:
+            self.logger.warning(f"Não foi possível ler a empresa atual: {e}")
+            self.context.empresa_atual = None
+        return self.context.empresa_atual
+    
     def change_company(self, company_id: str) -> None:
         """Troca de empresa."""
-        self.go_to_main_screen()
-        self.switch_to_soc_frame()
-        script = f"javascript:choiceemp('{company_id}');"
-        self.driver.execute_script(script)
-        self.logger.info(f"Trocando para empresa ID: {company_id}")
-        self.check_modal()
+        with get_metricas().span("troca_empresa"):
+            self.go_to_main_screen()
+            self.switch_to_soc_frame()
+            marca = marcar_socframe(self.driver)
+            script = f"javascript:choiceemp('{company_id}');"
+            self.driver.execute_script(script)
+            self.logger.info(f"Trocando para empresa ID: {company_id}")
+            esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
+            self.check_modal()
+            self.context.empresa_atual = normalizar_empresa(company_id)
+    
+    def ensure_company(self, company_id: str) -> bool:
+        """Troca de empresa apenas se a sessão ainda não estiver nela.
+        
+        Returns:
+            bool: True se houve troca, False se a sessão já estava na empresa
+        """
+        if self.context.empresa_atual is not None and self.context.empresa_atual == normalizar_empresa(company_id):
+            self.logger.info(f"Sessão já está na empresa {company_id}, troca evitada")
+            return False
+        self.change_company(company_id)
+        return True
     
     def go_to_main_screen(self) -> None:
         """Volta para a tela principal."""
         self.switch_to_default_frame()
+        marca = marcar_socframe(self.driver)
         script = "javascript:Empresas(); hideall();hidemenus('');menu_close();avisoLogin();"
         self.driver.execute_script(script)
-        self.logger.info("Voltando para tela principal")
\ No newline at end of file
+        self.logger.info("Voltando para tela principal")
+        esperar_opcional(self.driver, socframe_recarregado(marca), self.timeout)
\ No newline at end of file
@@ -1,11 +1,14 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from typing import Optional
+
 from selenium.common.exceptions import TimeoutException
 
 from .base_page import BasePage
-from ..handlers.modal_handler import ModalHandler
+from ..core.config import get_configuracao
 from ..core.logger import get_logger
+from ..core.retry import ErroDeterministico, ErroTransitorio, PoliticaRetry
+from ..utils.wait_utils import elemento_presente, esperar_opcional, qualquer
 
 
 class LoginPage(BasePage):
@@ -14,7 +17,6 @@ class LoginPage(BasePage):
     def __init__(self, driver):
         super().__init__(driver)
         self.logger = get_logger(__name__)
-        self.modal_handler = ModalHandler(driver)
     
     def fill_credentials(self, username: str, password: str, company_id: str) -> None:
         """Preenche as credenciais usando JavaScript."""
@@ -30,55 +32,86 @@ class LoginPage(BasePage):
         script = "document.getElementById('bt_entrar').click();"
         self.driver.execute_script(script)
     
-    def verify_login_success(self) -> bool:
-        """Verifica se o login foi bem sucedido."""
+    def verify_login_success(self, timeout: Optional[float] = None) -> bool:
+        """Verifica se o login foi bem sucedido.
+        
+        Args:
+            timeout: Tempo máximo de espera pela barra do sistema (padrão: ``browser.timeout_login``)
+        """
+        config = get_configuracao().browser
+        if timeout is None:
+            timeout = config.timeout_login
         try:
             # Aguarda a barra aparecer
-            WebDriverWait(self.driver, 10).until(
+            self.context.obter_wait(self.driver, timeout).until(
                 EC.presence_of_element_located((By.ID, "barra"))
             )
             # Verifica elementos adicionais para confirmar
-            WebDriverWait(self.driver, 5).until(
+            self.context.obter_wait(self.driver, config.timeout_confirmacao_login).until(
                 EC.presence_of_element_located((By.ID, "barraIcones"))
             )
             return True
         except TimeoutException:
             return False
     
-    def login(self, username: str, password: str, company_id: str, max_attempts: int = 2) -> bool:
+    def login(self, username: str, password: str, company_id: str, max_attempts: Optional[int] = None) -> bool:
         """Realiza o login com tratamento de erros.
         
+        Credenciais incorretas falham na hora (nova tentativa só aproximaria
+        o bloqueio do usuário); falhas transitórias são repetidas com backoff.
+        
         Args:
             username: Nome de usuário
             password: Senha
             company_id: ID da empresa
-            max_attempts: Número máximo de tentativas (padrão: 2)
+            max_attempts: Número máximo de tentativas (padrão: ``retry.tentativas_login``,
+                com backoff a partir de ``retry.base_login``)
             
         Returns:
             bool: True se login bem sucedido, False caso contrário
         """
-        for attempt in range(1, max_attempts + 1):
-            self.logger.info(f"Tentativa de login {attempt}/{max_attempts}")
-            
-            self.fill_credentials(username, password, company_id)
-            self.click_login_button()
-            
-            # Verifica se apareceu modal de erro
-            modal_found, message = self.modal_handler.check_and_handle_modal()
-            
-            if modal_found:
-                if "incorreto" in message.lower() or "senha" in message.lower():
-                    self.logger.error(f"Erro de credenciais: {message}")
-                    if attempt == max_attempts:
-                        self.logger.error("Limite de tentativas atingido. Parando para evitar bloqueio.")
-                        return False
-                    continue
-                else:
-                    self.logger.warning(f"Alerta do sistema: {message}")
-            
-            # Verifica se login foi bem sucedido
-            if self.verify_login_success():
-                self.logger.info("Login realizado com sucesso!")
-                return True
-                
-        return False
\ No newline at end of file
+        config = get_configuracao().retry
+        if max_attempts is None:
+            max_attempts = config.tentativas_login
+        politica = PoliticaRetry(tentativas=max_attempts, base=config.base_login)
+        try:
+            politica.executar(
+                lambda: self._tentar_login(username, password, company_id), descricao="Login"
+            )
+        except ErroDeterministico as e:
+            self.logger.error(f"Erro de credenciais: {e}. Parando para evitar bloqueio.")
+            return False
+        except Exception as e:
+            self.logger.error(f"Login não realizado: {e}")
+            return False
+        
+        self.logger.info("Login realizado com sucesso!")
+        return True
+    
+    def _tentar_login(self, username: str, password: str, company_id: str) -> None:
+        """Uma tentativa de login.
+        
+        Raises:
+            ErroDeterministico: Credenciais recusadas pelo SOC
+            ErroTransitorio: Login não confirmado pela barra do sistema
+        """
+        self.fill_credentials(username, password, company_id)
+        self.click_login_button()
+        
+        # Aguarda a barra do sistema ou um modal, o que vier primeiro
+        esperar_opcional(self.driver, qualquer(
+            elemento_presente((By.ID, "barra")),
+            self.modal_handler.modal_detected()
+        ), self.timeout)
+        
+        # Verifica se apareceu modal de erro
+        modal_found, message = self.modal_handler.check_and_handle_modal()
+        
+        if modal_found:
+            if "incorreto" in message.lower() or "senha" in message.lower():
+                raise ErroDeterministico(message)
+            self.logger.warning(f"Alerta do sistema: {message}")
+        
+        # Verifica se login foi bem sucedido
+        if not self.verify_login_success():
+            raise ErroTransitorio("barra do sistema não apareceu após o login")
@@ -0,0 +1,163 @@
+"""Benchmark por etapa da automação contra o servidor SOC simulado.
+
+Mede o login e cada etapa de ``FuncionarioOperations.transferir`` e compara
+as medianas com um arquivo de baseline, falhando quando alguma etapa
+regride além da tolerância.
+
+Uso:
+    python -m soc_automation.testing.benchmark --baseline benchmark_baseline.json --atualizar
+    python -m soc_automation.testing.benchmark --baseline benchmark_baseline.json
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..core.logger import get_logger
+from .mock_server import MockSOCServer
+
+ETAPA_LOGIN = "login"
+
+# Regressão: mediana acima de baseline * (1 + TOLERANCIA) + FOLGA_ABSOLUTA
+TOLERANCIA_PADRAO = 0.25
+# Evita falsos positivos em etapas de poucos milissegundos
+FOLGA_ABSOLUTA_PADRAO = 0.05
+
+# Funcionário e empresas do conjunto padrão do servidor simulado
+EMPRESA_ORIGEM = "1001"
+EMPRESA_DESTINO = "2002"
+TERMO_BUSCA = "100001"
+TIPO_BUSCA = "codigo"
+
+
+def _percentil(valores: List[float], percentil: float) -> float:
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, max(0, round(percentil / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def resumir(amostras: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    """Resume as amostras de cada etapa (segundos) em mediana, p95 e máximo."""
+    return {
+        etapa: {
+            "mediana": statistics.median(valores),
+            "p95": _percentil(valores, 95),
+            "max": max(valores),
+            "amostras": len(valores),
+        }
+        for etapa, valores in amostras.items() if valores
+    }
+
+
+def executar_benchmark(repeticoes: int = 5,
+                       latencia: float = 0.02,
+                       headless: bool = True,
+                       servidor: Optional[MockSOCServer] = None) -> Dict[str, Dict[str, float]]:
+    """Executa login e ``repeticoes`` transferências, cronometrando cada etapa.
+
+    Cada transferência usa um cache de funcionários novo, medindo a busca
+    completa (sem atalho pelo cache).
+
+    Args:
+        repeticoes: Número de transferências medidas
+        latencia: Latência de cada resposta do servidor simulado (segundos)
+        headless: Se True, executa o navegador em modo headless
+        servidor: Servidor já configurado (None cria um com ``latencia``)
+
+    Returns:
+        Dict[str, Dict[str, float]]: Resumo por etapa (ver ``resumir``)
+    """
+    from ..core.browser import Browser
+    from ..operations.funcionario_cache import FuncionarioCache
+    from ..pages.login_page import LoginPage
+
+    logger = get_logger(__name__)
+    amostras: Dict[str, List[float]] = {ETAPA_LOGIN: []}
+    servidor_proprio = servidor is None
+    servidor = servidor or MockSOCServer(latencia=latencia)
+    servidor.start()
+    browser = Browser(headless=headless)
+
+    try:
+        browser.start()
+        browser.navigate_to(servidor.url)
+        inicio = time.perf_counter()
+        if not LoginPage(browser.driver).login("benchmark", "benchmark", EMPRESA_ORIGEM):
+            raise RuntimeError("Login no servidor simulado falhou")
+        amostras[ETAPA_LOGIN].append(time.perf_counter() - inicio)
+
+        for repeticao in range(1, repeticoes + 1):
+            func_ops = browser.get_funcionario_operations(cache=FuncionarioCache())
+            etapas = func_ops.etapas_transferencia(
+                TERMO_BUSCA, tipo_busca=TIPO_BUSCA,
+                empresa_origem=EMPRESA_ORIGEM, empresa_destino=EMPRESA_DESTINO
+            )
+            for etapa, executar in etapas:
+                inicio = time.perf_counter()
+                sucesso = func_ops.executar_etapa(etapa, executar)
+                amostras.setdefault(etapa, []).append(time.perf_counter() - inicio)
+                if not sucesso:
+                    raise RuntimeError(f"Etapa '{etapa}' falhou na repetição {repeticao}")
+            logger.info(f"Repetição {repeticao}/{repeticoes} concluída")
+    finally:
+        browser.quit()
+        if servidor_proprio:
+            servidor.stop()
+
+    return resumir(amostras)
+
+
+def comparar_com_baseline(resultado: Dict[str, Dict[str, float]],
+                          baseline: Dict[str, Dict[str, float]],
+                          tolerancia: float = TOLERANCIA_PADRAO,
+                          folga_absoluta: float = FOLGA_ABSOLUTA_PADRAO) -> List[str]:
+    """Lista as etapas cuja mediana regrediu em relação ao baseline.
+
+    Returns:
+        List[str]: Uma descrição por etapa regredida (vazia se nenhuma)
+    """
+    regressoes = []
+    for etapa, base in baseline.items():
+        atual = resultado.get(etapa)
+        if atual is None:
+            regressoes.append(f"{etapa}: ausente na execução atual")
+            continue
+        limite = base["mediana"] * (1 + tolerancia) + folga_absoluta
+        if atual["mediana"] > limite:
+            regressoes.append(
+                f"{etapa}: mediana {atual['mediana']:.3f}s > limite {limite:.3f}s "
+                f"(baseline {base['mediana']:.3f}s)"
+            )
+    return regressoes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark por etapa contra o SOC simulado")
+    parser.add_argument("--baseline", type=Path, required=True, help="Arquivo JSON de baseline")
+    parser.add_argument("--atualizar", action="store_true", help="Grava o resultado como novo baseline")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--latencia", type=float, default=0.02)
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO)
+    parser.add_argument("--janela", action="store_true", help="Executa com o navegador visível")
+    args = parser.parse_args(argv)
+
+    resultado = executar_benchmark(args.repeticoes, args.latencia, headless=not args.janela)
+    for etapa, metricas in resultado.items():
+        print(f"{etapa:20s} mediana={metricas['mediana']:.3f}s p95={metricas['p95']:.3f}s")
+
+    if args.atualizar or not args.baseline.exists():
+        args.baseline.write_text(json.dumps(resultado, indent=2, sort_keys=True))
+        print(f"Baseline gravado em {args.baseline}")
+        return 0
+
+    regressoes = comparar_com_baseline(resultado, json.loads(args.baseline.read_text()), args.tolerancia)
+    for regressao in regressoes:
+        print(f"REGRESSÃO {regressao}")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,627 @@
+"""Servidor local que imita as telas do SOC usadas pela automação.
+
+Reproduz o login (``usu``/``senha``/``empsoc``/``bt_entrar``), a janela
+principal com ``#barra``, ``infoPrograma``/``infoEmpresa``, o menu MainJava e
+o ``socframe``, a troca de empresa (``choiceemp``), a tela 232 com
+``table.resultados`` e paginação, o cadastro com ``transfunc``, a tela de
+transferência (``alt``, ``trazUnseca``, ``fassociarTodos``), o popup de
+``zoom()`` com ``sendValue`` e o alerta do ``save``, além dos modais
+``modalalertas``, ``modalTransfFuncionario`` e ``alertaErroTransferencia``.
+
+A latência de cada rota é configurável, para medir as etapas da automação
+sem acessar o SOC de produção.
+
+Exemplo:
+    with MockSOCServer(latencia=0.05) as servidor:
+        browser.navigate_to(servidor.url)
+        LoginPage(browser.driver).login("usuario", "senha", "1001")
+"""
+import html
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, quote, urlsplit
+
+from ..core.logger import get_logger
+
+# Rotas com latência configurável individualmente
+ROTAS = ("login", "principal", "empresas", "tela", "busca", "cadastro", "transferencia", "popup", "save")
+
+COOKIE_SESSAO = "SOCSESSION"
+
+# Registros por página da tabela de resultados
+TAMANHO_PAGINA = 20
+
+# Telas do menu MainJava (número, nome); apenas a 232 é funcional
+TELAS_MENU = (("232", "Funcionários"), ("300", "Unidades"), ("303", "Setores"), ("640", "Exames"))
+
+# codigoPesquisaFuncionario -> atributo de Funcionario comparado na busca
+CAMPOS_BUSCA = {"0": "nome", "1": "codigo", "2": "rg", "3": "cpf", "4": "matricula"}
+
+# Radios do popup de zoom (TIPOS_BUSCA_POPUP) -> atributo comparado
+CAMPOS_BUSCA_POPUP = {"rbNome": "nome", "rbCodigo": "codigo", "rbRG": "rg", "rbCPF": "cpf", "rbMatricula": "matricula"}
+
+OPCOES_TRANSFERENCIA = (
+    "copiaFichaClinica", "copiaCadastroMedico", "copiaHistoricoVacinas",
+    "copiaHistoricoLaboral", "copiaSocGed", "migrarSomenteFicha",
+)
+
+_e = html.escape
+
+
+@dataclass
+class Funcionario:
+    """Funcionário do conjunto de dados do servidor simulado."""
+
+    codigo: str
+    nome: str
+    cpf: str
+    empresa: str
+    situacao: str = "Ativo"
+    rg: str = ""
+    matricula: str = ""
+
+
+@dataclass
+class Transferencia:
+    """Transferência recebida pelo 'save' do servidor simulado."""
+
+    codigo: str
+    empresa_origem: str
+    empresa_destino: str
+    funcionario_destino: str
+    opcoes: Dict[str, bool] = field(default_factory=dict)
+
+
+@dataclass
+class _Sessao:
+    usuario: str
+    empresa: str
+    programa: str = "Página Inicial"
+    aviso_pendente: Optional[str] = None
+
+
+def funcionarios_exemplo(quantidade: int = 200, empresa: str = "1001") -> List[Funcionario]:
+    """Gera um conjunto de funcionários com CPF, RG e matrícula distintos."""
+    return [
+        Funcionario(
+            codigo=str(100000 + i),
+            nome=f"FUNCIONARIO TESTE {i:04d}",
+            cpf=f"{i:03d}.{i % 1000:03d}.{(i * 7) % 1000:03d}-{i % 100:02d}",
+            empresa=empresa,
+            situacao="Ativo" if i % 10 else "Inativo",
+            rg=f"{5000000 + i}",
+            matricula=f"M{i:05d}",
+        )
+        for i in range(1, quantidade + 1)
+    ]
+
+
+def _normalizar(valor: str) -> str:
+    return "".join(c for c in valor.lower() if c.isalnum())
+
+
+def _pagina(titulo: str, corpo: str, script: str = "") -> str:
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{_e(titulo)}</title><script>{script}</script></head>"
+        f"<body>{corpo}</body></html>"
+    )
+
+
+# Funções comuns às telas do socframe: submit com 'acao' e aviso do programa atual
+_JS_FRAME = """
+function doAcao(acao) {
+    var f = document.forms['formulario'];
+    f.elements['acao'].value = acao;
+    f.submit();
+}
+function atualizarTopo(programa, empresa) {
+    try {
+        var doc = window.top.document;
+        if (programa !== null) { doc.getElementById('infoPrograma').textContent = programa; }
+        if (empresa !== null) { doc.getElementById('infoEmpresa').textContent = empresa; }
+    } catch (e) {}
+}
+"""
+
+_JS_MODAL = """
+function fecharModal(id) { document.getElementById(id).style.display = 'none'; }
+"""
+
+
+def _modal(modal_id: str, mensagem: Optional[str], conteudo_id: str = "modalalertasConteudo") -> str:
+    """Modal no formato do SOC; visível apenas se houver mensagem."""
+    estilo = "block" if mensagem else "none"
+    return (
+        f"<div id=\"{modal_id}\" style=\"display:{estilo}\">"
+        f"<div id=\"{conteudo_id}\" class=\"modalConteudo\">{_e(mensagem or '')}</div>"
+        f"<button id=\"btn_ok\" type=\"button\" onclick=\"fecharModal('{modal_id}')\">OK</button>"
+        "</div>"
+    )
+
+
+class MockSOCServer:
+    """Servidor HTTP local com as telas do SOC usadas pela automação.
+
+    Args:
+        latencia: Atraso padrão, em segundos, de cada resposta.
+        latencias: Atraso por rota (ver ``ROTAS``), sobrepondo o padrão.
+        funcionarios: Conjunto de funcionários (padrão: ``funcionarios_exemplo()``).
+        usuario: Usuário aceito no login (None aceita qualquer um).
+        senha: Senha aceita no login (None aceita qualquer uma).
+        aviso_login: Mensagem exibida em ``modalalertas`` após o login.
+        erro_transferencia: Se True, o 'save' exibe ``alertaErroTransferencia``.
+        mover_transferidos: Se True, o 'save' move o funcionário para a
+            empresa destino (desativado para permitir repetir a mesma
+            transferência em benchmarks).
+        host: Endereço de escuta.
+        porta: Porta de escuta (0 escolhe uma porta livre).
+    """
+
+    def __init__(self,
+                 latencia: float = 0.0,
+                 latencias: Optional[Dict[str, float]] = None,
+                 funcionarios: Optional[List[Funcionario]] = None,
+                 usuario: Optional[str] = None,
+                 senha: Optional[str] = None,
+                 aviso_login: Optional[str] = None,
+                 erro_transferencia: bool = False,
+                 mover_transferidos: bool = False,
+                 host: str = "127.0.0.1",
+                 porta: int = 0) -> None:
+        self.logger = get_logger(__name__)
+        self.latencia = latencia
+        self.latencias = dict(latencias or {})
+        self.funcionarios = list(funcionarios) if funcionarios is not None else funcionarios_exemplo()
+        self.usuario = usuario
+        self.senha = senha
+        self.aviso_login = aviso_login
+        self.erro_transferencia = erro_transferencia
+        self.mover_transferidos = mover_transferidos
+        self.transferencias: List[Transferencia] = []
+        self.requisicoes: Dict[str, int] = {rota: 0 for rota in ROTAS}
+        self._sessoes: Dict[str, _Sessao] = {}
+        self._lock = threading.Lock()
+        self._endereco = (host, porta)
+        self._servidor: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL da página inicial (equivalente a https://sistema.soc.com.br/WebSoc/)."""
+        if not self._servidor:
+            raise RuntimeError("Servidor não iniciado")
+        host, porta = self._servidor.server_address[:2]
+        return f"http://{host}:{porta}/WebSoc/"
+
+    def start(self) -> "MockSOCServer":
+        """Inicia o servidor em uma thread daemon."""
+        if self._servidor:
+            return self
+        self._servidor = ThreadingHTTPServer(self._endereco, _Handler)
+        self._servidor.daemon_threads = True
+        self._servidor.mock = self
+        self._thread = threading.Thread(target=self._servidor.serve_forever, name="mock-soc", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Servidor SOC simulado em {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Encerra o servidor."""
+        if self._servidor:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
+            self._thread = None
+
+    def __enter__(self) -> "MockSOCServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _aguardar(self, rota: str) -> None:
+        with self._lock:
+            self.requisicoes[rota] += 1
+        atraso = self.latencias.get(rota, self.latencia)
+        if atraso > 0:
+            time.sleep(atraso)
+
+    def _buscar(self, campo: str, termo: str, empresa: Optional[str]) -> List[Funcionario]:
+        termo_normalizado = _normalizar(termo)
+        encontrados = []
+        for funcionario in self.funcionarios:
+            if empresa and funcionario.empresa != empresa:
+                continue
+            valor = _normalizar(getattr(funcionario, campo))
+            if (termo_normalizado in valor) if campo == "nome" else (valor == termo_normalizado):
+                encontrados.append(funcionario)
+        return encontrados
+
+    def _funcionario(self, codigo: str) -> Optional[Funcionario]:
+        return next((f for f in self.funcionarios if f.codigo == codigo), None)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def mock(self) -> MockSOCServer:
+        return self.server.mock
+
+    def log_message(self, format: str, *args) -> None:
+        self.mock.logger.debug(format % args)
+
+    def do_GET(self) -> None:
+        self._tratar({})
+
+    def do_POST(self) -> None:
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        corpo = self.rfile.read(tamanho).decode("utf-8", errors="replace")
+        self._tratar({chave: valores[-1] for chave, valores in parse_qs(corpo, keep_blank_values=True).items()})
+
+    # Respostas
+
+    def _responder(self, conteudo: str, status: int = 200, cabecalhos: Optional[Dict[str, str]] = None) -> None:
+        dados = conteudo.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(dados)))
+        self.send_header("Cache-Control", "no-store")
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def _redirecionar(self, destino: str, cabecalhos: Optional[Dict[str, str]] = None) -> None:
+        self._responder("", 303, dict(cabecalhos or {}, Location=destino))
+
+    def _sessao(self) -> Optional[_Sessao]:
+        for parte in (self.headers.get("Cookie") or "").split(";"):
+            nome, _, valor = parte.strip().partition("=")
+            if nome == COOKIE_SESSAO:
+                return self.mock._sessoes.get(valor)
+        return None
+
+    def _tratar(self, form: Dict[str, str]) -> None:
+        url = urlsplit(self.path)
+        query = {chave: valores[-1] for chave, valores in parse_qs(url.query).items()}
+        caminho = url.path.rstrip("/")
+
+        if caminho == "/WebSoc/login":
+            self.mock._aguardar("login")
+            return self._login(form)
+
+        sessao = self._sessao()
+        if caminho in ("", "/WebSoc"):
+            self.mock._aguardar("principal")
+            return self._principal(sessao) if sessao else self._pagina_login(None)
+        if not sessao:
+            return self._redirecionar("/WebSoc/")
+
+        if caminho == "/WebSoc/frame/empresas":
+            self.mock._aguardar("empresas")
+            return self._empresas(sessao, query.get("emp"))
+        if caminho == "/WebSoc/frame/232":
+            return self._tela_232(sessao, form)
+        if caminho.startswith("/WebSoc/frame/"):
+            self.mock._aguardar("tela")
+            return self._tela_generica(sessao, caminho.rsplit("/", 1)[-1])
+        if caminho == "/WebSoc/popup":
+            self.mock._aguardar("popup")
+            return self._popup(query, form)
+        self._responder(_pagina("Não encontrado", "<h1>404</h1>"), 404)
+
+    # Login e janela principal
+
+    def _login(self, form: Dict[str, str]) -> None:
+        usuario, senha, empresa = form.get("usu", ""), form.get("senha", ""), form.get("empsoc", "")
+        valido = (
+            usuario and senha
+            and (self.mock.usuario is None or usuario == self.mock.usuario)
+            and (self.mock.senha is None or senha == self.mock.senha)
+        )
+        if not valido:
+            return self._pagina_login("Usuário ou senha incorretos")
+
+        token = secrets.token_hex(16)
+        with self.mock._lock:
+            self.mock._sessoes[token] = _Sessao(usuario, empresa, aviso_pendente=self.mock.aviso_login)
+        self._redirecionar("/WebSoc/", {"Set-Cookie": f"{COOKIE_SESSAO}={token}; Path=/; HttpOnly"})
+
+    def _pagina_login(self, erro: Optional[str]) -> None:
+        corpo = (
+            "<form id=\"formLogin\" method=\"post\" action=\"/WebSoc/login\">"
+            "<input id=\"usu\" name=\"usu\" type=\"text\">"
+            "<input id=\"senha\" name=\"senha\" type=\"password\">"
+            "<input id=\"empsoc\" name=\"empsoc\" type=\"text\">"
+            "<button id=\"bt_entrar\" type=\"button\" "
+            "onclick=\"document.getElementById('formLogin').submit()\">Entrar</button>"
+            "</form>"
+            + _modal("modalalertas", erro)
+        )
+        self._responder(_pagina("SOC - Login", corpo, _JS_MODAL))
+
+    def _principal(self, sessao: _Sessao) -> None:
+        menu = "".join(
+            f"<tr onclick=\"MainJava('{numero}', '{_e(nome)}');\"><td>{numero}</td><td>{_e(nome)}</td></tr>"
+            for numero, nome in TELAS_MENU
+        )
+        aviso, sessao.aviso_pendente = sessao.aviso_pendente, None
+        corpo = (
+            "<div id=\"barra\"><div id=\"barraIcones\"></div>"
+            f"<span id=\"infoPrograma\">{_e(sessao.programa)}</span> "
+            f"<span id=\"infoEmpresa\">{_e(sessao.empresa)}</span></div>"
+            f"<table id=\"menu\">{menu}</table>"
+            "<iframe id=\"socframe\" name=\"socframe\" src=\"/WebSoc/frame/empresas\" "
+            "style=\"width:1200px;height:600px\"></iframe>"
+            + _modal("modalalertas", aviso)
+        )
+        script = _JS_MODAL + """
+function MainJava(numero, nome) {
+    document.getElementById('infoPrograma').textContent = numero + ' - ' + nome;
+    document.getElementById('socframe').src = '/WebSoc/frame/' + numero;
+}
+function Empresas() {
+    document.getElementById('infoPrograma').textContent = 'Página Inicial';
+    document.getElementById('socframe').src = '/WebSoc/frame/empresas';
+}
+function hideall() {}
+function hidemenus(menu) {}
+function menu_close() {}
+function avisoLogin() {}
+"""
+        self._responder(_pagina("SOC", corpo, script))
+
+    def _empresas(self, sessao: _Sessao, empresa: Optional[str]) -> None:
+        if empresa:
+            sessao.empresa = empresa
+        sessao.programa = "Página Inicial"
+        empresas = sorted({f.empresa for f in self.mock.funcionarios} | {sessao.empresa})
+        lista = "".join(
+            f"<li><a href=\"javascript:choiceemp('{_e(e)}')\">{_e(e)}</a></li>" for e in empresas
+        )
+        script = _JS_FRAME + f"""
+function choiceemp(empresa) {{ window.location = '/WebSoc/frame/empresas?emp=' + encodeURIComponent(empresa); }}
+atualizarTopo({_js(sessao.programa)}, {_js(sessao.empresa)});
+"""
+        self._responder(_pagina("Empresas", f"<ul id=\"empresas\">{lista}</ul>", script))
+
+    def _tela_generica(self, sessao: _Sessao, numero: str) -> None:
+        nome = dict(TELAS_MENU).get(numero, "Tela")
+        sessao.programa = f"{numero} - {nome}"
+        script = _JS_FRAME + f"atualizarTopo({_js(sessao.programa)}, null);"
+        self._responder(_pagina(nome, f"<h1>{_e(nome)}</h1>", script))
+
+    # Tela 232: busca, cadastro e transferência
+
+    def _tela_232(self, sessao: _Sessao, form: Dict[str, str]) -> None:
+        sessao.programa = "232 - Funcionários"
+        acao = form.get("acao", "")
+        if acao in ("browse", "proxima"):
+            self.mock._aguardar("busca")
+            return self._busca(sessao, form, acao)
+        if acao == "sel":
+            self.mock._aguardar("cadastro")
+            return self._cadastro(sessao, form, edicao=False)
+        if acao == "transfunc":
+            self.mock._aguardar("transferencia")
+            return self._cadastro(sessao, form, edicao=False, transferencia=True)
+        if acao == "alt":
+            self.mock._aguardar("transferencia")
+            return self._cadastro(sessao, form, edicao=True, transferencia=True)
+        if acao == "save":
+            self.mock._aguardar("save")
+            return self._save(sessao, form)
+        self.mock._aguardar("tela")
+        self._formulario_busca(sessao, form, None, 1, False)
+
+    def _busca(self, sessao: _Sessao, form: Dict[str, str], acao: str) -> None:
+        campo = CAMPOS_BUSCA.get(form.get("codigoPesquisaFuncionario", "0"), "nome")
+        situacoes = {s for s in ("ativo", "inativo") if form.get(s)}
+        encontrados = [
+            f for f in self.mock._buscar(campo, form.get("nomeSeach", ""), sessao.empresa)
+            if f.situacao.lower() in situacoes or not situacoes
+        ]
+        pagina = int(form.get("pagina") or 1) + (1 if acao == "proxima" else 0)
+        if acao == "browse":
+            pagina = 1
+        inicio = (pagina - 1) * TAMANHO_PAGINA
+        self._formulario_busca(
+            sessao, form, encontrados[inicio:inicio + TAMANHO_PAGINA], pagina,
+            inicio + TAMANHO_PAGINA < len(encontrados)
+        )
+
+    def _formulario_busca(self,
+                          sessao: _Sessao,
+                          form: Dict[str, str],
+                          resultados: Optional[List[Funcionario]],
+                          pagina: int,
+                          tem_proxima: bool) -> None:
+        tipo = form.get("codigoPesquisaFuncionario", "0")
+        radios = "".join(
+            f"<input type=\"radio\" name=\"codigoPesquisaFuncionario\" value=\"{valor}\""
+            f"{' checked' if valor == tipo else ''}>"
+            for valor in ("0", "1", "2", "3", "4", "5", "6", "8")
+        )
+        filtros = "".join(
+            f"<input type=\"checkbox\" id=\"{nome}\" name=\"{nome}\" value=\"S\""
+            f"{' checked' if not form or form.get(nome) else ''}>"
+            for nome in ("ativo", "inativo", "pendente", "afastado", "ferias")
+        )
+        tabela = ""
+        if resultados is not None:
+            linhas = "".join(
+                f"<tr><td class=\"codigo\"><a href=\"javascript:selbrowse('{_e(f.codigo)}')\">{_e(f.codigo)}</a></td>"
+                f"<td>{_e(f.nome)}</td><td class=\"situacao\">{_e(f.situacao)}</td></tr>"
+                for f in resultados
+            )
+            tabela = (
+                "<table class=\"resultados\"><tr><th>Código</th><th>Nome</th><th>Situação</th></tr>"
+                f"{linhas}</table>"
+            )
+            if tem_proxima:
+                tabela += "<a id=\"proxima\" href=\"javascript:doAcao('proxima')\">Próxima</a>"
+        corpo = (
+            "<form name=\"formulario\" id=\"formulario\" method=\"post\" action=\"/WebSoc/frame/232\">"
+            "<input type=\"hidden\" name=\"acao\" value=\"\">"
+            "<input type=\"hidden\" name=\"codigo\" value=\"\">"
+            f"<input type=\"hidden\" name=\"pagina\" value=\"{pagina}\">"
+            f"{radios}{filtros}"
+            f"<input type=\"text\" name=\"nomeSeach\" value=\"{_e(form.get('nomeSeach', ''))}\">"
+            "</form>"
+            f"{tabela}"
+        )
+        script = _JS_FRAME + f"""
+function selbrowse(codigo) {{
+    document.forms['formulario'].elements['codigo'].value = codigo;
+    doAcao('sel');
+}}
+atualizarTopo({_js(sessao.programa)}, null);
+"""
+        self._responder(_pagina("Funcionários", corpo, script))
+
+    def _cadastro(self,
+                  sessao: _Sessao,
+                  form: Dict[str, str],
+                  edicao: bool,
+                  transferencia: bool = False) -> None:
+        funcionario = self.mock._funcionario(form.get("codigo", ""))
+        if not funcionario:
+            return self._formulario_busca(sessao, {}, None, 1, False)
+
+        campos = (
+            "<form name=\"formulario\" id=\"formulario\" method=\"post\" action=\"/WebSoc/frame/232\">"
+            "<input type=\"hidden\" name=\"acao\" value=\"\">"
+            f"<input type=\"hidden\" name=\"codigo\" value=\"{_e(funcionario.codigo)}\">"
+        )
+        if not transferencia:
+            corpo = (
+                campos + "</form>"
+                f"<h2>{_e(funcionario.nome)}</h2><p>CPF: {_e(funcionario.cpf)}</p>"
+                "<a href=\"#\" onclick=\"doAcao('transfunc'); return false;\">Transferir</a>"
+            )
+        else:
+            corpo = campos + (
+                "<h2>Transferência de Funcionário</h2>"
+                f"<p>{_e(funcionario.nome)}</p>"
+                f"<input type=\"text\" name=\"empVo.cod\" value=\"{_e(funcionario.empresa)}\" readonly>"
+            )
+            if edicao:
+                opcoes = "".join(
+                    f"<label><input type=\"checkbox\" id=\"{nome}\" name=\"{nome}\" value=\"S\">{nome}</label>"
+                    for nome in OPCOES_TRANSFERENCIA
+                )
+                corpo += (
+                    f"{opcoes}"
+                    "<input type=\"text\" id=\"codigoDaEmpresa\" name=\"codigoDaEmpresa\" value=\"\">"
+                    "<input type=\"hidden\" id=\"unidadeDestino\" name=\"unidadeDestino\" value=\"\">"
+                    "<input type=\"hidden\" id=\"associarTodos\" name=\"associarTodos\" value=\"\">"
+                    "<input type=\"hidden\" id=\"codigoFuncionarioDestino\" name=\"codigoFuncionarioDestino\" value=\"\">"
+                    "<input type=\"text\" id=\"nomeFuncionarioDestino\" value=\"\" readonly>"
+                    "<a href=\"javascript:zoom();\">Selecionar</a>"
+                )
+            corpo += "</form>"
+        script = _JS_FRAME + f"""
+var doAcaoOriginal = doAcao;
+doAcao = function (acao) {{
+    if (acao === 'save') {{
+        // Como no SOC: alerta de confirmação e, depois de aceito, o envio
+        setTimeout(function () {{
+            alert('Confirma a transferência do funcionário?');
+            doAcaoOriginal('save');
+        }}, 0);
+        return;
+    }}
+    doAcaoOriginal(acao);
+}};
+function trazUnseca(empresa) {{ document.getElementById('unidadeDestino').value = 'UN-' + empresa; }}
+function fassociarTodos() {{ document.getElementById('associarTodos').value = 'S'; }}
+function zoom() {{
+    var empresa = document.getElementById('codigoDaEmpresa').value;
+    window.open('/WebSoc/popup?empresa=' + encodeURIComponent(empresa), 'zoom', 'width=600,height=400');
+}}
+atualizarTopo({_js(sessao.programa)}, null);
+"""
+        self._responder(_pagina("Cadastro", corpo, script))
+
+    def _save(self, sessao: _Sessao, form: Dict[str, str]) -> None:
+        funcionario = self.mock._funcionario(form.get("codigo", ""))
+        if self.mock.erro_transferencia or not funcionario or not form.get("codigoDaEmpresa"):
+            corpo = (
+                "<div id=\"alertaErroTransferencia\" style=\"display:block\">"
+                "<div class=\"modalConteudo\">Não foi possível transferir o funcionário</div></div>"
+            )
+            script = _JS_FRAME + """
+function fecharErroTransferencia() { document.getElementById('alertaErroTransferencia').style.display = 'none'; }
+"""
+            return self._responder(_pagina("Erro", corpo, script))
+
+        with self.mock._lock:
+            self.mock.transferencias.append(Transferencia(
+                codigo=funcionario.codigo,
+                empresa_origem=funcionario.empresa,
+                empresa_destino=form["codigoDaEmpresa"],
+                funcionario_destino=form.get("codigoFuncionarioDestino", ""),
+                opcoes={nome: bool(form.get(nome)) for nome in OPCOES_TRANSFERENCIA},
+            ))
+            if self.mock.mover_transferidos:
+                funcionario.empresa = form["codigoDaEmpresa"]
+
+        corpo = (
+            "<div id=\"modalTransfFuncionario\" style=\"display:block\">"
+            "<div class=\"modalConteudo\">Funcionário transferido com sucesso</div>"
+            "<button class=\"botaoT\" type=\"button\" onclick=\"fecharModal('modalTransfFuncionario')\">OK</button>"
+            "</div>"
+        )
+        self._responder(_pagina("Transferência", corpo, _JS_FRAME + _JS_MODAL))
+
+    # Popup de zoom
+
+    def _popup(self, query: Dict[str, str], form: Dict[str, str]) -> None:
+        tipo = form.get("tipoBusca", "rbNome")
+        radios = "".join(
+            f"<input type=\"radio\" id=\"{rb}\" name=\"tipoBusca\" value=\"{rb}\"{' checked' if rb == tipo else ''}>"
+            for rb in ("rbNome", "rbCodigo", "rbRG", "rbCPF", "rbMatricula", "rbNit")
+        )
+        resultados = ""
+        if form.get("acao") == "browse":
+            campo = CAMPOS_BUSCA_POPUP.get(tipo, "nome")
+            resultados = "".join(
+                f"<tr><td><a href=\"javascript:sendValue('{_e(f.codigo)}', {_e(_js(f.nome))})\">"
+                f"{_e(f.codigo)}</a></td><td>{_e(f.nome)}</td></tr>"
+                for f in self.mock._buscar(campo, form.get("nomeSeach", ""), None)
+            )
+        empresa = quote(query.get("empresa", ""))
+        corpo = (
+            f"<form name=\"formulario\" method=\"post\" action=\"/WebSoc/popup?empresa={empresa}\">"
+            "<input type=\"hidden\" name=\"acao\" value=\"\">"
+            f"{radios}<input type=\"text\" name=\"nomeSeach\" value=\"{_e(form.get('nomeSeach', ''))}\">"
+            f"</form><table class=\"resultados\">{resultados}</table>"
+        )
+        script = """
+function doAcao(acao) {
+    var f = document.forms['formulario'];
+    f.elements['acao'].value = acao;
+    f.submit();
+}
+function sendValue(codigo, nome) {
+    var doc = window.opener.document;
+    doc.getElementById('codigoFuncionarioDestino').value = codigo;
+    doc.getElementById('nomeFuncionarioDestino').value = nome;
+    window.close();
+}
+"""
+        self._responder(_pagina("Seleção de Funcionário", corpo, script))
+
+
+def _js(valor: Optional[str]) -> str:
+    """Literal JavaScript de uma string (entre aspas simples)."""
+    if valor is None:
+        return "null"
+    escapado = valor.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n").replace("<", "\\x3c")
+    return f"'{escapado}'"
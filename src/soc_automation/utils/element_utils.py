@@ -0,0 +1,72 @@
+from typing import Any, Dict, Tuple
+
+# Aplica o estado desejado de cada campo e retorna o estado resultante.
+# A chave é o ID do elemento ou, se não houver, o atributo name:
+# - checkbox / radio por ID: bool (marcado ou não), via click() para disparar os handlers
+# - grupo de radios por name: valor do radio a marcar
+# - demais campos (text, select, hidden): valor, disparando 'input' e 'change'
+_SCRIPT_APLICAR_ESTADO = """
+var estados = arguments[0];
+var resultado = {};
+Object.keys(estados).forEach(function (chave) {
+    var desejado = estados[chave];
+    var el = document.getElementById(chave);
+    var grupo = el ? [el] : Array.prototype.slice.call(document.getElementsByName(chave));
+    if (!grupo.length) {
+        resultado[chave] = null;
+        return;
+    }
+    var campo = grupo[0];
+    var tipo = (campo.type || '').toLowerCase();
+    if (tipo === 'radio' && !el) {
+        grupo.forEach(function (radio) {
+            if (radio.value === String(desejado) && !radio.checked) { radio.click(); }
+        });
+        var marcado = grupo.filter(function (radio) { return radio.checked; })[0];
+        resultado[chave] = marcado ? marcado.value : null;
+    } else if (tipo === 'checkbox' || tipo === 'radio') {
+        if (campo.checked !== !!desejado) { campo.click(); }
+        resultado[chave] = campo.checked;
+    } else {
+        campo.value = desejado === null ? '' : String(desejado);
+        campo.dispatchEvent(new Event('input', {bubbles: true}));
+        campo.dispatchEvent(new Event('change', {bubbles: true}));
+        resultado[chave] = campo.value;
+    }
+});
+return resultado;
+"""
+
+
+def aplicar_estado_formulario(driver, estados: Dict[str, Any]) -> Dict[str, Any]:
+    """Aplica o estado de vários campos do formulário em um único ``execute_script``.
+
+    Args:
+        driver: Instância do WebDriver (no frame/janela do formulário).
+        estados: Mapa ``id ou name -> estado desejado``. Checkboxes recebem
+            bool, grupos de radio recebem o valor a marcar e os demais campos
+            recebem o texto/valor.
+
+    Returns:
+        Estado resultante de cada campo (None para campos não encontrados).
+    """
+    return driver.execute_script(_SCRIPT_APLICAR_ESTADO, estados) or {}
+
+
+def divergencias_formulario(estados: Dict[str, Any],
+                            resultado: Dict[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+    """Compara o estado desejado com o resultado de ``aplicar_estado_formulario``.
+
+    Returns:
+        Mapa ``campo -> (desejado, obtido)`` apenas dos campos divergentes.
+    """
+    divergentes = {}
+    for campo, desejado in estados.items():
+        obtido = resultado.get(campo)
+        if isinstance(desejado, bool) or obtido is None:
+            igual = obtido == desejado
+        else:
+            igual = str(obtido) == str(desejado)
+        if not igual:
+            divergentes[campo] = (desejado, obtido)
+    return divergentes
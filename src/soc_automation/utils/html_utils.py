@@ -0,0 +1,218 @@
+"""Leitura de páginas do SOC a partir do HTML, sem navegador.
+
+Espelha, com ``html.parser`` da biblioteca padrão, o que os scripts
+executados via Selenium extraem do DOM (ex: ``table.resultados`` da tela
+232 e os textos de ``infoPrograma``/``infoEmpresa``).
+"""
+import re
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_RE_SELBROWSE = re.compile(r"selbrowse\('([^']*)'\)")
+_RE_ESPACOS = re.compile(r"\s+")
+
+# Formatos do código no texto de infoEmpresa, em ordem de preferência:
+# "143906", "143906 - EMPRESA", "EMPRESA (143906)" e "Empresa: 143906"/"Cód. 143906"
+_RE_CODIGO_EMPRESA = (
+    re.compile(r"^(\d+)$"),
+    re.compile(r"^(\d+)\s*[-–:|]"),
+    re.compile(r"\((\d+)\)\s*$"),
+    re.compile(r"\b(?:c[óo]d(?:igo)?|empresa)\.?\s*:?\s*(\d+)", re.IGNORECASE),
+)
+
+# Elementos sem tag de fechamento
+_VAZIOS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "wbr"}
+
+
+def _classes(atributos: Dict[str, str]) -> Set[str]:
+    return set((atributos.get("class") or "").split())
+
+
+def _texto(partes: Iterable[str]) -> str:
+    return _RE_ESPACOS.sub(" ", "".join(partes)).strip()
+
+
+class PaginaSOC(HTMLParser):
+    """Extrai, em uma única passada, os dados usados pelas consultas HTTP.
+
+    Após ``feed``:
+        - ``resultados``: linhas de ``table.resultados`` como dicionários com
+          ``codigo``, ``nome``, ``situacao`` e ``selbrowse_id`` (mesmo formato
+          de ``_SCRIPT_EXTRAIR_RESULTADOS``), ou None se não houver tabela;
+        - ``proxima``: href/onclick do primeiro link que contém algum dos
+          ``marcadores_proxima`` (link de próxima página), se houver;
+        - ``textos``: texto dos elementos cujos IDs foram solicitados;
+        - ``ids``: IDs e names de todos os elementos encontrados.
+    """
+
+    def __init__(self, ids_texto: Iterable[str] = (), marcadores_proxima: Iterable[str] = ()) -> None:
+        super().__init__(convert_charrefs=True)
+        self._ids_texto = set(ids_texto)
+        self._marcadores_proxima = tuple(marcadores_proxima)
+        self.resultados: Optional[List[Dict[str, Optional[str]]]] = None
+        self.proxima: Optional[str] = None
+        self.textos: Dict[str, str] = {}
+        self.ids: Set[str] = set()
+
+        # Pilha de (tag, id capturando texto ou None)
+        self._pilha: List[Tuple[str, Optional[str]]] = []
+        self._capturas: Dict[str, List[str]] = {}
+        self._profundidade_tabela = 0
+        self._primeira_linha = True
+        self._linha: Optional[List[Dict[str, object]]] = None
+        self._celula: Optional[Dict[str, object]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        atributos = {nome: (valor or "") for nome, valor in attrs}
+        elemento_id = atributos.get("id")
+        for chave in (elemento_id, atributos.get("name")):
+            if chave:
+                self.ids.add(chave)
+
+        if tag == "a" and self.proxima is None and self._e_proxima(atributos):
+            script = atributos.get("onclick") or atributos.get("href") or None
+            if script and script.startswith("javascript:"):
+                script = script[len("javascript:"):]
+            self.proxima = script
+
+        if tag == "table":
+            if self._profundidade_tabela:
+                self._profundidade_tabela += 1
+            elif "resultados" in _classes(atributos) and self.resultados is None:
+                self.resultados = []
+                self._profundidade_tabela = 1
+                self._primeira_linha = True
+        elif self._profundidade_tabela == 1:
+            self._iniciar_elemento_tabela(tag, atributos)
+
+        if tag in _VAZIOS:
+            return
+        captura = elemento_id if elemento_id in self._ids_texto and elemento_id not in self._capturas else None
+        if captura:
+            self._capturas[captura] = []
+        self._pilha.append((tag, captura))
+
+    def _e_proxima(self, atributos: Dict[str, str]) -> bool:
+        alvo = atributos.get("href", "") + " " + atributos.get("onclick", "")
+        return any(marcador in alvo for marcador in self._marcadores_proxima)
+
+    def _iniciar_elemento_tabela(self, tag: str, atributos: Dict[str, str]) -> None:
+        if tag == "tr":
+            # A primeira linha é o cabeçalho, como no script do Selenium
+            if self._primeira_linha:
+                self._primeira_linha = False
+                self._linha = None
+            else:
+                self._linha = []
+        elif tag in ("td", "th") and self._linha is not None:
+            self._celula = {"classes": _classes(atributos), "texto": [], "link": None}
+            self._linha.append(self._celula)
+        elif tag == "a" and self._celula is not None and self._celula["link"] is None:
+            self._celula["link"] = {"href": atributos.get("href", ""), "texto": []}
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "table" and self._profundidade_tabela:
+            self._profundidade_tabela -= 1
+            if not self._profundidade_tabela:
+                self._fechar_linha()
+        elif self._profundidade_tabela == 1 and tag == "tr":
+            self._fechar_linha()
+        elif self._profundidade_tabela == 1 and tag in ("td", "th"):
+            self._celula = None
+        elif tag == "a" and self._celula is not None and self._celula["link"] is not None:
+            self._celula["link"]["fechado"] = True
+
+        # Fecha até a tag correspondente (HTML nem sempre fecha tudo)
+        for indice in range(len(self._pilha) - 1, -1, -1):
+            if self._pilha[indice][0] == tag:
+                for _, captura in self._pilha[indice:]:
+                    if captura:
+                        self.textos[captura] = _texto(self._capturas.pop(captura))
+                del self._pilha[indice:]
+                break
+
+    def handle_data(self, data: str) -> None:
+        for partes in self._capturas.values():
+            partes.append(data)
+        if self._celula is not None:
+            self._celula["texto"].append(data)
+            link = self._celula["link"]
+            if link is not None and not link.get("fechado"):
+                link["texto"].append(data)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VAZIOS:
+            self.handle_endtag(tag)
+
+    def _fechar_linha(self) -> None:
+        linha, self._linha, self._celula = self._linha, None, None
+        if not linha or self.resultados is None:
+            return
+
+        celula_codigo = next(
+            (c for c in linha if "codigo" in c["classes"] and c["link"] is not None), None
+        )
+        if celula_codigo is None:
+            return
+        link = celula_codigo["link"]
+        selbrowse = _RE_SELBROWSE.search(link["href"])
+        celula_situacao = next((c for c in linha if "situacao" in c["classes"]), None)
+        if celula_situacao is None and len(linha) > 2:
+            celula_situacao = linha[-1]
+
+        self.resultados.append({
+            "codigo": _texto(link["texto"]),
+            "nome": _texto(linha[1]["texto"]) if len(linha) > 1 else "",
+            "situacao": _texto(celula_situacao["texto"]) if celula_situacao else "",
+            "selbrowse_id": selbrowse.group(1) if selbrowse else None,
+        })
+
+    def close(self) -> None:
+        super().close()
+        for captura, partes in self._capturas.items():
+            self.textos[captura] = _texto(partes)
+        self._capturas.clear()
+
+
+def codigo_empresa(texto: Optional[str]) -> Optional[str]:
+    """Extrai o código da empresa de um texto como o de ``infoEmpresa``.
+
+    Códigos de empresa (ex: ``empresa_origem``) passam inalterados, sem
+    espaços nas pontas.
+
+    Returns:
+        Optional[str]: Código da empresa, ou None se o texto não contiver um
+    """
+    texto = _texto(texto or "")
+    for expressao in _RE_CODIGO_EMPRESA:
+        encontrado = expressao.search(texto)
+        if encontrado:
+            return encontrado.group(1)
+    return None
+
+
+def normalizar_empresa(valor: Optional[str]) -> Optional[str]:
+    """Chave de comparação de uma empresa: o código, ou o próprio valor se não houver código."""
+    if not valor or not valor.strip():
+        return None
+    return codigo_empresa(valor) or _texto(valor)
+
+
+def ler_pagina(html: str,
+               ids_texto: Iterable[str] = (),
+               marcadores_proxima: Iterable[str] = ()) -> PaginaSOC:
+    """Analisa o HTML de uma página do SOC.
+
+    Args:
+        html: Conteúdo da página
+        ids_texto: IDs cujo texto deve ser extraído
+        marcadores_proxima: Trechos de href/onclick que identificam o link de próxima página
+
+    Returns:
+        PaginaSOC: Parser com os dados extraídos
+    """
+    pagina = PaginaSOC(ids_texto, marcadores_proxima)
+    pagina.feed(html)
+    pagina.close()
+    return pagina
@@ -0,0 +1,214 @@
+"""Medição do carregamento de páginas pela Performance API do navegador.
+
+Usado para comparar o perfil padrão do Chrome com o perfil de desempenho
+de ``DriverManager`` (bytes transferidos e tempo até a página ficar pronta),
+na página de login e nas páginas da sessão logada. Para a comparação:
+
+    python -m soc_automation.utils.perf_utils --simulado
+    python -m soc_automation.utils.perf_utils [url] --usuario U --empresa E --pagina CAMINHO
+"""
+import argparse
+import getpass
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urljoin
+
+from ..core.config import get_configuracao
+from ..core.logger import get_logger
+from ..operations.models import Credenciais
+from .wait_utils import documento_pronto, esperar_opcional
+
+# Nome da medição da página de login (``soc.url`` sem sessão)
+PAGINA_LOGIN = "login"
+# Nome da medição da janela principal após o login (caminho "")
+PAGINA_PRINCIPAL = "principal"
+
+# Páginas do SOC simulado medidas após o login: janela principal e tela 232
+PAGINAS_SIMULADO = ("", "frame/232")
+
+# Soma os bytes da navegação e dos recursos (transferSize; encodedBodySize
+# quando o servidor não expõe Timing-Allow-Origin) e lê os marcos da navegação
+_SCRIPT_METRICAS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var recursos = performance.getEntriesByType('resource');
+var tamanho = function (e) { return e.transferSize || e.encodedBodySize || 0; };
+var total = nav ? tamanho(nav) : 0;
+for (var i = 0; i < recursos.length; i++) { total += tamanho(recursos[i]); }
+return {
+    bytes: total,
+    recursos: recursos.length,
+    dom_pronto: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav && nav.loadEventEnd > 0 ? nav.loadEventEnd : null
+};
+"""
+
+
+@dataclass
+class MedicaoCarregamento:
+    """Métricas do carregamento de uma página (tempos em ms)."""
+
+    bytes_transferidos: int
+    recursos: int
+    # Tempo de driver.get(), que depende da estratégia de carregamento
+    tempo_get: float
+    # DOMContentLoaded, relativo ao início da navegação
+    dom_pronto: Optional[float]
+    # Evento load, relativo ao início da navegação (None se não ocorreu)
+    load: Optional[float]
+
+
+def medir_carregamento(driver, url: str, timeout: Optional[float] = None) -> MedicaoCarregamento:
+    """Navega para a URL e mede o carregamento.
+
+    Args:
+        driver: WebDriver recém-criado (sem cache, para medir a carga completa)
+        url: Página a medir
+        timeout: Tempo máximo de espera pelo DOM pronto (padrão: ``browser.timeout``)
+
+    Returns:
+        MedicaoCarregamento: Bytes, recursos e tempos da página
+    """
+    if timeout is None:
+        timeout = get_configuracao().browser.timeout
+    inicio = time.perf_counter()
+    driver.get(url)
+    tempo_get = (time.perf_counter() - inicio) * 1000
+    esperar_opcional(driver, documento_pronto(), timeout)
+
+    dados = driver.execute_script(_SCRIPT_METRICAS)
+    return MedicaoCarregamento(
+        bytes_transferidos=int(dados["bytes"]),
+        recursos=int(dados["recursos"]),
+        tempo_get=tempo_get,
+        dom_pronto=dados["dom_pronto"],
+        load=dados["load"],
+    )
+
+
+def _mediana(valores: List[Optional[float]]) -> Optional[float]:
+    validos = [v for v in valores if v is not None]
+    return statistics.median(validos) if validos else None
+
+
+def _mediana_medicoes(medicoes: List[MedicaoCarregamento]) -> MedicaoCarregamento:
+    return MedicaoCarregamento(
+        bytes_transferidos=int(statistics.median(m.bytes_transferidos for m in medicoes)),
+        recursos=int(statistics.median(m.recursos for m in medicoes)),
+        tempo_get=statistics.median(m.tempo_get for m in medicoes),
+        dom_pronto=_mediana([m.dom_pronto for m in medicoes]),
+        load=_mediana([m.load for m in medicoes]),
+    )
+
+
+def _medir_paginas(driver,
+                   url: str,
+                   paginas: Sequence[str],
+                   credenciais: Optional[Credenciais]) -> Dict[str, MedicaoCarregamento]:
+    """Mede a página de login e, após o login (se houver credenciais), cada página."""
+    from ..pages.login_page import LoginPage
+
+    medicoes = {PAGINA_LOGIN: medir_carregamento(driver, url)}
+    if credenciais and not LoginPage(driver).login(
+            credenciais.username, credenciais.password, credenciais.company_id):
+        raise RuntimeError(f"Login em {url} falhou; páginas autenticadas não medidas")
+    for pagina in paginas:
+        medicoes[pagina or PAGINA_PRINCIPAL] = medir_carregamento(driver, urljoin(url, pagina))
+    return medicoes
+
+
+def comparar_perfis(url: Optional[str] = None,
+                    paginas: Sequence[str] = (),
+                    credenciais: Optional[Credenciais] = None,
+                    headless: Optional[bool] = None,
+                    repeticoes: int = 3) -> Dict[str, Dict[str, MedicaoCarregamento]]:
+    """Compara o perfil padrão com o perfil de desempenho do Chrome.
+
+    Cada repetição usa um navegador novo (perfil temporário, sem cache): mede
+    a página de login em ``url`` e, com ``credenciais``, faz o login e mede
+    cada página de ``paginas`` na mesma sessão.
+
+    Args:
+        url: Endereço do SOC (padrão: ``soc.url``)
+        paginas: Caminhos relativos a ``url`` medidos após o login ("" = janela principal)
+        credenciais: Credenciais do login; sem elas, ``paginas`` são medidas sem sessão
+        headless: Se True, executa os navegadores em modo headless (padrão: ``browser.headless``)
+        repeticoes: Medições por perfil; o resultado é a mediana
+
+    Returns:
+        Dict[str, Dict[str, MedicaoCarregamento]]: Medianas por perfil ("padrao" e
+        "desempenho") e por página ("login", "principal" ou o caminho)
+    """
+    from ..core.driver_manager import DriverManager
+
+    config = get_configuracao()
+    url = url or config.soc.url
+    headless = config.browser.headless if headless is None else headless
+    logger = get_logger(__name__)
+    resultado: Dict[str, Dict[str, MedicaoCarregamento]] = {}
+
+    for perfil, performance_profile in (("padrao", False), ("desempenho", True)):
+        medicoes: Dict[str, List[MedicaoCarregamento]] = {}
+        for _ in range(repeticoes):
+            driver = DriverManager(performance_profile=performance_profile).create_driver(headless)
+            try:
+                for pagina, medicao in _medir_paginas(driver, url, paginas, credenciais).items():
+                    medicoes.setdefault(pagina, []).append(medicao)
+            finally:
+                driver.quit()
+        resultado[perfil] = {pagina: _mediana_medicoes(lista) for pagina, lista in medicoes.items()}
+
+    for pagina, padrao in resultado["padrao"].items():
+        desempenho = resultado["desempenho"][pagina]
+        if padrao.bytes_transferidos:
+            reducao = 100.0 * (1 - desempenho.bytes_transferidos / padrao.bytes_transferidos)
+            logger.info(
+                f"[{pagina}] Bytes: {padrao.bytes_transferidos} -> {desempenho.bytes_transferidos} "
+                f"({reducao:.0f}% a menos)"
+            )
+        logger.info(f"[{pagina}] driver.get: {padrao.tempo_get:.0f} ms -> {desempenho.tempo_get:.0f} ms")
+        if padrao.dom_pronto is not None and desempenho.dom_pronto is not None:
+            logger.info(f"[{pagina}] DOM pronto: {padrao.dom_pronto:.0f} ms -> {desempenho.dom_pronto:.0f} ms")
+    return resultado
+
+
+def comparar_perfis_simulado(latencia: float = 0.02,
+                             headless: Optional[bool] = None,
+                             repeticoes: int = 3) -> Dict[str, Dict[str, MedicaoCarregamento]]:
+    """Executa ``comparar_perfis`` contra o ``MockSOCServer``: login, janela principal e tela 232."""
+    from ..testing.mock_server import MockSOCServer
+
+    with MockSOCServer(latencia=latencia) as servidor:
+        return comparar_perfis(servidor.url, PAGINAS_SIMULADO, Credenciais("perf", "perf", "1001"),
+                               headless=headless, repeticoes=repeticoes)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compara o perfil padrão do Chrome com o perfil de desempenho")
+    parser.add_argument("url", nargs="?", help="Endereço do SOC (padrão: soc.url do config.yaml)")
+    parser.add_argument("--pagina", action="append", default=[],
+                        help="Caminho relativo à URL medido após o login (repetível)")
+    parser.add_argument("--usuario", help="Usuário do login; a senha é pedida no terminal")
+    parser.add_argument("--empresa", default="", help="Empresa do login")
+    parser.add_argument("--simulado", action="store_true", help="Mede o SOC simulado (MockSOCServer)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.simulado:
+        resultado = comparar_perfis_simulado(repeticoes=args.repeticoes)
+    else:
+        credenciais = None
+        if args.usuario:
+            credenciais = Credenciais(args.usuario, getpass.getpass("Senha: "), args.empresa)
+        resultado = comparar_perfis(args.url, args.pagina, credenciais, repeticoes=args.repeticoes)
+
+    for perfil, paginas in resultado.items():
+        for pagina, medicao in paginas.items():
+            print(f"{perfil} [{pagina}]: {medicao}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""Esperas baseadas em condição para as telas do SOC.
+
+Cada predicado segue o contrato de ``expected_conditions`` do Selenium:
+recebe o driver e retorna um valor verdadeiro quando a condição foi
+atingida. Use ``esperar``/``esperar_opcional`` para aplicá-los com polling
+rápido e timeout configurável. Sem valores explícitos, o timeout e o
+intervalo vêm da seção ``browser`` do config.yaml.
+"""
+from typing import Any, Callable, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from ..core.config import get_configuracao
+
+Condicao = Callable[[Any], Any]
+
+EXCECOES_IGNORADAS = (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    NoSuchFrameException,
+    JavascriptException,
+)
+
+_JS_SOCFRAME = """
+var doc = window.top.document;
+var frame = doc.getElementById('socframe') || doc.getElementsByName('socframe')[0];
+"""
+
+_JS_MARCAR_SOCFRAME = _JS_SOCFRAME + """
+if (!frame || !frame.contentWindow) { return null; }
+var marca = String(Date.now()) + '-' + Math.random();
+frame.contentWindow.__socMarca = marca;
+return marca;
+"""
+
+_JS_MARCAR_E_EXECUTAR = _JS_SOCFRAME + """
+var marca = null;
+if (frame && frame.contentWindow) {
+    marca = String(Date.now()) + '-' + Math.random();
+    frame.contentWindow.__socMarca = marca;
+}
+new Function(arguments[0]).call(window);
+return marca;
+"""
+
+_JS_SOCFRAME_RECARREGADO = _JS_SOCFRAME + """
+if (!frame || !frame.contentWindow || !frame.contentDocument) { return false; }
+return frame.contentWindow.__socMarca !== arguments[0]
+    && frame.contentDocument.readyState === 'complete';
+"""
+
+_JS_MARCAR_JANELA = """
+var marca = String(Date.now()) + '-' + Math.random();
+window.__socMarca = marca;
+return marca;
+"""
+
+_JS_JANELA_RECARREGADA = """
+return window.__socMarca !== arguments[0] && document.readyState === 'complete';
+"""
+
+_JS_DOCUMENTO_PRONTO = """
+return document.readyState === 'complete'
+    && (!window.jQuery || window.jQuery.active === 0);
+"""
+
+_JS_INFO_PROGRAMA = """
+var info = window.top.document.getElementById('infoPrograma');
+if (!info) { return null; }
+return (info.textContent || '').trim();
+"""
+
+
+def esperar(driver,
+            condicao: Condicao,
+            timeout: Optional[float] = None,
+            intervalo: Optional[float] = None,
+            mensagem: str = "") -> Any:
+    """Aguarda até a condição ser atingida.
+
+    Args:
+        driver: Instância do WebDriver.
+        condicao: Predicado que recebe o driver.
+        timeout: Tempo máximo de espera em segundos (padrão: ``browser.timeout``).
+        intervalo: Intervalo entre verificações em segundos (padrão: ``browser.intervalo_poll``).
+        mensagem: Mensagem da exceção em caso de timeout.
+
+    Returns:
+        O valor retornado pela condição.
+
+    Raises:
+        TimeoutException: Se a condição não for atingida no prazo.
+    """
+    config = get_configuracao().browser
+    timeout = config.timeout if timeout is None else timeout
+    intervalo = config.intervalo_poll if intervalo is None else intervalo
+    wait = WebDriverWait(driver, timeout, poll_frequency=intervalo,
+                         ignored_exceptions=EXCECOES_IGNORADAS)
+    return wait.until(condicao, mensagem)
+
+
+def esperar_opcional(driver,
+                     condicao: Condicao,
+                     timeout: Optional[float] = None,
+                     intervalo: Optional[float] = None) -> Any:
+    """Igual a ``esperar``, mas retorna None em vez de lançar TimeoutException."""
+    try:
+        return esperar(driver, condicao, timeout, intervalo)
+    except TimeoutException:
+        return None
+
+
+def marcar_socframe(driver) -> Optional[str]:
+    """Marca o documento atual do socframe para detectar sua recarga.
+
+    Deve ser chamado antes da ação que recarrega o frame.
+
+    Returns:
+        A marca gravada, ou None se o socframe não existir.
+    """
+    return driver.execute_script(_JS_MARCAR_SOCFRAME)
+
+
+def executar_marcando_socframe(driver, script: str) -> Optional[str]:
+    """Marca o socframe e executa o script na mesma chamada ao driver.
+
+    O script roda como corpo de função, então um ``return`` nele (comum em
+    atributos onclick) não impede o retorno da marca.
+
+    Returns:
+        A marca gravada, para uso com ``socframe_recarregado``.
+    """
+    return driver.execute_script(_JS_MARCAR_E_EXECUTAR, script)
+
+
+def marcar_janela(driver) -> str:
+    """Marca o documento da janela/frame atual para detectar sua recarga."""
+    return driver.execute_script(_JS_MARCAR_JANELA)
+
+
+def socframe_recarregado(marca: Optional[str]) -> Condicao:
+    """O socframe carregou um novo documento desde ``marcar_socframe``."""
+    def _condicao(driver):
+        return driver.execute_script(_JS_SOCFRAME_RECARREGADO, marca)
+    return _condicao
+
+
+def janela_recarregada(marca: str) -> Condicao:
+    """A janela/frame atual carregou um novo documento desde ``marcar_janela``."""
+    def _condicao(driver):
+        return driver.execute_script(_JS_JANELA_RECARREGADA, marca)
+    return _condicao
+
+
+def documento_pronto() -> Condicao:
+    """O documento atual terminou de carregar e não há AJAX (jQuery) pendente."""
+    def _condicao(driver):
+        return driver.execute_script(_JS_DOCUMENTO_PRONTO)
+    return _condicao
+
+
+def info_programa_comeca_com(numero: str) -> Condicao:
+    """O ``infoPrograma`` da janela principal começa com o número da tela.
+
+    Retorna o texto do ``infoPrograma`` quando atingida.
+    """
+    def _condicao(driver):
+        texto = driver.execute_script(_JS_INFO_PROGRAMA)
+        return texto if texto and texto.startswith(numero) else False
+    return _condicao
+
+
+def tabela_resultados_renderizada() -> Condicao:
+    """A ``table.resultados`` está presente no documento atual.
+
+    Retorna a lista de linhas de dados (sem o cabeçalho) quando atingida.
+    """
+    def _condicao(driver):
+        if not driver.find_elements(By.CSS_SELECTOR, "table.resultados"):
+            return False
+        linhas = driver.find_elements(By.CSS_SELECTOR, "table.resultados tr:not(:first-child)")
+        return linhas or True
+    return _condicao
+
+
+def janela_popup_aberta(handles_antes: List[str]) -> Condicao:
+    """Uma nova janela foi aberta em relação a ``handles_antes``.
+
+    Retorna o handle da nova janela quando atingida.
+    """
+    def _condicao(driver):
+        novas = [h for h in driver.window_handles if h not in handles_antes]
+        return novas[0] if novas else False
+    return _condicao
+
+
+def janela_fechada(handle: str) -> Condicao:
+    """A janela identificada por ``handle`` foi fechada."""
+    def _condicao(driver):
+        return handle not in driver.window_handles
+    return _condicao
+
+
+def elemento_presente(locator: Tuple[str, str]) -> Condicao:
+    """Existe ao menos um elemento para o locator. Retorna o primeiro."""
+    def _condicao(driver):
+        elementos = driver.find_elements(*locator)
+        return elementos[0] if elementos else False
+    return _condicao
+
+
+def checkbox_presente(checkbox_id: str) -> Condicao:
+    """O checkbox com o ID informado está presente. Retorna o elemento."""
+    return elemento_presente((By.ID, checkbox_id))
+
+
+def texto_presente(texto: str) -> Condicao:
+    """O texto aparece no corpo do documento atual."""
+    def _condicao(driver):
+        return driver.execute_script(
+            "return !!document.body && document.body.innerText.indexOf(arguments[0]) >= 0;",
+            texto
+        )
+    return _condicao
+
+
+def alerta_presente() -> Condicao:
+    """Há um alerta JavaScript aberto. Retorna o alerta."""
+    def _condicao(driver):
+        try:
+            alerta = driver.switch_to.alert
+            alerta.text
+            return alerta
+        except NoAlertPresentException:
+            return False
+    return _condicao
+
+
+def qualquer(*condicoes: Condicao) -> Condicao:
+    """Atingida quando qualquer uma das condições for atingida."""
+    def _condicao(driver):
+        for condicao in condicoes:
+            try:
+                resultado = condicao(driver)
+            except EXCECOES_IGNORADAS:
+                continue
+            if resultado:
+                return resultado
+        return False
+    return _condicao
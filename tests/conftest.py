@@ -0,0 +1,70 @@
+import http.client
+import sys
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+import pytest
+
+# Permite rodar os testes sem instalar o pacote (pip install -e .)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from soc_automation.testing.mock_server import COOKIE_SESSAO, MockSOCServer  # noqa: E402
+
+
+class ClienteSOC:
+    """Cliente HTTP mínimo (stdlib) para falar com o ``MockSOCServer``."""
+
+    def __init__(self, url: str) -> None:
+        partes = urlsplit(url)
+        self.host, self.porta = partes.hostname, partes.port
+        self.cookie = ""
+
+    def requisitar(self, metodo: str, caminho: str, campos=None):
+        conexao = http.client.HTTPConnection(self.host, self.porta, timeout=5)
+        cabecalhos = {"Cookie": self.cookie} if self.cookie else {}
+        corpo = None
+        if campos is not None:
+            corpo = urlencode(campos)
+            cabecalhos["Content-Type"] = "application/x-www-form-urlencoded"
+        try:
+            conexao.request(metodo, caminho, body=corpo, headers=cabecalhos)
+            resposta = conexao.getresponse()
+            return resposta.status, dict(resposta.getheaders()), resposta.read().decode("utf-8")
+        finally:
+            conexao.close()
+
+    def login(self, usuario: str = "usuario", senha: str = "senha", empresa: str = "1001") -> str:
+        _, cabecalhos, _ = self.requisitar(
+            "POST", "/WebSoc/login", [("usu", usuario), ("senha", senha), ("empsoc", empresa)]
+        )
+        self.cookie = cabecalhos["Set-Cookie"].split(";", 1)[0]
+        return self.cookie.split("=", 1)[1]
+
+
+@pytest.fixture
+def servidor_soc():
+    with MockSOCServer() as servidor:
+        yield servidor
+
+
+@pytest.fixture
+def cliente_sem_sessao(servidor_soc):
+    return ClienteSOC(servidor_soc.url)
+
+
+@pytest.fixture
+def cliente_soc(servidor_soc):
+    cliente = ClienteSOC(servidor_soc.url)
+    cliente.login()
+    return cliente
+
+
+@pytest.fixture
+def cookie_sessao(cliente_soc):
+    return {COOKIE_SESSAO: cliente_soc.cookie.split("=", 1)[1]}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: benchmark por etapa com Chrome real contra o SOC simulado"
+    )
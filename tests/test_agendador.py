@@ -0,0 +1,67 @@
+from soc_automation.operations.agendador import AgendadorAfinidade
+from soc_automation.operations.models import TransferenciaJob
+
+
+def _job(job_id, empresa=None):
+    return TransferenciaJob(job_id=job_id, termo_busca=job_id, empresa_origem=empresa)
+
+
+def _ids(agendador, worker_id, quantidade):
+    return [agendador.proximo(worker_id).job_id for _ in range(quantidade)]
+
+
+def test_worker_continua_na_empresa_da_sessao():
+    agendador = AgendadorAfinidade([_job("a1", "1001"), _job("b1", "2002"), _job("a2", "1001"), _job("b2", "2002")])
+    agendador.registrar_empresa(0, "2002")
+
+    assert _ids(agendador, 0, 2) == ["b1", "b2"]
+    assert agendador.pendentes() == 2
+
+
+def test_empresa_registrada_pelo_texto_de_info_empresa():
+    agendador = AgendadorAfinidade([_job("a1", "1001"), _job("b1", "143906")])
+    agendador.registrar_empresa(0, "143906 - EMPRESA EXEMPLO LTDA")
+    agendador.registrar_empresa(1, "EMPRESA TESTE (1001)")
+
+    assert agendador.proximo(0).job_id == "b1"
+    assert agendador.proximo(1).job_id == "a1"
+
+
+def test_empresa_desconhecida_nao_apaga_a_registrada():
+    agendador = AgendadorAfinidade([_job("a1", "1001"), _job("b1", "2002")])
+    agendador.registrar_empresa(0, "2002")
+    agendador.registrar_empresa(0, None)
+
+    assert agendador.proximo(0).job_id == "b1"
+
+
+def test_jobs_sem_empresa_antes_de_trocar_de_empresa():
+    agendador = AgendadorAfinidade([_job("a1", "1001"), _job("livre"), _job("b1", "2002")])
+    agendador.registrar_empresa(0, "1001")
+
+    assert _ids(agendador, 0, 3) == ["a1", "livre", "b1"]
+
+
+def test_workers_novos_se_distribuem_entre_as_empresas():
+    agendador = AgendadorAfinidade([
+        _job("a1", "1001"), _job("a2", "1001"), _job("a3", "1001"),
+        _job("b1", "2002"), _job("b2", "2002"),
+    ])
+
+    # Sem empresa: o grupo sem atendentes e, no empate, o maior
+    assert agendador.proximo(0).job_id == "a1"
+    assert agendador.proximo(1).job_id == "b1"
+    assert agendador.proximo(0).job_id == "a2"
+    assert agendador.proximo(1).job_id == "b2"
+    # Grupo da empresa esgotado: vai para a empresa restante
+    assert agendador.proximo(1).job_id == "a3"
+    assert agendador.proximo(0) is None
+
+
+def test_devolver_recoloca_o_job_no_inicio_do_grupo():
+    agendador = AgendadorAfinidade([_job("a1", "1001"), _job("a2", "1001")])
+    job = agendador.proximo(0)
+    agendador.devolver(job)
+
+    assert agendador.pendentes() == 2
+    assert agendador.proximo(1).job_id == "a1"
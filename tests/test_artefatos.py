@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+import time
+import zipfile
+
+import pytest
+
+from soc_automation.core.artefatos import JOB_SEM_ID, ArmazemArtefatos
+
+
+class DriverFalso:
+    """Driver com screenshot de tamanho fixo; registra a thread de cada captura."""
+
+    def __init__(self, tamanho_screenshot: int = 100, erro: bool = False) -> None:
+        self.tamanho_screenshot = tamanho_screenshot
+        self.erro = erro
+        self.threads = []
+        self.current_url = "http://127.0.0.1/WebSoc/"
+
+    def get_screenshot_as_png(self):
+        self.threads.append(threading.current_thread().name)
+        if self.erro:
+            raise RuntimeError("sessão encerrada")
+        return os.urandom(self.tamanho_screenshot)
+
+    @property
+    def page_source(self):
+        if self.erro:
+            raise RuntimeError("sessão encerrada")
+        return "<html><body>SOC</body></html>"
+
+
+@pytest.fixture
+def armazem(tmp_path):
+    def criar(**limites):
+        armazens.append(ArmazemArtefatos(str(tmp_path / "artefatos"), **limites))
+        return armazens[-1]
+
+    armazens = []
+    yield criar
+    for armazem in armazens:
+        armazem.fechar()
+
+
+def _capturar_em_sequencia(armazem, driver, jobs):
+    caminhos = []
+    for job_id in jobs:
+        caminhos.append(armazem.capturar(driver, job_id, "configurado", erro="falha").result())
+        # O anel ordena pela data de modificação dos arquivos
+        time.sleep(0.02)
+    return caminhos
+
+
+def test_anel_apaga_os_mais_antigos_acima_da_quantidade(armazem):
+    artefatos = armazem(max_arquivos=3)
+    caminhos = _capturar_em_sequencia(artefatos, DriverFalso(), ["1", "1", "2", "3", "3"])
+
+    restantes = [c for arquivos in artefatos.listar().values() for c in arquivos]
+    assert sorted(restantes) == sorted(caminhos[2:])
+    # A pasta do job sem artefatos é removida
+    assert set(artefatos.listar()) == {"2", "3"}
+
+
+def test_anel_apaga_os_mais_antigos_acima_dos_bytes(armazem):
+    artefatos = armazem(max_bytes=50_000)
+    caminhos = _capturar_em_sequencia(artefatos, DriverFalso(tamanho_screenshot=20_000), ["1", "2", "3", "4"])
+
+    assert artefatos.listar() == {"3": [caminhos[2]], "4": [caminhos[3]]}
+
+
+def test_captura_em_segundo_plano_nao_bloqueia_quem_chama(armazem, monkeypatch):
+    artefatos = armazem()
+    liberar = threading.Event()
+    gravar = artefatos._gravar
+
+    def gravar_lento(*args):
+        liberar.wait(5)
+        return gravar(*args)
+
+    monkeypatch.setattr(artefatos, "_gravar", gravar_lento)
+    driver = DriverFalso()
+
+    inicio = time.monotonic()
+    futuro = artefatos.capturar(driver, "42", "localizado")
+    assert time.monotonic() - inicio < 1
+    assert not futuro.done()
+    # A coleta no driver acontece na thread que detectou a falha
+    assert driver.threads == [threading.current_thread().name]
+
+    liberar.set()
+    caminho = futuro.result(timeout=5)
+    assert artefatos.listar("42") == {"42": [caminho]}
+
+
+def test_falha_na_captura_ainda_grava_info(armazem):
+    artefatos = armazem()
+    caminho = artefatos.capturar(DriverFalso(erro=True), None, "salvando", erro="timeout").result()
+
+    assert os.path.basename(os.path.dirname(caminho)) == JOB_SEM_ID
+    with zipfile.ZipFile(caminho) as arquivo:
+        assert sorted(arquivo.namelist()) == ["info.json", "log.txt"]
+        info = json.loads(arquivo.read("info.json"))
+    assert info["erro"] == "timeout"
+    assert "erro_screenshot" in info and "erro_dom" in info
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from soc_automation.core.async_browser import AsyncBrowser
+from soc_automation.operations.funcionario_operations import FuncionarioOperations
+from soc_automation.operations.journal import JournalTransferencias
+
+
+class OperacoesFalsas:
+    """Transferência com uma etapa lenta; registra a thread de cada abort."""
+
+    def __init__(self, duracao_etapa: float) -> None:
+        self.duracao_etapa = duracao_etapa
+        self.abortos = []
+
+    def etapas_transferencia(self, termo_busca, **kwargs):
+        return [("localizado", lambda: time.sleep(self.duracao_etapa) or True)]
+
+    def executar_etapa(self, etapa, executar):
+        return executar()
+
+    def abortar_transferencia(self, erro, recuperar_contexto=True):
+        self.abortos.append((erro, recuperar_contexto, threading.current_thread().name))
+
+
+def test_cancelamento_registra_journal_no_executor_do_driver():
+    browser = AsyncBrowser(headless=True)
+    operacoes = OperacoesFalsas(duracao_etapa=0.3)
+    browser.browser.get_funcionario_operations = lambda **kwargs: operacoes
+
+    async def executar():
+        with pytest.raises(asyncio.TimeoutError):
+            await browser.transferir("846.872.660-59", timeout=0.05)
+        await browser.quit()
+
+    asyncio.run(executar())
+    browser._executor.shutdown(wait=True)
+
+    assert len(operacoes.abortos) == 1
+    erro, recuperar_contexto, thread = operacoes.abortos[0]
+    assert erro == "Transferência cancelada"
+    assert recuperar_contexto is False
+    assert thread.startswith("soc-driver")
+
+
+class DriverFalso:
+    """Driver encerrado: qualquer comando falha."""
+
+    window_handles = []
+
+    def execute_script(self, script, *args):
+        raise RuntimeError("sessão encerrada")
+
+
+class ArtefatosFalsos:
+    def capturar(self, *args):
+        pass
+
+
+def _operacoes_com_journal(tmp_path):
+    journal = JournalTransferencias(str(tmp_path / "lote.journal"))
+    navegador = type("BrowserFalso", (), {"driver": DriverFalso()})()
+    return FuncionarioOperations(navegador, journal=journal, artefatos=ArtefatosFalsos()), journal
+
+
+def _etapas_gravadas(journal):
+    with open(journal.caminho, encoding="utf-8") as f:
+        return [json.loads(linha)["etapa"] for linha in f]
+
+
+def test_cancelamento_durante_o_save_registra_job_incerto(tmp_path):
+    operacoes, journal = _operacoes_com_journal(tmp_path)
+    for metodo in ("_preparar_ambiente", "_localizar_funcionario", "_configurar_transferencia", "_definir_destino"):
+        setattr(operacoes, metodo, lambda *args: True)
+    # O 'save' fica pendente até o cancelamento; com o driver encerrado, termina em falha
+    operacoes._finalizar_transferencia = lambda: time.sleep(0.3) or False
+
+    browser = AsyncBrowser(headless=True)
+    browser.browser.get_funcionario_operations = lambda **kwargs: operacoes
+
+    async def executar():
+        with pytest.raises(asyncio.TimeoutError):
+            await browser.transferir("846.872.660-59", job_id="42", timeout=0.1)
+        await browser.quit()
+
+    asyncio.run(executar())
+    browser._executor.shutdown(wait=True)
+    journal.fechar()
+
+    etapas = _etapas_gravadas(journal)
+    assert etapas[:5] == ["preparado", "localizado", "configurado", "destino_definido", "salvando"]
+    assert set(etapas[5:]) == {"incerto"}
+    assert journal.estado() == {"42": "salvando"}
+
+
+def test_erro_ao_finalizar_nao_e_sucesso(tmp_path):
+    operacoes, journal = _operacoes_com_journal(tmp_path)
+
+    assert operacoes._finalizar_transferencia() is False
+    journal.fechar()
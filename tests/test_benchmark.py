@@ -0,0 +1,88 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from soc_automation.testing.benchmark import (
+    ETAPA_LOGIN,
+    _percentil,
+    comparar_com_baseline,
+    executar_benchmark,
+    resumir,
+)
+
+# Baseline da máquina de CI (gerado com: python -m soc_automation.testing.benchmark --atualizar)
+VARIAVEL_BASELINE = "SOC_BENCHMARK_BASELINE"
+
+NAVEGADORES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+
+@pytest.mark.parametrize("valores, percentil, esperado", [
+    ([5.0], 99, 5.0),
+    ([1.0, 2.0, 3.0, 4.0, 5.0], 0, 1.0),
+    ([1.0, 2.0, 3.0, 4.0, 5.0], 50, 3.0),
+    ([1.0, 2.0, 3.0, 4.0, 5.0], 100, 5.0),
+    ([10.0, 1.0, 9.0, 2.0, 8.0, 3.0, 7.0, 4.0, 6.0, 5.0], 95, 10.0),
+    ([10.0, 1.0, 9.0, 2.0, 8.0, 3.0, 7.0, 4.0, 6.0, 5.0], 10, 2.0),
+])
+def test_percentil(valores, percentil, esperado):
+    assert _percentil(valores, percentil) == esperado
+
+
+def test_resumir_ignora_etapas_sem_amostras():
+    resumo = resumir({"busca": [0.3, 0.1, 0.2], "vazia": []})
+
+    assert resumo == {"busca": {"mediana": 0.2, "p95": 0.3, "max": 0.3, "amostras": 3}}
+
+
+BASELINE = {
+    "login": {"mediana": 1.0},
+    "localizar_funcionario": {"mediana": 0.2},
+}
+
+
+def test_sem_regressao_dentro_da_tolerancia():
+    # Limites: 1.0 * 1.25 + 0.05 = 1.30 e 0.2 * 1.25 + 0.05 = 0.30
+    resultado = {"login": {"mediana": 1.30}, "localizar_funcionario": {"mediana": 0.30}, "nova": {"mediana": 9.0}}
+
+    assert comparar_com_baseline(resultado, BASELINE) == []
+
+
+def test_regressao_acima_do_limite():
+    resultado = {"login": {"mediana": 1.31}, "localizar_funcionario": {"mediana": 0.1}}
+
+    regressoes = comparar_com_baseline(resultado, BASELINE)
+
+    assert regressoes == ["login: mediana 1.310s > limite 1.300s (baseline 1.000s)"]
+
+
+def test_etapa_ausente_e_regressao():
+    regressoes = comparar_com_baseline({"login": {"mediana": 1.0}}, BASELINE)
+
+    assert regressoes == ["localizar_funcionario: ausente na execução atual"]
+
+
+def test_tolerancia_e_folga_configuraveis():
+    resultado = {"login": {"mediana": 1.5}, "localizar_funcionario": {"mediana": 0.2}}
+
+    assert comparar_com_baseline(resultado, BASELINE, tolerancia=0.5, folga_absoluta=0.0) == []
+    assert comparar_com_baseline(resultado, BASELINE, tolerancia=0.4, folga_absoluta=0.0) == [
+        "login: mediana 1.500s > limite 1.400s (baseline 1.000s)"
+    ]
+
+
+@pytest.mark.benchmark
+def test_benchmark_sem_regressao():
+    if not any(shutil.which(nome) for nome in NAVEGADORES):
+        pytest.skip("Chrome não disponível")
+    pytest.importorskip("selenium")
+
+    resultado = executar_benchmark(repeticoes=3)
+
+    assert ETAPA_LOGIN in resultado
+    caminho = os.environ.get(VARIAVEL_BASELINE)
+    if not caminho or not Path(caminho).is_file():
+        pytest.skip(f"Sem baseline ({VARIAVEL_BASELINE}); apenas a execução foi verificada")
+    assert comparar_com_baseline(resultado, json.loads(Path(caminho).read_text())) == []
@@ -0,0 +1,117 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from soc_automation.core import browser_pool
+from soc_automation.core.browser import Browser
+from soc_automation.core.browser_pool import BrowserPool, BrowserPoolError
+
+
+class DriverFalso:
+    current_url = "http://127.0.0.1/WebSoc/"
+
+    def quit(self):
+        pass
+
+
+class BrowserFalso(Browser):
+    """Browser sem Chrome: o login só registra as credenciais e a sessão fica "viva"."""
+
+    # session_id -> resultado do login (ausente = sucesso)
+    logins_falhos = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logins = 0
+        self.verificacoes = 0
+        self.vivo = False
+
+    def login(self, username, password, company_id):
+        self.logins += 1
+        self._credentials = (username, password, company_id)
+        self.driver = DriverFalso()
+        self.vivo = not self.logins_falhos.get(self.session_id, False)
+        return self.vivo
+
+    def is_session_alive(self):
+        self.verificacoes += 1
+        return self.vivo
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(browser_pool, "Browser", BrowserFalso)
+    monkeypatch.setattr(BrowserFalso, "logins_falhos", {})
+    with BrowserPool("usuario", "senha", "1001", size=2, headless=True) as pool:
+        yield pool
+
+
+def test_start_loga_uma_sessao_por_posicao(pool):
+    assert sorted(b.session_id for b in pool._browsers) == ["pool-0", "pool-1"]
+    assert all(b.logins == 1 for b in pool._browsers)
+    assert pool._available.qsize() == 2
+
+
+def test_navegador_sem_login_fica_fora_do_pool(monkeypatch):
+    monkeypatch.setattr(browser_pool, "Browser", BrowserFalso)
+    monkeypatch.setattr(BrowserFalso, "logins_falhos", {"pool-1": True})
+    with BrowserPool("usuario", "senha", "1001", size=2, headless=True) as pool:
+        assert [b.session_id for b in pool._browsers] == ["pool-0"]
+
+    monkeypatch.setattr(BrowserFalso, "logins_falhos", {"pool-0": True, "pool-1": True})
+    with pytest.raises(BrowserPoolError):
+        BrowserPool("usuario", "senha", "1001", size=2, headless=True).start()
+
+
+def test_checkout_verifica_a_sessao(pool):
+    browser = pool.checkout(timeout=1)
+
+    assert browser.verificacoes == 1
+    assert browser.logins == 1
+    pool.checkin(browser)
+
+
+def test_sessao_expirada_e_relogada_no_checkout(pool):
+    for browser in pool._browsers:
+        browser.vivo = False
+
+    browser = pool.checkout(timeout=1)
+
+    assert browser.vivo
+    assert browser.logins == 2
+    pool.checkin(browser)
+
+
+def test_sessao_que_nao_volta_e_devolvida_ao_pool(pool, monkeypatch):
+    for browser in pool._browsers:
+        browser.vivo = False
+    monkeypatch.setattr(BrowserFalso, "logins_falhos", {"pool-0": True, "pool-1": True})
+
+    with pytest.raises(BrowserPoolError, match="restabelecer"):
+        pool.checkout(timeout=1)
+    assert pool._available.qsize() == 2
+
+
+def test_session_devolve_o_navegador_ao_pool(pool):
+    with pool.session(timeout=1) as primeiro:
+        with pool.session(timeout=1) as segundo:
+            assert primeiro is not segundo
+            assert pool._available.qsize() == 0
+            with pytest.raises(BrowserPoolError, match="Nenhum navegador livre"):
+                pool.checkout(timeout=0.01)
+
+    assert pool._available.qsize() == 2
+    with pytest.raises(RuntimeError):
+        with pool.session(timeout=1):
+            raise RuntimeError("falha no job")
+    assert pool._available.qsize() == 2
+
+
+def test_checkout_apos_close_falha(pool):
+    browser = pool.checkout(timeout=1)
+    pool.close()
+
+    with pytest.raises(BrowserPoolError, match="encerrado"):
+        pool.checkout(timeout=1)
+    pool.checkin(browser)
+    assert browser.driver is None
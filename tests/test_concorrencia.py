@@ -0,0 +1,92 @@
+from soc_automation.operations.concorrencia import ControladorConcorrencia
+from soc_automation.operations.models import ResultadoJob
+
+
+def _resultado(busca=1.0, save=1.0, timeouts=0, **outras):
+    duracoes = {"resultados_busca": busca, "confirmacao_save": save}
+    duracoes.update(outras)
+    return ResultadoJob(job_id="1", sucesso=True, duracoes_etapas=duracoes, timeouts=timeouts)
+
+
+def _janela(controlador, quantidade, **kwargs):
+    for _ in range(quantidade):
+        alvo = controlador.registrar(_resultado(**kwargs))
+    return alvo
+
+
+def test_alvo_inicial_e_metade_do_maximo():
+    assert ControladorConcorrencia(8).alvo == 4
+    assert ControladorConcorrencia(5).alvo == 3
+    assert ControladorConcorrencia(8, inicial=20).alvo == 8
+
+
+def test_janela_fecha_com_ao_menos_tres_resultados_ou_um_por_worker():
+    controlador = ControladorConcorrencia(8, inicial=4)
+
+    assert _janela(controlador, 3) == 4
+    assert controlador.registrar(_resultado()) == 5
+
+    controlador = ControladorConcorrencia(8, inicial=1)
+    assert _janela(controlador, 2) == 1
+    assert controlador.registrar(_resultado()) == 2
+
+
+def test_aumento_aditivo_ate_o_maximo():
+    controlador = ControladorConcorrencia(6, inicial=4)
+
+    assert _janela(controlador, 4) == 5
+    assert _janela(controlador, 5) == 6
+    assert _janela(controlador, 6) == 6
+
+
+def test_latencia_acima_da_referencia_reduz_pela_metade():
+    controlador = ControladorConcorrencia(8, inicial=6)
+    _janela(controlador, 6, busca=1.0)
+    assert controlador.alvo == 7
+    assert controlador.referencia["resultados_busca"] == 1.0
+
+    # 1.6s > 1.0s * 1.5
+    assert _janela(controlador, 7, busca=1.6) == 3
+
+
+def test_latencia_dentro_do_fator_nao_reduz():
+    controlador = ControladorConcorrencia(8, inicial=4)
+    _janela(controlador, 4, save=2.0)
+
+    assert _janela(controlador, 5, save=2.9) == 6
+
+
+def test_reducao_tira_ao_menos_um_worker_e_respeita_o_minimo():
+    controlador = ControladorConcorrencia(4, minimo=1, inicial=1)
+    _janela(controlador, 3)
+    assert controlador.alvo == 2
+
+    # int(2 * 0.5) = 1
+    assert _janela(controlador, 3, busca=5.0) == 1
+    assert _janela(controlador, 3, busca=50.0) == 1
+
+
+def test_timeouts_acima_do_limiar_reduzem():
+    controlador = ControladorConcorrencia(8, inicial=4)
+    for timeouts in (0, 0, 0, 1):
+        controlador.registrar(_resultado(timeouts=timeouts))
+
+    # 25% dos jobs com timeout > 20%
+    assert controlador.alvo == 2
+
+
+def test_referencia_sobe_no_maximo_cinco_por_cento_por_janela():
+    controlador = ControladorConcorrencia(8, inicial=8)
+    _janela(controlador, 8, busca=1.0)
+    _janela(controlador, 8, busca=1.4)
+
+    assert controlador.referencia["resultados_busca"] == 1.05
+
+
+def test_somente_esperas_monitoradas_sao_consideradas():
+    controlador = ControladorConcorrencia(8, inicial=4)
+    _janela(controlador, 4, localizar_funcionario=1.0)
+
+    # Etapa inteira lenta (retries, backoff) sem aumento da espera pelo SOC
+    assert _janela(controlador, 5, localizar_funcionario=30.0) == 6
+    assert "localizar_funcionario" not in controlador.referencia
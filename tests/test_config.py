@@ -0,0 +1,90 @@
+import pytest
+
+from soc_automation.core.config import get_configuracao
+
+CONFIG_YAML = """
+browser:
+  headless: false
+  timeout: 10
+soc:
+  url: "https://sistema.soc.com.br/WebSoc/"
+lote:
+  workers: 2
+ambientes:
+  homologacao:
+    browser:
+      timeout: 20
+    soc:
+      url: "https://homologacao.soc.com.br/WebSoc/"
+  producao:
+    browser:
+      headless: true
+"""
+
+
+@pytest.fixture
+def configuracao(tmp_path, monkeypatch):
+    """Aponta SOC_CONFIG para um config.yaml temporário e recarrega a configuração."""
+    caminho = tmp_path / "config.yaml"
+    caminho.write_text(CONFIG_YAML, encoding="utf-8")
+    monkeypatch.setenv("SOC_CONFIG", str(caminho))
+    monkeypatch.delenv("SOC_ENV", raising=False)
+    yield lambda: get_configuracao(reload=True)
+    monkeypatch.undo()
+    get_configuracao(reload=True)
+
+
+def test_sem_ambiente_usa_arquivo(configuracao):
+    config = configuracao()
+
+    assert config.ambiente is None
+    assert config.browser.timeout == 10.0
+    assert config.browser.headless is False
+    assert config.lote.workers == 2
+
+
+def test_soc_env_aplica_secao_do_ambiente(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_ENV", "homologacao")
+    config = configuracao()
+
+    assert config.ambiente == "homologacao"
+    assert config.browser.timeout == 20.0
+    assert config.soc.url == "https://homologacao.soc.com.br/WebSoc/"
+    # Chaves não sobrescritas pelo ambiente mantêm o valor do arquivo
+    assert config.browser.headless is False
+
+
+def test_ambiente_desconhecido_emite_aviso(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_ENV", "inexistente")
+
+    with pytest.warns(UserWarning, match="inexistente"):
+        config = configuracao()
+
+    assert config.browser.timeout == 10.0
+
+
+def test_variaveis_sobrescrevem_arquivo_e_ambiente(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_ENV", "producao")
+    monkeypatch.setenv("SOC_BROWSER_HEADLESS", "false")
+    monkeypatch.setenv("SOC_BROWSER_TIMEOUT", "30")
+    monkeypatch.setenv("SOC_LOTE_WORKERS", "6")
+    monkeypatch.setenv("SOC_BROWSER_ARGUMENTOS", "[--headless=new, --no-sandbox]")
+    config = configuracao()
+
+    assert config.browser.headless is False
+    assert config.browser.timeout == 30.0
+    assert config.lote.workers == 6
+    assert config.browser.argumentos == ["--headless=new", "--no-sandbox"]
+
+
+def test_variavel_de_secao_desconhecida_e_ignorada(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_BENCHMARK_BASELINE", "baseline.json")
+
+    assert configuracao().browser.timeout == 10.0
+
+
+def test_valor_invalido_gera_erro(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_LOTE_WORKERS", "muitos")
+
+    with pytest.raises(ValueError, match="lote.workers"):
+        configuracao()
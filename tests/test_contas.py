@@ -0,0 +1,79 @@
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from soc_automation.operations.contas import Conta, RegistroContas
+from soc_automation.operations.models import Credenciais
+
+
+def _conta(nome, max_sessoes=1, empresa="1001"):
+    return Conta(Credenciais(nome, "senha", empresa), max_sessoes=max_sessoes)
+
+
+@pytest.fixture
+def registro(tmp_path):
+    return RegistroContas([_conta("ana", 2), _conta("bia", 1), _conta("caio", 3)], str(tmp_path))
+
+
+def test_capacidade_soma_os_limites_das_contas(registro):
+    assert registro.capacidade == 6
+
+
+def test_workers_sao_distribuidos_pela_ocupacao_proporcional(registro):
+    contas = [registro.reservar(worker_id)[0].nome for worker_id in range(6)]
+
+    # Empate na ocupação favorece a conta com mais sessões
+    assert contas[:3] == ["caio", "ana", "bia"]
+    assert Counter(contas) == {"ana": 2, "bia": 1, "caio": 3}
+
+
+def test_limite_de_sessoes_por_conta(registro):
+    for worker_id in range(6):
+        registro.reservar(worker_id)
+
+    assert registro.reservar(6) is None
+    assert all(registro.sessoes_ativas(conta) == conta.max_sessoes for conta in registro.contas)
+
+    registro.liberar(2)
+    conta, _ = registro.reservar(6)
+    assert conta.nome == "bia"
+    assert registro.reservar(7) is None
+
+
+def test_sessoes_da_mesma_conta_tem_perfis_distintos(registro, tmp_path):
+    perfis = {registro.reservar(worker_id)[1] for worker_id in range(6)}
+
+    assert len(perfis) == 6
+    assert str(tmp_path / "caio_1001" / "sessao_2") in perfis
+
+
+def test_reserva_em_cache_por_worker(registro):
+    conta, perfil = registro.reservar(0)
+
+    assert registro.reservar(0) == (conta, perfil)
+    assert registro.conta_do_worker(0) == conta
+    assert registro.sessoes_ativas(conta) == 1
+    assert registro.conta_do_worker(99) is None
+
+
+def test_sessao_liberada_e_reaproveitada_com_o_mesmo_perfil(registro):
+    reservas = {worker_id: registro.reservar(worker_id) for worker_id in range(6)}
+    conta, perfil = reservas[1]
+
+    registro.liberar(1)
+    # O worker substituto reutiliza o perfil (e os cookies em cache) da sessão liberada
+    assert registro.reservar(10) == (conta, perfil)
+
+
+def test_perfil_isola_conta_e_empresa(tmp_path):
+    registro = RegistroContas([_conta("ana", empresa="1001"), _conta("ana", empresa="2/02")], str(tmp_path))
+    perfis = [Path(registro.reservar(worker_id)[1]) for worker_id in range(2)]
+
+    assert [perfil.parent.name for perfil in perfis] == ["ana_1001", "ana_2_02"]
+
+
+@pytest.mark.parametrize("contas", [[], [_conta("ana", 0)]])
+def test_contas_invalidas(contas):
+    with pytest.raises(ValueError):
+        RegistroContas(contas)
@@ -0,0 +1,65 @@
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("webdriver_manager")
+
+from soc_automation.core import driver_manager
+from soc_automation.core.driver_manager import DriverManager
+
+
+@pytest.fixture
+def chamadas(tmp_path, monkeypatch):
+    """Detecção de versão e instalação falsas, contando as chamadas."""
+    chamadas = {"detectar": 0, "instalar": 0}
+    chromedriver = tmp_path / "chromedriver"
+    chromedriver.write_text("")
+
+    class OperationSystemManagerFalso:
+        def get_browser_version_from_os(self, tipo):
+            chamadas["detectar"] += 1
+            return "126.0.6478.126"
+
+    class ChromeDriverManagerFalso:
+        def install(self):
+            chamadas["instalar"] += 1
+            return str(chromedriver)
+
+    monkeypatch.delenv(driver_manager.VARIAVEL_CHROMEDRIVER, raising=False)
+    monkeypatch.setattr(driver_manager, "OperationSystemManager", OperationSystemManagerFalso)
+    monkeypatch.setattr(driver_manager, "ChromeDriverManager", ChromeDriverManagerFalso)
+    monkeypatch.setattr(DriverManager, "_driver_paths", {})
+    monkeypatch.setattr(DriverManager, "_chrome_major_version", None)
+    return chamadas
+
+
+def test_versao_do_chrome_e_detectada_uma_vez_por_processo(chamadas, tmp_path):
+    cache = str(tmp_path / "chromedriver.json")
+    caminhos = [DriverManager(cache_path=cache)._resolve_driver_path() for _ in range(3)]
+
+    assert len(set(caminhos)) == 1
+    assert chamadas == {"detectar": 1, "instalar": 1}
+    assert DriverManager._driver_paths == {"126": caminhos[0]}
+
+
+def test_caminho_em_memoria_invalido_e_resolvido_de_novo(chamadas, tmp_path):
+    cache = str(tmp_path / "chromedriver.json")
+    DriverManager(cache_path=cache)._resolve_driver_path()
+    DriverManager._driver_paths["126"] = str(tmp_path / "removido")
+    (tmp_path / "chromedriver.json").unlink()
+
+    assert DriverManager(cache_path=cache)._resolve_driver_path() == str(tmp_path / "chromedriver")
+    assert chamadas == {"detectar": 1, "instalar": 2}
+
+
+def test_falha_na_deteccao_nao_e_repetida(chamadas, monkeypatch):
+    class OperationSystemManagerComErro:
+        def get_browser_version_from_os(self, tipo):
+            chamadas["detectar"] += 1
+            raise OSError("Chrome não encontrado")
+
+    monkeypatch.setattr(driver_manager, "OperationSystemManager", OperationSystemManagerComErro)
+    gerenciador = DriverManager()
+
+    assert gerenciador._detect_chrome_major_version() == ""
+    assert gerenciador._detect_chrome_major_version() == ""
+    assert chamadas["detectar"] == 1
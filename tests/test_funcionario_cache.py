@@ -0,0 +1,82 @@
+from soc_automation.operations import funcionario_cache
+from soc_automation.operations.funcionario_cache import FuncionarioCache
+from soc_automation.operations.models import FuncionarioEncontrado
+
+
+def _funcionario(codigo, nome="Fulano"):
+    return FuncionarioEncontrado(codigo=codigo, nome=nome, selbrowse_id=codigo)
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_entrada_expira_apos_ttl(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(funcionario_cache.time, "monotonic", relogio)
+    cache = FuncionarioCache(ttl=60)
+    cache.registrar("1001", "cpf", "846.872.660-59", _funcionario("100001"))
+
+    relogio.agora += 60
+    assert cache.obter("1001", "cpf", "846.872.660-59") == _funcionario("100001")
+
+    relogio.agora += 1
+    assert cache.obter("1001", "cpf", "846.872.660-59") is None
+    assert len(cache) == 0
+    assert (cache.acertos, cache.falhas) == (1, 1)
+
+
+def test_chave_ignora_caixa_e_espacos_mas_separa_empresa():
+    cache = FuncionarioCache()
+    cache.registrar("1001", "nome", "Maria Silva", _funcionario("100001"))
+
+    assert cache.obter("1001", "nome", "  maria silva ") is not None
+    assert cache.obter("2002", "nome", "Maria Silva") is None
+
+
+def test_remove_entrada_menos_usada_quando_cheio():
+    cache = FuncionarioCache(max_entradas=2)
+    cache.registrar("1001", "codigo", "1", _funcionario("1"))
+    cache.registrar("1001", "codigo", "2", _funcionario("2"))
+    # Uso recente protege a primeira entrada
+    cache.obter("1001", "codigo", "1")
+    cache.registrar("1001", "codigo", "3", _funcionario("3"))
+
+    assert len(cache) == 2
+    assert cache.obter("1001", "codigo", "2") is None
+    assert cache.obter("1001", "codigo", "1") is not None
+    assert cache.obter("1001", "codigo", "3") is not None
+
+
+def test_ignora_funcionario_sem_selbrowse():
+    cache = FuncionarioCache()
+    cache.registrar("1001", "codigo", "1", FuncionarioEncontrado(codigo="1", nome="Fulano"))
+
+    assert len(cache) == 0
+
+
+def test_invalidar_remove_somente_a_busca():
+    cache = FuncionarioCache()
+    cache.registrar("1001", "cpf", "846.872.660-59", _funcionario("100001"))
+    cache.registrar("1001", "nome", "Fulano", _funcionario("100001"))
+
+    cache.invalidar("1001", "cpf", "846.872.660-59")
+
+    assert cache.obter("1001", "cpf", "846.872.660-59") is None
+    assert cache.obter("1001", "nome", "Fulano") is not None
+
+
+def test_invalidar_funcionario_remove_todas_as_buscas_do_codigo():
+    cache = FuncionarioCache()
+    cache.registrar("1001", "cpf", "846.872.660-59", _funcionario("100001"))
+    cache.registrar("1001", "nome", "Fulano", _funcionario("100001"))
+    cache.registrar("1001", "nome", "Beltrano", _funcionario("100002", "Beltrano"))
+
+    cache.invalidar_funcionario("100001")
+
+    assert len(cache) == 1
+    assert cache.obter("1001", "nome", "Beltrano") is not None
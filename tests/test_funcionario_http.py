@@ -0,0 +1,106 @@
+import pytest
+
+pytest.importorskip("urllib3")
+pytest.importorskip("selenium")
+
+from soc_automation.core.config import get_configuracao
+from soc_automation.operations.funcionario_http import FormularioSOC, FuncionarioHttp, SessaoHttpExpirada
+from soc_automation.operations.models import FuncionarioEncontrado
+from soc_automation.testing.mock_server import COOKIE_SESSAO
+
+
+def _formulario(servidor) -> FormularioSOC:
+    """Formulário da tela 232 do servidor simulado, como capturado por ``from_browser``."""
+    url = servidor.url + "frame/232"
+    return FormularioSOC(
+        action=url,
+        campos=[("acao", "browse"), ("codigo", ""), ("pagina", "1"),
+                ("codigoPesquisaFuncionario", "0"), ("nomeSeach", "")],
+        controles={nome: [nome, "S", "checkbox"] for nome in ("ativo", "inativo", "pendente", "afastado", "ferias")},
+        charset="utf-8",
+        url=url,
+    )
+
+
+class OperacoesFalsas:
+    """Substitui ``FuncionarioOperations`` como caminho Selenium alternativo."""
+
+    def __init__(self, resultados):
+        self.resultados = resultados
+        self.buscas = []
+        self.browser = self
+        self.sessoes_garantidas = 0
+        self.home_page = self
+
+    def buscar_funcionarios(self, termo_busca, tipo_busca="nome", filtros=None, max_paginas=None):
+        self.buscas.append((termo_busca, tipo_busca))
+        return iter(self.resultados)
+
+    def ensure_session(self):
+        self.sessoes_garantidas += 1
+        return True
+
+    def get_current_screen_info(self):
+        return "232 - Funcionários", "1001"
+
+
+def _consulta(servidor, cookies, **kwargs) -> FuncionarioHttp:
+    return FuncionarioHttp(_formulario(servidor), cookies, servidor.url, **kwargs)
+
+
+def test_busca_encontrada(servidor_soc, cookie_sessao):
+    funcionario = servidor_soc.funcionarios[0]
+
+    with _consulta(servidor_soc, cookie_sessao) as consulta:
+        resultados = list(consulta.buscar_funcionarios(funcionario.cpf, tipo_busca="cpf"))
+
+    assert resultados == [FuncionarioEncontrado(
+        codigo=funcionario.codigo, nome=funcionario.nome,
+        situacao=funcionario.situacao, selbrowse_id=funcionario.codigo,
+    )]
+    assert servidor_soc.requisicoes["busca"] == 1
+
+
+def test_busca_sem_resultados(servidor_soc, cookie_sessao):
+    with _consulta(servidor_soc, cookie_sessao) as consulta:
+        assert list(consulta.buscar_funcionarios("000.000.000-00", tipo_busca="cpf")) == []
+
+
+def test_info_da_tela(servidor_soc, cookie_sessao):
+    with _consulta(servidor_soc, cookie_sessao) as consulta:
+        assert consulta.get_current_screen_info() == ("Página Inicial", "1001")
+
+
+def test_timeout_padrao_vem_da_configuracao(servidor_soc, cookie_sessao, monkeypatch):
+    monkeypatch.setenv("SOC_BROWSER_TIMEOUT", "7")
+    get_configuracao(reload=True)
+    try:
+        with _consulta(servidor_soc, cookie_sessao) as consulta:
+            assert consulta.timeout == 7.0
+        with _consulta(servidor_soc, cookie_sessao, timeout=3) as consulta:
+            assert consulta.timeout == 3
+    finally:
+        monkeypatch.undo()
+        get_configuracao(reload=True)
+
+
+def test_sessao_expirada(servidor_soc):
+    with _consulta(servidor_soc, {COOKIE_SESSAO: "expirada"}) as consulta:
+        with pytest.raises(SessaoHttpExpirada):
+            list(consulta.buscar_funcionarios("FUNCIONARIO"))
+        with pytest.raises(SessaoHttpExpirada):
+            consulta.get_current_screen_info()
+
+
+def test_sessao_expirada_segue_pelo_selenium(servidor_soc):
+    esperado = FuncionarioEncontrado(codigo="100001", nome="FUNCIONARIO TESTE 0001", situacao="Ativo")
+    alternativo = OperacoesFalsas([esperado])
+
+    with _consulta(servidor_soc, {COOKIE_SESSAO: "expirada"}, alternativo=alternativo) as consulta:
+        resultados = list(consulta.buscar_funcionarios("FUNCIONARIO TESTE 0001"))
+        info = consulta.get_current_screen_info()
+
+    assert resultados == [esperado]
+    assert alternativo.buscas == [("FUNCIONARIO TESTE 0001", "nome")]
+    assert alternativo.sessoes_garantidas == 2
+    assert info == ("232 - Funcionários", "1001")
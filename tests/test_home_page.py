@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from soc_automation.pages.home_page import HomePage
+
+
+class DriverFalso:
+    """Driver que responde apenas à leitura de infoEmpresa."""
+
+    def __init__(self, empresa: str = "", erro: bool = False) -> None:
+        self.empresa = empresa
+        self.erro = erro
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if self.erro:
+            raise RuntimeError("driver encerrado")
+        return self.empresa
+
+
+def test_sincronizar_empresa_le_info_empresa():
+    home = HomePage(DriverFalso("1001"))
+
+    assert home.sincronizar_empresa() == "1001"
+    assert home.context.empresa_atual == "1001"
+
+
+def test_troca_para_empresa_da_sessao_e_evitada_apos_sincronizar():
+    driver = DriverFalso("1001")
+    home = HomePage(driver)
+    home.sincronizar_empresa()
+    scripts = len(driver.scripts)
+
+    assert home.ensure_company("1001") is False
+    assert len(driver.scripts) == scripts
+
+
+def test_navegador_reiniciado_comeca_sem_empresa_ate_sincronizar():
+    anterior = HomePage(DriverFalso("1001"))
+    anterior.sincronizar_empresa()
+
+    # Após restart, o driver novo tem outro SessionContext
+    novo = HomePage(DriverFalso("2002"))
+    assert novo.context.empresa_atual is None
+    assert novo.sincronizar_empresa() == "2002"
+
+
+@pytest.mark.parametrize("driver", [DriverFalso(""), DriverFalso(erro=True)])
+def test_empresa_desconhecida_fica_none(driver):
+    home = HomePage(driver)
+    home.context.empresa_atual = "1001"
+
+    assert home.sincronizar_empresa() is None
+    assert home.context.empresa_atual is None
+
+
+def test_texto_de_info_empresa_e_reduzido_ao_codigo():
+    driver = DriverFalso("143906 - EMPRESA EXEMPLO LTDA")
+    home = HomePage(driver)
+
+    assert home.sincronizar_empresa() == "143906"
+    scripts = len(driver.scripts)
+    assert home.ensure_company(" 143906 ") is False
+    assert len(driver.scripts) == scripts
@@ -0,0 +1,81 @@
+import pytest
+
+from soc_automation.utils.html_utils import codigo_empresa, ler_pagina, normalizar_empresa
+
+MARCADORES = ("proximaPagina", "doAcao('proxima')")
+
+
+def _buscar(cliente, termo, tipo="0"):
+    _, _, html = cliente.requisitar("POST", "/WebSoc/frame/232", [
+        ("acao", "browse"), ("codigoPesquisaFuncionario", tipo), ("nomeSeach", termo),
+        ("ativo", "S"), ("inativo", "S"),
+    ])
+    return ler_pagina(html, marcadores_proxima=MARCADORES)
+
+
+def test_busca_encontrada(cliente_soc, servidor_soc):
+    funcionario = servidor_soc.funcionarios[0]
+
+    pagina = _buscar(cliente_soc, funcionario.cpf, tipo="3")
+
+    assert pagina.resultados == [{
+        "codigo": funcionario.codigo,
+        "nome": funcionario.nome,
+        "situacao": funcionario.situacao,
+        "selbrowse_id": funcionario.codigo,
+    }]
+    assert pagina.proxima is None
+
+
+def test_busca_sem_resultados(cliente_soc):
+    pagina = _buscar(cliente_soc, "000.000.000-00", tipo="3")
+
+    assert pagina.resultados == []
+
+
+def test_busca_com_paginacao(cliente_soc):
+    pagina = _buscar(cliente_soc, "FUNCIONARIO TESTE")
+
+    assert len(pagina.resultados) == 20
+    assert pagina.proxima == "doAcao('proxima')"
+
+
+def test_info_da_janela_principal(cliente_soc):
+    _, _, html = cliente_soc.requisitar("GET", "/WebSoc/")
+
+    pagina = ler_pagina(html, ids_texto=("infoPrograma", "infoEmpresa"))
+
+    assert pagina.textos == {"infoPrograma": "Página Inicial", "infoEmpresa": "1001"}
+    assert "barra" in pagina.ids
+
+
+def test_sessao_expirada_retorna_pagina_de_login(cliente_sem_sessao):
+    cliente_sem_sessao.cookie = "SOCSESSION=expirada"
+    _, _, html = cliente_sem_sessao.requisitar("GET", "/WebSoc/")
+
+    pagina = ler_pagina(html)
+
+    assert {"usu", "senha"} <= pagina.ids
+    assert pagina.resultados is None
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("1001", "1001"),
+    ("  143906 ", "143906"),
+    ("143906 - EMPRESA EXEMPLO LTDA", "143906"),
+    ("143906: EMPRESA EXEMPLO LTDA", "143906"),
+    ("EMPRESA EXEMPLO LTDA (143906)", "143906"),
+    ("Empresa: 143906 - EMPRESA EXEMPLO", "143906"),
+    ("Cód. 2498 EMPRESA DESTINO", "2498"),
+    ("EMPRESA EXEMPLO LTDA", None),
+    ("", None),
+    (None, None),
+])
+def test_codigo_empresa(texto, esperado):
+    assert codigo_empresa(texto) == esperado
+
+
+def test_normalizar_empresa_mantem_valor_sem_codigo():
+    assert normalizar_empresa(" 143906 ") == "143906"
+    assert normalizar_empresa("EMPRESA  EXEMPLO") == "EMPRESA EXEMPLO"
+    assert normalizar_empresa("  ") is None
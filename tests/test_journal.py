@@ -0,0 +1,54 @@
+import pytest
+
+from soc_automation.operations.journal import (
+    ETAPA_CONFIGURADO,
+    ETAPA_FALHOU,
+    ETAPA_LOCALIZADO,
+    ETAPA_PREPARADO,
+    ETAPA_SALVANDO,
+    ETAPA_SALVO,
+    JournalTransferencias,
+)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = JournalTransferencias(str(tmp_path / "lote.journal"))
+    yield journal
+    journal.fechar()
+
+
+def _registrar(journal, job_id, *etapas):
+    for etapa in etapas:
+        journal.registrar(job_id, etapa)
+
+
+@pytest.mark.parametrize("etapas, esperado", [
+    ((ETAPA_PREPARADO, ETAPA_LOCALIZADO), ETAPA_LOCALIZADO),
+    ((ETAPA_PREPARADO, ETAPA_FALHOU), ETAPA_FALHOU),
+    ((ETAPA_SALVANDO, ETAPA_SALVO), ETAPA_SALVO),
+    # Depois do 'save' a transferência pode ter sido efetivada: falhas posteriores não a desfazem
+    ((ETAPA_SALVANDO, ETAPA_FALHOU), ETAPA_SALVANDO),
+    ((ETAPA_SALVANDO, ETAPA_SALVO, ETAPA_FALHOU), ETAPA_SALVO),
+    # Reprocessamento de um job incerto
+    ((ETAPA_SALVANDO, ETAPA_FALHOU, ETAPA_PREPARADO, ETAPA_CONFIGURADO, ETAPA_FALHOU), ETAPA_SALVANDO),
+    ((ETAPA_SALVANDO, ETAPA_FALHOU, ETAPA_PREPARADO, ETAPA_SALVANDO, ETAPA_SALVO), ETAPA_SALVO),
+])
+def test_estado_considera_o_save(journal, etapas, esperado):
+    _registrar(journal, "a", *etapas)
+
+    assert journal.estado() == {"a": esperado}
+
+
+def test_estado_separa_jobs_e_ignora_linhas_invalidas(journal, tmp_path):
+    _registrar(journal, "a", ETAPA_PREPARADO, ETAPA_SALVANDO)
+    _registrar(journal, "b", ETAPA_PREPARADO)
+    journal.fechar()
+    with open(journal.caminho, "a", encoding="utf-8") as f:
+        f.write('42\n{"job_id": "b", "etapa": "loca')
+
+    assert journal.estado() == {"a": ETAPA_SALVANDO, "b": ETAPA_PREPARADO}
+
+
+def test_estado_sem_arquivo(tmp_path):
+    assert JournalTransferencias(str(tmp_path / "inexistente.journal")).estado() == {}
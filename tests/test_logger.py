@@ -0,0 +1,50 @@
+import logging
+
+import pytest
+
+from soc_automation.core.logger import ROOT_LOGGER_NAME, setup_logger, shutdown_logging
+
+
+@pytest.fixture(autouse=True)
+def logging_reiniciado():
+    """Cada teste começa sem logging configurado; o próximo uso reconfigura pelo config.yaml."""
+    shutdown_logging()
+    yield
+    shutdown_logging()
+
+
+def test_primeira_chamada_aplica_arquivo_e_nivel(tmp_path):
+    arquivo = tmp_path / "primeiro.log"
+    logger = setup_logger("soc_automation.teste", log_file=str(arquivo), level=logging.WARNING)
+    logger.info("descartado")
+    logger.warning("gravado")
+    shutdown_logging()
+
+    assert "gravado" in arquivo.read_text(encoding="utf-8")
+    assert "descartado" not in arquivo.read_text(encoding="utf-8")
+
+
+def test_chamadas_seguintes_nao_ignoram_arquivo_e_nivel(tmp_path):
+    primeiro, segundo = tmp_path / "primeiro.log", tmp_path / "segundo.log"
+    setup_logger("soc_automation.teste", log_file=str(primeiro))
+
+    logger = setup_logger("soc_automation.teste", log_file=str(segundo), level=logging.ERROR)
+    logger.warning("descartado")
+    logger.error("no segundo arquivo")
+    shutdown_logging()
+
+    assert "no segundo arquivo" in segundo.read_text(encoding="utf-8")
+    assert "no segundo arquivo" not in primeiro.read_text(encoding="utf-8")
+    assert "descartado" not in segundo.read_text(encoding="utf-8")
+
+
+def test_somente_nivel_mantem_o_arquivo(tmp_path):
+    arquivo = tmp_path / "unico.log"
+    setup_logger("soc_automation.teste", log_file=str(arquivo), level=logging.INFO)
+
+    logger = setup_logger("soc_automation.teste", level=logging.DEBUG)
+    logger.debug("detalhe")
+    shutdown_logging()
+
+    assert logging.getLogger(ROOT_LOGGER_NAME).level == logging.DEBUG
+    assert "detalhe" in arquivo.read_text(encoding="utf-8")
@@ -0,0 +1,74 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import NoSuchElementException
+
+from soc_automation.core.config import get_configuracao
+from soc_automation.pages import login_page
+from soc_automation.pages.login_page import LoginPage
+
+
+class DriverFalso:
+    """Driver sem página carregada: nenhuma condição de espera é atingida."""
+
+    def find_element(self, *args):
+        raise NoSuchElementException("elemento ausente")
+
+    def execute_script(self, script, *args):
+        return None
+
+
+@pytest.fixture
+def configuracao(monkeypatch):
+    """Recarrega a configuração com as variáveis SOC_* definidas no teste."""
+    yield lambda: get_configuracao(reload=True)
+    monkeypatch.undo()
+    get_configuracao(reload=True)
+
+
+def test_esperas_usam_intervalo_poll_do_config(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_BROWSER_INTERVALO_POLL", "0.25")
+    configuracao()
+    pagina = LoginPage(DriverFalso())
+
+    assert pagina.wait._poll == 0.25
+    assert pagina.modal_handler.wait._poll == 0.25
+
+
+def test_confirmacao_do_login_usa_timeout_do_config(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_BROWSER_TIMEOUT_CONFIRMACAO_LOGIN", "0.2")
+    configuracao()
+    pagina = LoginPage(DriverFalso())
+    timeouts = []
+    obter_wait = pagina.context.obter_wait
+
+    def registrar_timeout(driver, timeout):
+        timeouts.append(timeout)
+        return obter_wait(driver, timeout)
+
+    monkeypatch.setattr(pagina.context, "obter_wait", registrar_timeout)
+    # Barra presente, ícones ausentes
+    monkeypatch.setattr(login_page.EC, "presence_of_element_located", lambda locator: lambda driver: locator[1] == "barra")
+
+    assert pagina.verify_login_success(timeout=0.1) is False
+    assert timeouts == [0.1, 0.2]
+
+
+def test_login_usa_tentativas_e_backoff_do_config(configuracao, monkeypatch):
+    monkeypatch.setenv("SOC_RETRY_TENTATIVAS_LOGIN", "4")
+    monkeypatch.setenv("SOC_RETRY_BASE_LOGIN", "0.3")
+    configuracao()
+    politicas = []
+
+    class PoliticaFalsa:
+        def __init__(self, **kwargs):
+            politicas.append(kwargs)
+
+        def executar(self, funcao, descricao=""):
+            return None
+
+    monkeypatch.setattr(login_page, "PoliticaRetry", PoliticaFalsa)
+
+    assert LoginPage(DriverFalso()).login("usuario", "senha", "1001") is True
+    assert politicas == [{"tentativas": 4, "base": 0.3}]
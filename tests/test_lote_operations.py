@@ -0,0 +1,178 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from soc_automation.core.metrics import get_metricas
+from soc_automation.operations import lote_operations
+from soc_automation.operations.journal import (
+    ETAPA_FALHOU,
+    ETAPA_PREPARADO,
+    ETAPA_SALVANDO,
+    ETAPA_SALVO,
+    JournalTransferencias,
+)
+from soc_automation.operations.lote_operations import _retomar_do_journal, transferir_lote
+from soc_automation.operations.models import Credenciais, ResultadoJob, TransferenciaJob
+
+CREDENCIAIS = Credenciais("usuario", "senha", "1001")
+
+# Observações suficientes para encher o pipe da fila de eventos
+SPANS_ENCERRAMENTO = 20000
+
+
+def _jobs(*ids):
+    return [TransferenciaJob(job_id=job_id, termo_busca=f"termo-{job_id}") for job_id in ids]
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    caminho = str(tmp_path / "lote.journal")
+    journal = JournalTransferencias(caminho)
+    for job_id, etapas in {
+        "a": (ETAPA_SALVANDO, ETAPA_FALHOU),
+        "b": (ETAPA_SALVANDO, ETAPA_SALVO, ETAPA_FALHOU),
+        "c": (ETAPA_PREPARADO, ETAPA_FALHOU),
+        "d": (ETAPA_SALVANDO, ETAPA_SALVO),
+    }.items():
+        for etapa in etapas:
+            journal.registrar(job_id, etapa)
+    journal.fechar()
+    return caminho
+
+
+def test_retomada_nao_reexecuta_jobs_que_passaram_pelo_save(journal_path):
+    resultados = {}
+    pendentes = _retomar_do_journal(_jobs("a", "b", "c", "d", "e"), journal_path, False, resultados)
+
+    assert [job.job_id for job in pendentes] == ["c", "e"]
+    assert resultados["b"].sucesso and resultados["b"].retomado
+    assert resultados["d"].sucesso and resultados["d"].retomado
+    assert not resultados["a"].sucesso
+    assert "pendente de verificação" in resultados["a"].erro
+
+
+def test_retomada_reprocessa_incertos_quando_pedido(journal_path):
+    resultados = {}
+    pendentes = _retomar_do_journal(_jobs("a", "b", "c"), journal_path, True, resultados)
+
+    assert [job.job_id for job in pendentes] == ["a", "c"]
+    assert set(resultados) == {"b"}
+
+
+def _worker_spans_no_encerramento(worker_id, credenciais, headless, session_store, journal_path,
+                                  disjuntor, user_data_dir, reciclagem, fila_jobs, fila_eventos):
+    """Worker falso que, ao receber None, envia um volume grande de spans antes do "fim"."""
+    while True:
+        job = fila_jobs.get()
+        if job is None:
+            break
+        fila_eventos.put(("inicio", worker_id, job.job_id))
+        fila_eventos.put(("resultado", worker_id, ResultadoJob(job.job_id, True, worker_id=worker_id)))
+    spans = [("encerramento_teste", i / SPANS_ENCERRAMENTO, {"worker": str(worker_id)}) for i in range(SPANS_ENCERRAMENTO)]
+    fila_eventos.put(("metricas", worker_id, spans))
+    fila_eventos.put(("fim", worker_id, None))
+
+
+def test_eventos_do_encerramento_sao_lidos_antes_do_join(monkeypatch):
+    monkeypatch.setattr(lote_operations, "_executar_worker", _worker_spans_no_encerramento)
+    get_metricas().limpar()
+
+    inicio = time.monotonic()
+    resultado = transferir_lote(_jobs("a", "b"), CREDENCIAIS, workers=2, headless=True, adaptativo=False)
+
+    assert resultado.sucessos == 2
+    total = sum(serie["total"] for chave, serie in get_metricas().resumo().items() if "encerramento_teste" in chave)
+    assert total == SPANS_ENCERRAMENTO * resultado.workers
+    assert time.monotonic() - inicio < lote_operations.TIMEOUT_ENCERRAMENTO
+    get_metricas().limpar()
+
+
+def _worker_falso(worker_id, credenciais, headless, session_store, journal_path,
+                  disjuntor, user_data_dir, reciclagem, fila_jobs, fila_eventos):
+    """Worker sem navegador: conclui cada job na hora; jobs "morre*" encerram o processo."""
+    while True:
+        job = fila_jobs.get()
+        if job is None:
+            break
+        fila_eventos.put(("inicio", worker_id, job.job_id))
+        if job.job_id.startswith("morre"):
+            # Garante a entrega do "inicio" antes de encerrar o processo
+            fila_eventos.close()
+            fila_eventos.join_thread()
+            os._exit(1)
+        fila_eventos.put(("metricas", worker_id, [("job_teste", 0.5, {"job": job.job_id})]))
+        fila_eventos.put(("resultado", worker_id, ResultadoJob(
+            job.job_id, True, worker_id=worker_id, empresa_final=credenciais.company_id,
+            conta=credenciais.username
+        )))
+    fila_eventos.put(("metricas", worker_id, [("encerramento_teste", 0.1, {})]))
+    fila_eventos.put(("fim", worker_id, None))
+
+
+def _worker_0_morre_ao_iniciar(worker_id, *args):
+    if worker_id == 0:
+        os._exit(1)
+    _worker_falso(worker_id, *args)
+
+
+def _worker_sem_login(worker_id, *args):
+    fila_eventos = args[-1]
+    fila_eventos.put(("fim", worker_id, "Falha no login"))
+
+
+def _total_spans(nome):
+    return sum(serie["total"] for chave, serie in get_metricas().resumo().items() if f'span="{nome}"' in chave)
+
+
+@pytest.fixture
+def executar_lote(monkeypatch):
+    """Executa transferir_lote com o worker falso informado, sem navegador."""
+    def executar(worker, jobs, workers=2):
+        monkeypatch.setattr(lote_operations, "_executar_worker", worker)
+        # Os workers falsos não usam CPU nem memória do navegador
+        monkeypatch.setattr(lote_operations, "calcular_workers", lambda total_jobs, workers: min(total_jobs, workers))
+        return transferir_lote(jobs, CREDENCIAIS, workers=workers, headless=True, adaptativo=False)
+
+    get_metricas().limpar()
+    yield executar
+    get_metricas().limpar()
+
+
+def test_despacha_todos_os_jobs_e_coleta_resultados_e_metricas(executar_lote):
+    jobs = _jobs("a", "b", "c", "d", "e")
+    resultado = executar_lote(_worker_falso, jobs)
+
+    assert [r.job_id for r in resultado.resultados] == ["a", "b", "c", "d", "e"]
+    assert resultado.sucessos == 5
+    assert resultado.workers == 2
+    assert {r.worker_id for r in resultado.resultados} <= {0, 1}
+    assert resultado.jobs_por_conta == {"usuario": 5}
+    assert _total_spans("job_teste") == 5
+    # Spans enviados pelos workers ao encerrar também são agregados
+    assert _total_spans("encerramento_teste") == 2
+
+
+def test_worker_morto_durante_o_job_falha_o_job_sem_reenvio(executar_lote):
+    resultado = executar_lote(_worker_falso, _jobs("a", "morre", "c", "d"))
+    por_job = {r.job_id: r for r in resultado.resultados}
+
+    assert not por_job["morre"].sucesso
+    assert por_job["morre"].erro == "Worker encerrado inesperadamente"
+    assert all(por_job[job_id].sucesso for job_id in ("a", "c", "d"))
+
+
+def test_job_de_worker_morto_antes_de_iniciar_vai_para_outro_worker(executar_lote):
+    resultado = executar_lote(_worker_0_morre_ao_iniciar, _jobs("a", "b", "c"))
+
+    assert resultado.sucessos == 3
+    assert {r.worker_id for r in resultado.resultados} == {1}
+
+
+def test_jobs_que_nenhum_worker_executou_falham(executar_lote):
+    resultado = executar_lote(_worker_sem_login, _jobs("a", "b", "c"))
+
+    assert resultado.falhas == 3
+    assert {r.erro for r in resultado.resultados} == {"Nenhum worker disponível"}
@@ -0,0 +1,35 @@
+import pickle
+
+from soc_automation.core.metrics import RegistroMetricas
+
+
+def test_observacoes_so_sao_guardadas_apos_iniciar_coleta():
+    registro = RegistroMetricas()
+    registro.observar("login", 1.0, resultado="ok")
+
+    assert registro.drenar() == []
+
+    registro.iniciar_coleta()
+    registro.observar("login", 2.0, resultado="ok")
+
+    assert registro.drenar() == [("login", 2.0, {"resultado": "ok"})]
+    assert registro.drenar() == []
+
+
+def test_observacoes_de_worker_sao_agregadas_no_principal():
+    worker = RegistroMetricas()
+    worker.iniciar_coleta()
+    with worker.span("localizar_funcionario"):
+        pass
+    worker.observar("finalizar_transferencia", 0.4, resultado="falha")
+
+    # Como pela fila de eventos do lote
+    observacoes = pickle.loads(pickle.dumps(worker.drenar()))
+    principal = RegistroMetricas()
+    principal.registrar_observacoes(observacoes)
+    principal.registrar_observacoes(observacoes)
+
+    resumo = principal.resumo()
+    assert resumo['{span="finalizar_transferencia",resultado="falha"}']["total"] == 2
+    assert resumo['{span="localizar_funcionario",resultado="ok"}']["total"] == 2
+    assert 'soc_span_segundos_count{span="finalizar_transferencia",resultado="falha"} 2' in principal.exportar_texto()
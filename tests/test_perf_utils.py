@@ -0,0 +1,77 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from soc_automation.core import driver_manager
+from soc_automation.operations.models import Credenciais
+from soc_automation.pages import login_page
+from soc_automation.utils import perf_utils
+
+
+class DriverFalso:
+    """Driver que devolve métricas fixas por perfil e registra as URLs visitadas."""
+
+    def __init__(self, bytes_transferidos: int, visitas: list) -> None:
+        self.bytes_transferidos = bytes_transferidos
+        self.visitas = visitas
+
+    def get(self, url):
+        self.visitas.append(url)
+
+    def execute_script(self, script, *args):
+        if script == perf_utils._SCRIPT_METRICAS:
+            return {"bytes": self.bytes_transferidos, "recursos": 3, "dom_pronto": 50.0, "load": None}
+        return True
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def visitas(monkeypatch):
+    visitas = []
+
+    class DriverManagerFalso:
+        def __init__(self, performance_profile=False):
+            self.performance_profile = performance_profile
+
+        def create_driver(self, headless=False):
+            return DriverFalso(400 if self.performance_profile else 1000, visitas)
+
+    class LoginPageFalsa:
+        def __init__(self, driver):
+            self.driver = driver
+
+        def login(self, username, password, company_id):
+            self.driver.visitas.append(f"login:{username}")
+            return True
+
+    monkeypatch.setattr(driver_manager, "DriverManager", DriverManagerFalso)
+    monkeypatch.setattr(login_page, "LoginPage", LoginPageFalsa)
+    return visitas
+
+
+def test_mede_login_e_paginas_da_sessao(visitas):
+    resultado = perf_utils.comparar_perfis(
+        "http://127.0.0.1:8080/WebSoc/", perf_utils.PAGINAS_SIMULADO,
+        Credenciais("perf", "perf", "1001"), headless=True, repeticoes=1
+    )
+
+    assert set(resultado) == {"padrao", "desempenho"}
+    assert list(resultado["padrao"]) == ["login", "principal", "frame/232"]
+    assert resultado["padrao"]["frame/232"].bytes_transferidos == 1000
+    assert resultado["desempenho"]["frame/232"].bytes_transferidos == 400
+    assert visitas[:4] == [
+        "http://127.0.0.1:8080/WebSoc/",
+        "login:perf",
+        "http://127.0.0.1:8080/WebSoc/",
+        "http://127.0.0.1:8080/WebSoc/frame/232",
+    ]
+
+
+def test_sem_credenciais_mede_somente_o_login_na_url_da_configuracao(visitas):
+    resultado = perf_utils.comparar_perfis(headless=True, repeticoes=2)
+
+    assert list(resultado["desempenho"]) == ["login"]
+    url = perf_utils.get_configuracao().soc.url
+    assert visitas == [url] * 4
@@ -0,0 +1,47 @@
+import socket
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import (  # noqa: E402
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    UnexpectedAlertPresentException,
+    WebDriverException,
+)
+
+from soc_automation.core.retry import (  # noqa: E402
+    DETERMINISTICO,
+    TRANSITORIO,
+    ErroDeterministico,
+    ErroTransitorio,
+    classificar_erro,
+)
+
+
+@pytest.mark.parametrize("erro, esperado", [
+    # Tipos do Selenium são transitórios mesmo com "not found" na mensagem
+    (WebDriverException("web view not found"), TRANSITORIO),
+    (NoSuchElementException("element not found"), TRANSITORIO),
+    (NoSuchWindowException("no such window: target window already closed"), TRANSITORIO),
+    (StaleElementReferenceException("stale element reference"), TRANSITORIO),
+    (TimeoutException("Funcionário não encontrado"), TRANSITORIO),
+    (ConnectionResetError("Connection reset by peer"), TRANSITORIO),
+    (socket.timeout("timed out"), TRANSITORIO),
+    (ErroTransitorio("barra do sistema não apareceu"), TRANSITORIO),
+    (OSError("Broken pipe"), TRANSITORIO),
+    # Mensagens do SOC
+    (UnexpectedAlertPresentException(alert_text="Senha incorreta"), DETERMINISTICO),
+    (UnexpectedAlertPresentException(alert_text="Confirma a transferência?"), TRANSITORIO),
+    (ErroDeterministico("Usuário bloqueado"), DETERMINISTICO),
+    (RuntimeError("Funcionário não encontrado"), DETERMINISTICO),
+    (RuntimeError("Acesso negado à empresa 1001"), DETERMINISTICO),
+    # Erros de programação
+    (ValueError("valor inválido"), DETERMINISTICO),
+    (KeyError("codigo"), DETERMINISTICO),
+])
+def test_classificar_erro(erro, esperado):
+    assert classificar_erro(erro) == esperado
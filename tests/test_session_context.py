@@ -0,0 +1,132 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from soc_automation.core.browser import Browser
+from soc_automation.core.session_context import FRAME_PRINCIPAL, FRAME_SOC, get_session_context
+from soc_automation.pages.base_page import BasePage
+
+
+class SwitchToFalso:
+    def __init__(self, comandos: list) -> None:
+        self.comandos = comandos
+
+    def default_content(self):
+        self.comandos.append("default_content")
+
+    def frame(self, referencia):
+        self.comandos.append(f"frame:{referencia}")
+
+    def window(self, handle):
+        self.comandos.append(f"window:{handle}")
+
+
+class DriverFalso:
+    """Registra as trocas de frame/janela que chegam ao driver."""
+
+    def __init__(self) -> None:
+        self.comandos = []
+        self.switch_to = SwitchToFalso(self.comandos)
+        # Resposta do observador de modais: novo documento desde a última drenagem
+        self.documento_novo = False
+
+    @property
+    def current_window_handle(self):
+        self.comandos.append("current_window_handle")
+        return "principal"
+
+    def get(self, url):
+        self.comandos.append(f"get:{url}")
+
+    def execute_script(self, script, *args):
+        return {"novo": self.documento_novo, "eventos": []}
+
+
+@pytest.fixture
+def pagina():
+    return BasePage(DriverFalso(), timeout=1)
+
+
+def test_paginas_do_mesmo_driver_compartilham_o_contexto(pagina):
+    outra = BasePage(pagina.driver, timeout=1)
+
+    assert outra.context is pagina.context
+    assert get_session_context(DriverFalso()) is not pagina.context
+
+
+def test_troca_para_frame_atual_nao_chega_ao_driver(pagina):
+    pagina.switch_to_soc_frame()
+    pagina.switch_to_soc_frame()
+    assert pagina.driver.comandos == ["default_content", "frame:socframe"]
+
+    pagina.switch_to_default_frame()
+    pagina.switch_to_default_frame()
+    assert pagina.driver.comandos[2:] == ["default_content"]
+    assert pagina.context.frame_atual == FRAME_PRINCIPAL
+
+
+def test_navegacao_do_browser_descarta_o_frame(pagina):
+    pagina.switch_to_soc_frame()
+    assert pagina.context.frame_atual == FRAME_SOC
+    browser = Browser(headless=True)
+    browser.driver = pagina.driver
+
+    browser.navigate_to("http://127.0.0.1/WebSoc/")
+
+    assert pagina.context.frame_atual is None
+    pagina.driver.comandos.clear()
+    pagina.switch_to_soc_frame()
+    assert pagina.driver.comandos == ["default_content", "frame:socframe"]
+
+
+def test_navegacao_detectada_pelo_observador_descarta_o_frame(pagina):
+    pagina.switch_to_soc_frame()
+    pagina.driver.documento_novo = True
+    pagina.modal_handler.observer.drain()
+
+    assert pagina.context.frame_atual is None
+    pagina.driver.comandos.clear()
+    pagina.switch_to_soc_frame()
+    assert pagina.driver.comandos == ["default_content", "frame:socframe"]
+
+
+def test_troca_de_janela_volta_ao_documento_principal(pagina):
+    pagina.switch_to_soc_frame()
+    pagina.switch_to_window("popup")
+
+    assert pagina.context.janela_atual == "popup"
+    assert pagina.context.frame_atual == FRAME_PRINCIPAL
+    pagina.driver.comandos.clear()
+    pagina.switch_to_default_frame()
+    assert pagina.current_window() == "popup"
+    assert pagina.driver.comandos == []
+
+
+def test_janela_desconhecida_e_consultada_uma_vez(pagina):
+    assert pagina.current_window() == "principal"
+    assert pagina.current_window() == "principal"
+    assert pagina.driver.comandos == ["current_window_handle"]
+
+    pagina.context.invalidar_janela()
+    assert pagina.context.frame_atual is None
+    assert pagina.current_window() == "principal"
+    assert pagina.driver.comandos.count("current_window_handle") == 2
+
+
+def test_reset_descarta_o_estado_da_sessao(pagina):
+    contexto = pagina.context
+    pagina.switch_to_soc_frame()
+    contexto.empresa_atual = "1001"
+    contexto.indice_telas = {"232": "abrir(232)"}
+    contexto.indice_telas_empresa = "1001"
+
+    contexto.reset()
+
+    assert contexto.frame_atual is None and contexto.janela_atual is None
+    assert contexto.empresa_atual is None
+    assert contexto.indice_telas is None and contexto.indice_telas_empresa is None
+
+
+def test_waits_sao_reutilizados_por_timeout(pagina):
+    assert pagina.context.obter_wait(pagina.driver, 1) is pagina.wait
+    assert pagina.context.obter_wait(pagina.driver, 3) is not pagina.wait
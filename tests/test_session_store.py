@@ -0,0 +1,74 @@
+import pytest
+
+pytest.importorskip("cryptography")
+from cryptography.fernet import Fernet
+
+from soc_automation.core.session_store import SessionStore
+
+
+class DriverFalso:
+    """Driver mínimo para ``SessionStore.save``/``restore``."""
+
+    def __init__(self, cookie: str) -> None:
+        self.cookies = [{"name": "JSESSIONID", "value": cookie}]
+
+    def execute_script(self, script, *args):
+        return {"url": "https://soc.local/WebSoc/", "local": {}, "session": {}}
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path), key=Fernet.generate_key())
+
+
+def test_workers_da_mesma_conta_usam_arquivos_distintos(store):
+    store.save(DriverFalso("sessao-worker-0"), "servico", "1001", "worker-0")
+    store.save(DriverFalso("sessao-worker-1"), "servico", "1001", "worker-1")
+
+    caminho_0 = store._session_path("servico", "1001", "worker-0")
+    caminho_1 = store._session_path("servico", "1001", "worker-1")
+    assert caminho_0 != caminho_1
+    assert caminho_0.exists() and caminho_1.exists()
+
+    assert store.load("servico", "1001", "worker-0")["cookies"][0]["value"] == "sessao-worker-0"
+    assert store.load("servico", "1001", "worker-1")["cookies"][0]["value"] == "sessao-worker-1"
+
+
+def test_sessao_sem_identificador_nao_e_restaurada_por_worker(store):
+    store.save(DriverFalso("sessao-compartilhada"), "servico", "1001")
+
+    assert store.load("servico", "1001", "worker-0") is None
+    assert store.load("servico", "1001")["cookies"][0]["value"] == "sessao-compartilhada"
+
+
+def test_delete_remove_apenas_a_sessao_do_worker(store):
+    store.save(DriverFalso("a"), "servico", "1001", "worker-0")
+    store.save(DriverFalso("b"), "servico", "1001", "worker-1")
+
+    store.delete("servico", "1001", "worker-0")
+
+    assert store.load("servico", "1001", "worker-0") is None
+    assert store.load("servico", "1001", "worker-1") is not None
+
+
+def test_chave_criada_em_paralelo_e_unica(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    def criar(_):
+        return SessionStore(str(tmp_path))._load_or_create_key()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        chaves = set(executor.map(criar, range(16)))
+
+    assert chaves == {(tmp_path / "session.key").read_bytes().strip()}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_chave_existente_e_reutilizada(tmp_path):
+    chave = Fernet.generate_key()
+    (tmp_path / "session.key").write_bytes(chave + b"\n")
+
+    assert SessionStore(str(tmp_path))._load_or_create_key() == chave